@@ -4,7 +4,9 @@ from pathlib import Path
 
 from flask import Flask
 from .inhouse_service import bp as inhouse_bp
-from .db import init_db
+from .commands import register_commands
+from .db import init_db, release_connection
+from .speech import preload_from_env
 
 
 def _load_env_file(path: Path) -> None:
@@ -39,7 +41,14 @@ def create_app():
 
     init_db()
 
+    # 설정하면 요청을 받기 전에(포크 전이면 워커 공유용으로) Whisper 모델을 올리고 워밍업한다
+    preload_from_env()
+
+    # 요청이 끝나면 스레드가 잡고 있던 DB 커넥션을 풀에 돌려준다
+    app.teardown_appcontext(lambda exc: release_connection())
+
     # ?쇱슦???깅줉
     app.register_blueprint(inhouse_bp)
+    register_commands(app)
 
     return app
@@ -0,0 +1,148 @@
+# 운영용 flask CLI 명령 모음 (예: flask --app run ticket-counters --rebuild)
+
+import time
+
+import click
+
+from . import speech
+from .db import (
+    clear_summary_cache,
+    clear_transcript_cache,
+    compress_meeting_logs,
+    database_size_report,
+    summary_cache_stats,
+    transcript_cache_stats,
+    vacuum_database,
+    verify_room_occupancy,
+    verify_ticket_counters,
+)
+from .jobs import JobWorkerPool, run_one
+
+
+@click.command("ticket-counters")
+@click.option("--rebuild", is_flag=True, help="어긋난 카운터를 원본 테이블 기준으로 다시 계산한다.")
+def ticket_counters_command(rebuild):
+    """서비스 데스크 요약 카운터를 검증(및 재계산)한다."""
+    drift = verify_ticket_counters(rebuild=rebuild)
+    if not drift:
+        click.echo("ticket counters OK")
+        return
+
+    for item in drift:
+        click.echo(
+            f"drift {item['category']}/{item['status']}: stored={item['stored']} expected={item['expected']}"
+        )
+    if rebuild:
+        click.echo(f"rebuilt ticket counters ({len(drift)} drifted)")
+    else:
+        raise SystemExit(1)
+
+
+@click.command("room-occupancy")
+@click.option("--rebuild", is_flag=True, help="bookings 테이블 기준으로 점유 비트맵을 다시 만든다.")
+def room_occupancy_command(rebuild):
+    """회의실 점유 비트맵을 검증(및 재생성)한다."""
+    drift = verify_room_occupancy(rebuild=rebuild)
+    if not drift:
+        click.echo("room occupancy OK")
+        return
+
+    for item in drift[:20]:
+        click.echo(f"drift {item['date']} room={item['room_id']}")
+    if len(drift) > 20:
+        click.echo(f"... and {len(drift) - 20} more")
+    if rebuild:
+        click.echo(f"rebuilt room occupancy ({len(drift)} drifted)")
+    else:
+        raise SystemExit(1)
+
+
+def _format_size(value):
+    return f"{value / 1024 / 1024:.2f} MiB"
+
+
+@click.command("compress-meeting-logs")
+@click.option("--vacuum", is_flag=True, help="압축 후 VACUUM으로 파일 크기까지 줄인다.")
+def compress_meeting_logs_command(vacuum):
+    """회의록 본문(notes/transcript/summary)을 압축 저장 형식으로 바꾸고 DB 크기를 보고한다."""
+    before = database_size_report()
+    stats = compress_meeting_logs()
+    if vacuum:
+        vacuum_database()
+    after = database_size_report()
+
+    click.echo(
+        f"compressed {stats['rows']} meeting log(s): "
+        f"{_format_size(stats['bytes_before'])} -> {_format_size(stats['bytes_after'])}"
+    )
+    for label, key in (
+        ("file", "file_bytes"),
+        ("free pages", "free_bytes"),
+        ("meeting log content", "meeting_log_content_bytes"),
+    ):
+        click.echo(f"{label:>20}: {_format_size(before[key])} -> {_format_size(after[key])}")
+    if not vacuum and after["free_bytes"]:
+        click.echo("run again with --vacuum to return free pages to the filesystem")
+
+
+@click.command("transcript-cache")
+@click.option("--clear", is_flag=True, help="캐시된 전사 결과를 모두 지운다.")
+def transcript_cache_command(clear):
+    """오디오 해시 기반 전사 캐시의 항목 수/크기/적중 횟수를 보여준다."""
+    if clear:
+        click.echo(f"removed {clear_transcript_cache()} cached transcript(s)")
+    stats = transcript_cache_stats()
+    click.echo(
+        f"{stats['entries']} transcript(s), {_format_size(stats['bytes'])} / {_format_size(stats['max_bytes'])}, "
+        f"{stats['hits']} hit(s)"
+    )
+
+
+@click.command("summary-cache")
+@click.option("--clear", is_flag=True, help="캐시된 요약 결과를 모두 지운다.")
+def summary_cache_command(clear):
+    """회의 텍스트 해시 기반 요약 캐시의 항목 수/크기/적중 횟수를 보여준다."""
+    if clear:
+        click.echo(f"removed {clear_summary_cache()} cached summary(ies)")
+    stats = summary_cache_stats()
+    click.echo(
+        f"{stats['entries']} summary(ies) ({stats['expired']} expired), "
+        f"{_format_size(stats['bytes'])} / {_format_size(stats['max_bytes'])}, {stats['hits']} hit(s)"
+    )
+
+
+@click.command("jobs-worker")
+@click.option("--concurrency", default=2, show_default=True, help="이 프로세스에서 돌릴 워커 스레드 수")
+@click.option("--kind", "kinds", multiple=True, help="처리할 작업 종류(여러 번 지정 가능). 없으면 전부")
+@click.option("--once", is_flag=True, help="대기 중인 작업을 모두 처리하면 종료한다.")
+def jobs_worker_command(concurrency, kinds, once):
+    """전사/요약 작업 큐를 처리하는 워커. 여러 프로세스를 동시에 띄워도 된다.
+
+    INHOUSE_TRANSCRIBE_WORKERS가 2 이상이면 긴 녹음을 그 수만큼의 프로세스로 나눠 전사한다.
+    프로세스마다 Whisper 모델을 따로 올리므로 그만큼 메모리가 더 든다.
+    """
+    speech.enable_chunk_pool()
+    if once:
+        processed = 0
+        while run_one(kinds=list(kinds) or None):
+            processed += 1
+        click.echo(f"processed {processed} job(s)")
+        return
+
+    pool = JobWorkerPool(size=concurrency, kinds=list(kinds) or None).start()
+    click.echo(f"job worker started ({concurrency} thread(s))")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        click.echo("stopping job worker")
+        pool.stop(timeout=30)
+
+
+def register_commands(app):
+    app.cli.add_command(ticket_counters_command)
+    app.cli.add_command(room_occupancy_command)
+    app.cli.add_command(compress_meeting_logs_command)
+    app.cli.add_command(transcript_cache_command)
+    app.cli.add_command(summary_cache_command)
+    app.cli.add_command(jobs_worker_command)
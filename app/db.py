@@ -1,10 +1,42 @@
-﻿import os
+﻿import base64
+import html
+import json
+import os
+import random
+import socket
 import sqlite3
-from datetime import datetime, timedelta
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 DB_PATH = os.path.join(BASE_DIR, "instance", "service_desk.db")
 
+DB_POOL_SIZE = int(os.environ.get("INHOUSE_DB_POOL_SIZE", "16"))
+DB_POOL_TIMEOUT = float(os.environ.get("INHOUSE_DB_POOL_TIMEOUT", "10"))
+DB_BUSY_TIMEOUT_MS = 5000
+DB_MMAP_SIZE = 256 * 1024 * 1024
+DB_CACHE_SIZE_KB = 16 * 1024
+
+BOOKING_INTERVAL_INDEX_ENABLED = os.environ.get("INHOUSE_BOOKING_INTERVAL_INDEX", "1") != "0"
+BOOKING_INTERVAL_INDEX_TTL = float(os.environ.get("INHOUSE_BOOKING_INTERVAL_INDEX_TTL", "300"))
+
+MEETING_LOG_COMPRESSION_ENABLED = os.environ.get("INHOUSE_COMPRESS_MEETING_LOGS", "1") != "0"
+MEETING_LOG_COMPRESS_MIN_BYTES = 512
+MEETING_LOG_COMPRESS_LEVEL = 6
+
+JOB_LEASE_SECONDS = float(os.environ.get("INHOUSE_JOB_LEASE_SECONDS", "120"))
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_BASE_SECONDS = 5.0
+JOB_RETRY_MAX_SECONDS = 300.0
+
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.environ.get("INHOUSE_TRANSCRIPT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+SUMMARY_CACHE_MAX_BYTES = int(os.environ.get("INHOUSE_SUMMARY_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+SUMMARY_CACHE_TTL_SECONDS = float(os.environ.get("INHOUSE_SUMMARY_CACHE_TTL", str(30 * 24 * 3600)))
+
 CATEGORY_TO_TEAM = {
     "IT": "보안팀",
     "PURCHASE": "경영지원팀",
@@ -21,104 +53,653 @@ def _now_iso():
     return datetime.now().isoformat(timespec="seconds")
 
 
+class _ThreadConnection:
+    # 스레드 로컬에 보관되는 홀더. 스레드가 끝나면 커넥션을 풀에 반납한다.
+    def __init__(self, pool, conn):
+        self.pool = pool
+        self.conn = conn
+
+    def release(self):
+        conn, self.conn = self.conn, None
+        if conn is not None:
+            self.pool._release(conn)
+
+    def __del__(self):
+        try:
+            self.release()
+        except Exception:
+            pass
+
+
+class ConnectionPool:
+    def __init__(self, path, max_size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT):
+        self.path = path
+        self.pid = os.getpid()
+        self.max_size = max(1, max_size)
+        self.timeout = timeout
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._idle: list[sqlite3.Connection] = []
+        self._size = 0
+        self._closed = False
+        self._checkouts = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _open(self) -> sqlite3.Connection:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=DB_BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}")
+        conn.execute(f"PRAGMA mmap_size={DB_MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size=-{DB_CACHE_SIZE_KB}")
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        holder = getattr(self._local, "holder", None)
+        if holder is not None and holder.conn is not None:
+            return holder.conn
+
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        conn = None
+        with self._cond:
+            while not self._idle and self._size >= self.max_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    if self._idle or self._size < self.max_size:
+                        break
+                    raise sqlite3.OperationalError(
+                        f"connection pool exhausted ({self.max_size} connections, waited {self.timeout}s)"
+                    )
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                self._size += 1
+
+        if conn is None:
+            try:
+                conn = self._open()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+
+        waited = time.perf_counter() - started
+        with self._cond:
+            self._checkouts += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+        self._local.holder = _ThreadConnection(self, conn)
+        return conn
+
+    def release(self) -> None:
+        holder = self._local.__dict__.pop("holder", None)
+        if holder is not None:
+            holder.release()
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._cond:
+            if self._closed:
+                self._size -= 1
+                conn.close()
+                return
+            self._idle.append(conn)
+            self._cond.notify()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+        for conn in idle:
+            conn.close()
+        self.release()
+
+    def stats(self) -> dict:
+        with self._cond:
+            checkouts = self._checkouts
+            return {
+                "path": self.path,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "max_size": self.max_size,
+                "checkouts": checkouts,
+                "wait_ms_total": round(self._wait_total * 1000, 3),
+                "wait_ms_avg": round(self._wait_total * 1000 / checkouts, 3) if checkouts else 0.0,
+                "wait_ms_max": round(self._wait_max * 1000, 3),
+            }
+
+
+_POOL: ConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _POOL
+    pool = _POOL
+    # DB_PATH가 바뀌었거나 fork된 자식 프로세스라면 새 풀을 만든다
+    if pool is None or pool.path != DB_PATH or pool.pid != os.getpid():
+        with _POOL_LOCK:
+            if _POOL is None or _POOL.path != DB_PATH or _POOL.pid != os.getpid():
+                if _POOL is not None and _POOL.pid == os.getpid():
+                    _POOL.close()
+                _POOL = ConnectionPool(DB_PATH)
+            pool = _POOL
+    return pool
+
+
 def get_connection():
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return get_pool().connection()
+
+
+def release_connection() -> None:
+    get_pool().release()
+
+
+def connection_pool_stats() -> dict:
+    return get_pool().stats()
 
 
 def init_db():
     with get_connection() as conn:
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS service_desk_tickets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category TEXT NOT NULL,
-                owner_team TEXT NOT NULL,
-                title TEXT NOT NULL,
-                description TEXT,
-                requester TEXT NOT NULL,
-                requester_user_id TEXT,
-                status TEXT NOT NULL,
-                urgency TEXT NOT NULL,
-                attachment_name TEXT,
-                attachment_path TEXT,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL
-            )
-            """
-        )
-        columns = [row["name"] for row in conn.execute("PRAGMA table_info(service_desk_tickets)").fetchall()]
-        if "attachment_name" not in columns:
-            conn.execute("ALTER TABLE service_desk_tickets ADD COLUMN attachment_name TEXT")
-        if "requester_user_id" not in columns:
-            conn.execute("ALTER TABLE service_desk_tickets ADD COLUMN requester_user_id TEXT")
+        return _apply_migrations(conn)
+
+
+def _apply_migrations(conn: sqlite3.Connection) -> int:
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return version
+
+    # 여러 워커가 동시에 부팅해도 한 프로세스만 마이그레이션을 수행한다
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, step in MIGRATIONS:
+            if number <= version:
+                continue
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {int(number)}")
+            version = number
         conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return version
 
-        _backfill_service_desk_requesters(conn)
-        conn.commit()
 
-        count = conn.execute("SELECT COUNT(*) FROM service_desk_tickets").fetchone()[0]
-        if count == 0:
-            seed_tickets(conn)
+def _migrate_v1_baseline(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS service_desk_tickets (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT NOT NULL,
+            owner_team TEXT NOT NULL,
+            title TEXT NOT NULL,
+            description TEXT,
+            requester TEXT NOT NULL,
+            requester_user_id TEXT,
+            status TEXT NOT NULL,
+            urgency TEXT NOT NULL,
+            attachment_name TEXT,
+            attachment_path TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(service_desk_tickets)").fetchall()]
+    if "attachment_name" not in columns:
+        conn.execute("ALTER TABLE service_desk_tickets ADD COLUMN attachment_name TEXT")
+    if "requester_user_id" not in columns:
+        conn.execute("ALTER TABLE service_desk_tickets ADD COLUMN requester_user_id TEXT")
 
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS rooms (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                feature TEXT NOT NULL,
-                recommended_use TEXT NOT NULL,
-                capacity INTEGER,
-                room_type TEXT NOT NULL
-            )
-            """
+    _backfill_service_desk_requesters(conn)
+
+    count = conn.execute("SELECT COUNT(*) FROM service_desk_tickets").fetchone()[0]
+    if count == 0:
+        seed_tickets(conn)
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS rooms (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            feature TEXT NOT NULL,
+            recommended_use TEXT NOT NULL,
+            capacity INTEGER,
+            room_type TEXT NOT NULL
         )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS bookings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                room_id INTEGER NOT NULL,
-                date TEXT NOT NULL,
-                start_time TEXT NOT NULL,
-                end_time TEXT NOT NULL,
-                agenda TEXT NOT NULL,
-                presenter TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                FOREIGN KEY(room_id) REFERENCES rooms(id)
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS bookings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            room_id INTEGER NOT NULL,
+            date TEXT NOT NULL,
+            start_time TEXT NOT NULL,
+            end_time TEXT NOT NULL,
+            agenda TEXT NOT NULL,
+            presenter TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            FOREIGN KEY(room_id) REFERENCES rooms(id)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS meeting_participants (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            booking_id INTEGER NOT NULL,
+            participant_name TEXT NOT NULL,
+            FOREIGN KEY(booking_id) REFERENCES bookings(id)
+        )
+        """
+    )
+    _ensure_meeting_logs_schema(conn)
+
+    room_count = conn.execute("SELECT COUNT(*) FROM rooms").fetchone()[0]
+    if room_count == 0:
+        seed_rooms(conn)
+
+    _ensure_idea_hub_schema(conn)
+    _backfill_idea_authors(conn)
+
+    idea_count = conn.execute("SELECT COUNT(*) FROM ideas").fetchone()[0]
+    if idea_count == 0:
+        seed_ideas(conn)
+
+    _ensure_club_schema(conn)
+
+
+def _migrate_v2_query_indexes(conn: sqlite3.Connection) -> None:
+    statements = [
+        # service desk: 필터(category/status) + created_at 정렬, 요약 GROUP BY는 커버링
+        "CREATE INDEX IF NOT EXISTS idx_tickets_created_at ON service_desk_tickets (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_category_created ON service_desk_tickets (category, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_status_created ON service_desk_tickets (status, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_category_status_created "
+        "ON service_desk_tickets (category, status, created_at)",
+        # nota space
+        "CREATE INDEX IF NOT EXISTS idx_rooms_name ON rooms (name)",
+        "CREATE INDEX IF NOT EXISTS idx_bookings_date_start ON bookings (date, start_time)",
+        "CREATE INDEX IF NOT EXISTS idx_bookings_room_date_span ON bookings (room_id, date, start_time, end_time)",
+        "CREATE INDEX IF NOT EXISTS idx_participants_booking "
+        "ON meeting_participants (booking_id, participant_name)",
+        # idea hub
+        "CREATE INDEX IF NOT EXISTS idx_ideas_created_at ON ideas (created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_ideas_status_created ON ideas (status, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_idea_timeline_idea_created ON idea_timeline (idea_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_idea_comments_idea_created ON idea_comments (idea_id, created_at)",
+        "CREATE INDEX IF NOT EXISTS idx_idea_comments_idea_rating ON idea_comments (idea_id, rating)",
+        # clubs
+        "CREATE INDEX IF NOT EXISTS idx_club_categories_order ON club_categories (sort_order, name)",
+    ]
+    for statement in statements:
+        conn.execute(statement)
+
+
+def _fts5_trigram_available(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _migrate_v3_ticket_search(conn: sqlite3.Connection) -> None:
+    # SQLite 빌드에 FTS5/trigram이 없으면 fetch_tickets가 LIKE 검색으로 동작한다
+    if not _fts5_trigram_available(conn):
+        return
+
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS service_desk_tickets_fts USING fts5(
+            title,
+            description,
+            requester,
+            content='service_desk_tickets',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS service_desk_tickets_fts_ai
+        AFTER INSERT ON service_desk_tickets
+        BEGIN
+            INSERT INTO service_desk_tickets_fts (rowid, title, description, requester)
+            VALUES (new.id, new.title, new.description, new.requester);
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS service_desk_tickets_fts_ad
+        AFTER DELETE ON service_desk_tickets
+        BEGIN
+            INSERT INTO service_desk_tickets_fts (service_desk_tickets_fts, rowid, title, description, requester)
+            VALUES ('delete', old.id, old.title, old.description, old.requester);
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS service_desk_tickets_fts_au
+        AFTER UPDATE OF title, description, requester ON service_desk_tickets
+        BEGIN
+            INSERT INTO service_desk_tickets_fts (service_desk_tickets_fts, rowid, title, description, requester)
+            VALUES ('delete', old.id, old.title, old.description, old.requester);
+            INSERT INTO service_desk_tickets_fts (rowid, title, description, requester)
+            VALUES (new.id, new.title, new.description, new.requester);
+        END
+        """
+    )
+    conn.execute("INSERT INTO service_desk_tickets_fts (service_desk_tickets_fts) VALUES ('rebuild')")
+
+
+def _migrate_v4_ticket_counters(conn: sqlite3.Connection) -> None:
+    # fetch_summary용 (category, status)별 건수. 트리거가 같은 트랜잭션 안에서 갱신한다
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS service_desk_ticket_counts (
+            category TEXT NOT NULL,
+            status TEXT NOT NULL,
+            count INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (category, status)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS service_desk_ticket_counts_ai
+        AFTER INSERT ON service_desk_tickets
+        BEGIN
+            INSERT INTO service_desk_ticket_counts (category, status, count)
+            VALUES (new.category, new.status, 1)
+            ON CONFLICT (category, status) DO UPDATE SET count = count + 1;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS service_desk_ticket_counts_ad
+        AFTER DELETE ON service_desk_tickets
+        BEGIN
+            UPDATE service_desk_ticket_counts
+            SET count = count - 1
+            WHERE category = old.category AND status = old.status;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS service_desk_ticket_counts_au
+        AFTER UPDATE OF category, status ON service_desk_tickets
+        WHEN old.category IS NOT new.category OR old.status IS NOT new.status
+        BEGIN
+            UPDATE service_desk_ticket_counts
+            SET count = count - 1
+            WHERE category = old.category AND status = old.status;
+            INSERT INTO service_desk_ticket_counts (category, status, count)
+            VALUES (new.category, new.status, 1)
+            ON CONFLICT (category, status) DO UPDATE SET count = count + 1;
+        END
+        """
+    )
+    _rebuild_ticket_counters(conn)
+
+
+def _migrate_v5_idea_aggregates(conn: sqlite3.Connection) -> None:
+    # 추천 수/별점 집계를 ideas 행에 두고 트리거로 같은 트랜잭션 안에서 갱신한다
+    idea_columns = [row["name"] for row in conn.execute("PRAGMA table_info(ideas)").fetchall()]
+    for column in ("upvote_count", "rating_sum", "rating_count"):
+        if column not in idea_columns:
+            conn.execute(f"ALTER TABLE ideas ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS idea_upvotes_count_ai
+        AFTER INSERT ON idea_upvotes
+        BEGIN
+            UPDATE ideas SET upvote_count = upvote_count + 1 WHERE id = new.idea_id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS idea_upvotes_count_ad
+        AFTER DELETE ON idea_upvotes
+        BEGIN
+            UPDATE ideas SET upvote_count = upvote_count - 1 WHERE id = old.idea_id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS idea_comments_rating_ai
+        AFTER INSERT ON idea_comments
+        WHEN new.rating IS NOT NULL
+        BEGIN
+            UPDATE ideas
+            SET rating_sum = rating_sum + new.rating, rating_count = rating_count + 1
+            WHERE id = new.idea_id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS idea_comments_rating_ad
+        AFTER DELETE ON idea_comments
+        WHEN old.rating IS NOT NULL
+        BEGIN
+            UPDATE ideas
+            SET rating_sum = rating_sum - old.rating, rating_count = rating_count - 1
+            WHERE id = old.idea_id;
+        END
+        """
+    )
+    conn.execute(
+        """
+        UPDATE ideas
+        SET upvote_count = (SELECT COUNT(*) FROM idea_upvotes u WHERE u.idea_id = ideas.id),
+            rating_sum = (
+                SELECT COALESCE(SUM(c.rating), 0) FROM idea_comments c
+                WHERE c.idea_id = ideas.id AND c.rating IS NOT NULL
+            ),
+            rating_count = (
+                SELECT COUNT(c.rating) FROM idea_comments c
+                WHERE c.idea_id = ideas.id AND c.rating IS NOT NULL
             )
-            """
+        """
+    )
+
+
+def _migrate_v6_ticket_sort_keys(conn: sqlite3.Connection) -> None:
+    # 정렬용 정수 컬럼: 처리 기간(age_seconds)과 긴급도(urgency_rank)를 인덱스로 정렬한다
+    ticket_columns = [row["name"] for row in conn.execute("PRAGMA table_info(service_desk_tickets)").fetchall()]
+    for column in ("created_ts", "updated_ts", "age_seconds", "urgency_rank"):
+        if column not in ticket_columns:
+            conn.execute(f"ALTER TABLE service_desk_tickets ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+
+    conn.execute(
+        """
+        UPDATE service_desk_tickets
+        SET created_ts = CAST(strftime('%s', created_at) AS INTEGER),
+            updated_ts = CAST(strftime('%s', updated_at) AS INTEGER),
+            age_seconds = CAST(strftime('%s', updated_at) AS INTEGER) - CAST(strftime('%s', created_at) AS INTEGER),
+            urgency_rank = CASE urgency WHEN 'URGENT' THEN 2 WHEN 'NORMAL' THEN 1 ELSE 0 END
+        """
+    )
+
+    for prefix, columns in (
+        ("", ""),
+        ("category_", "category, "),
+        ("status_", "status, "),
+        ("category_status_", "category, status, "),
+    ):
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_tickets_{prefix}age "
+            f"ON service_desk_tickets ({columns}age_seconds, created_at)"
         )
         conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS meeting_participants (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                booking_id INTEGER NOT NULL,
-                participant_name TEXT NOT NULL,
-                FOREIGN KEY(booking_id) REFERENCES bookings(id)
-            )
-            """
+            f"CREATE INDEX IF NOT EXISTS idx_tickets_{prefix}urgency "
+            f"ON service_desk_tickets ({columns}urgency_rank, created_at)"
         )
-        _ensure_meeting_logs_schema(conn)
-        conn.commit()
 
-        room_count = conn.execute("SELECT COUNT(*) FROM rooms").fetchone()[0]
-        if room_count == 0:
-            seed_rooms(conn)
 
-        _ensure_idea_hub_schema(conn)
-        _backfill_idea_authors(conn)
-        conn.commit()
+def _migrate_v7_booking_minutes(conn: sqlite3.Connection) -> None:
+    # 예약 시각을 분 단위 정수(minute-of-day)로 저장해 겹침 검사를 정수 비교로 한다
+    booking_columns = [row["name"] for row in conn.execute("PRAGMA table_info(bookings)").fetchall()]
+    for column in ("start_min", "end_min"):
+        if column not in booking_columns:
+            conn.execute(f"ALTER TABLE bookings ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
 
-        idea_count = conn.execute("SELECT COUNT(*) FROM ideas").fetchone()[0]
-        if idea_count == 0:
-            seed_ideas(conn)
-            conn.commit()
+    conn.execute(
+        """
+        UPDATE bookings
+        SET start_min = CAST(substr(start_time, 1, instr(start_time, ':') - 1) AS INTEGER) * 60
+                        + CAST(substr(start_time, instr(start_time, ':') + 1, 2) AS INTEGER),
+            end_min = CAST(substr(end_time, 1, instr(end_time, ':') - 1) AS INTEGER) * 60
+                      + CAST(substr(end_time, instr(end_time, ':') + 1, 2) AS INTEGER)
+        """
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_bookings_room_date_span")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_bookings_room_date_minutes ON bookings (room_id, date, start_min, end_min)"
+    )
 
-        _ensure_club_schema(conn)
-        conn.commit()
+
+def _migrate_v8_room_occupancy(conn: sqlite3.Connection) -> None:
+    # 회의실/날짜별 15분 슬롯 점유 비트맵. (date, room_id) 순서라 날짜 범위로 바로 찾아간다
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS room_day_occupancy (
+            date TEXT NOT NULL,
+            room_id INTEGER NOT NULL,
+            slots BLOB NOT NULL,
+            PRIMARY KEY (date, room_id)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_rooms_type_capacity ON rooms (room_type, capacity)")
+    _rebuild_room_occupancy(conn)
+
+
+def _migrate_v9_meeting_log_index(conn: sqlite3.Connection) -> None:
+    # 예약 기반/직접 작성 회의록을 UNION ALL 한 번으로 날짜 역순 병합하기 위한 인덱스.
+    # 직접 작성 회의록은 booking_id IS NULL 동등 조건 뒤에 정렬 키가 오도록 만든다
+    statements = [
+        "CREATE INDEX IF NOT EXISTS idx_bookings_presenter_date ON bookings (presenter, date, start_time)",
+        "CREATE INDEX IF NOT EXISTS idx_meeting_logs_direct_date "
+        "ON meeting_logs (booking_id, COALESCE(meeting_date, ''), COALESCE(start_time, ''))",
+        "CREATE INDEX IF NOT EXISTS idx_meeting_logs_direct_author "
+        "ON meeting_logs (booking_id, author, COALESCE(meeting_date, ''), COALESCE(start_time, ''))",
+        "CREATE INDEX IF NOT EXISTS idx_meeting_logs_direct_room "
+        "ON meeting_logs (booking_id, room_name, COALESCE(meeting_date, ''), COALESCE(start_time, ''))",
+    ]
+    for statement in statements:
+        conn.execute(statement)
+
+
+def _migrate_v10_jobs(conn: sqlite3.Connection) -> None:
+    # 전사/요약 같은 오래 걸리는 작업을 요청 밖에서 처리하기 위한 작업 큐.
+    # run_after는 대기 중이면 실행 가능 시각, 실행 중이면 임대(lease) 만료 시각이다
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'queued',
+            progress REAL NOT NULL DEFAULT 0,
+            message TEXT,
+            result TEXT,
+            error TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            run_after REAL NOT NULL,
+            locked_by TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, run_after)")
+
+
+def _migrate_v11_transcript_cache(conn: sqlite3.Connection) -> None:
+    # 같은 녹음 파일을 다시 올리면 전사를 건너뛰도록 오디오 SHA-256(+모델, 언어) 기준으로 결과를 보관한다.
+    # size_bytes 합이 상한을 넘으면 last_used_at이 오래된 것부터 지운다
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS transcript_cache (
+            audio_sha256 TEXT NOT NULL,
+            model TEXT NOT NULL,
+            language TEXT NOT NULL,
+            transcript BLOB NOT NULL,
+            size_bytes INTEGER NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            last_used_at REAL NOT NULL,
+            PRIMARY KEY (audio_sha256, model, language)
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_transcript_cache_lru ON transcript_cache (last_used_at)")
+
+
+def _migrate_v12_summary_cache(conn: sqlite3.Connection) -> None:
+    # 같은 회의 텍스트를 다시 요약하지 않도록 (프롬프트 버전, 모델, 정규화한 입력) 해시 기준으로 결과를 보관한다.
+    # expires_at이 지난 항목은 조회되지 않고, size_bytes 합이 상한을 넘으면 오래 안 쓴 것부터 지운다
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS summary_cache (
+            cache_key TEXT PRIMARY KEY,
+            model TEXT NOT NULL,
+            prompt_version INTEGER NOT NULL,
+            source TEXT NOT NULL,
+            summary_json BLOB NOT NULL,
+            summary_text BLOB NOT NULL,
+            warning TEXT,
+            size_bytes INTEGER NOT NULL,
+            hits INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            last_used_at REAL NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_summary_cache_lru ON summary_cache (last_used_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_summary_cache_expiry ON summary_cache (expires_at)")
+
+
+MIGRATIONS = [
+    (1, _migrate_v1_baseline),
+    (2, _migrate_v2_query_indexes),
+    (3, _migrate_v3_ticket_search),
+    (4, _migrate_v4_ticket_counters),
+    (5, _migrate_v5_idea_aggregates),
+    (6, _migrate_v6_ticket_sort_keys),
+    (7, _migrate_v7_booking_minutes),
+    (8, _migrate_v8_room_occupancy),
+    (9, _migrate_v9_meeting_log_index),
+    (10, _migrate_v10_jobs),
+    (11, _migrate_v11_transcript_cache),
+    (12, _migrate_v12_summary_cache),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
 
 
 def _ensure_club_schema(conn: sqlite3.Connection) -> None:
@@ -207,47 +788,171 @@ def seed_tickets(conn):
         """,
         samples,
     )
-    conn.commit()
 
 
-def fetch_tickets(category=None, status=None, q=None, sort="newest"):
-    sql = "SELECT * FROM service_desk_tickets WHERE 1=1"
-    params = {}
+TICKET_SORT_OPTIONS = ["newest", "oldest", "pending_oldest", "urgency", "relevance"]
+
+# trigram 토크나이저는 3글자 미만 검색어를 색인으로 찾지 못한다
+_SEARCH_MIN_TERM_LENGTH = 3
+# bm25 가중치: title, description, requester
+_SEARCH_BM25_WEIGHTS = (10.0, 1.0, 5.0)
+_HIGHLIGHT_OPEN = "\x02"
+_HIGHLIGHT_CLOSE = "\x03"
+_TICKET_FTS_ENABLED: dict[str, bool] = {}
+
+
+def _ticket_fts_enabled(conn: sqlite3.Connection) -> bool:
+    enabled = _TICKET_FTS_ENABLED.get(DB_PATH)
+    if enabled is None:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'service_desk_tickets_fts'"
+        ).fetchone()
+        enabled = _TICKET_FTS_ENABLED[DB_PATH] = bool(row)
+    return enabled
+
+
+def _ticket_search_terms(q: str) -> tuple[str, list[str]]:
+    long_terms = []
+    short_terms = []
+    for term in q.split():
+        if len(term) >= _SEARCH_MIN_TERM_LENGTH:
+            long_terms.append(term)
+        else:
+            short_terms.append(term)
+    match = " AND ".join('"' + term.replace('"', '""') + '"' for term in long_terms)
+    return match, short_terms
+
+
+def _render_highlight(value: str | None) -> str | None:
+    if value is None:
+        return None
+    escaped = html.escape(value)
+    return escaped.replace(_HIGHLIGHT_OPEN, "<mark>").replace(_HIGHLIGHT_CLOSE, "</mark>")
+
+
+# 정렬 모드별 (SQL 식, 내림차순 여부) 키. 마지막 키는 항상 id로 순서를 고정한다
+_TICKET_SORT_KEYS = {
+    "newest": [("t.created_at", True), ("t.id", True)],
+    "oldest": [("t.created_at", False), ("t.id", False)],
+    "pending_oldest": [("t.age_seconds", True), ("t.created_at", True), ("t.id", True)],
+    "urgency": [("t.urgency_rank", True), ("t.created_at", True), ("t.id", True)],
+    "relevance": [("{rank}", False), ("t.created_at", True), ("t.id", True)],
+}
 
-    if category:
-        sql += " AND category = :category"
-        params["category"] = category
-    if status:
-        sql += " AND status = :status"
-        params["status"] = status
-    if q:
-        sql += " AND (title LIKE :q OR requester LIKE :q)"
-        params["q"] = f"%{q}%"
-
-    if sort == "oldest":
-        sql += " ORDER BY created_at ASC"
-    elif sort == "pending_oldest":
-        sql += """
-            ORDER BY
-                (julianday(updated_at) - julianday(created_at)) DESC,
-                created_at DESC
-        """
-    elif sort == "urgency":
-        sql += """
-            ORDER BY
-                CASE urgency
-                    WHEN 'URGENT' THEN 0
-                    WHEN 'NORMAL' THEN 1
-                    ELSE 2
-                END,
-                created_at DESC
-        """
-    else:
-        sql += " ORDER BY created_at DESC"
 
+def encode_cursor(sort: str, values: list) -> str:
+    payload = json.dumps({"s": sort, "k": values}, ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        values = payload["k"]
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValueError("invalid cursor") from exc
+    if payload.get("s") != sort or not isinstance(values, list):
+        raise ValueError("cursor does not match sort")
+    # 커서 값은 그대로 SQL 파라미터로 바인딩되므로 스칼라만 받는다(bool은 JSON 조작으로만 들어온다)
+    if any(isinstance(value, bool) or not isinstance(value, (str, int, float, type(None))) for value in values):
+        raise ValueError("invalid cursor")
+    return values
+
+
+def _keyset_condition(keys: list[tuple[str, bool]], values: list, params: dict) -> str:
+    # (k1, k2, ...) 가 커서 다음에 오는 행: k1 > v1 OR (k1 = v1 AND k2 > v2) OR ...
+    # 앞에 붙인 k1 >= v1 조건은 인덱스에서 커서 위치로 바로 seek하기 위한 것이다
+    if len(values) != len(keys):
+        raise ValueError("cursor does not match sort")
+    lead_expr, lead_descending = keys[0]
+    bound = f"{lead_expr} {'<=' if lead_descending else '>='} :cursor0"
+    clauses = []
+    for index, (expr, descending) in enumerate(keys):
+        parts = [f"{keys[i][0]} = :cursor{i}" for i in range(index)]
+        parts.append(f"{expr} {'<' if descending else '>'} :cursor{index}")
+        clauses.append("(" + " AND ".join(parts) + ")")
+        params[f"cursor{index}"] = values[index]
+    return f"{bound} AND (" + " OR ".join(clauses) + ")"
+
+
+def _query_tickets(category=None, status=None, q=None, sort="newest", limit=None, cursor=None):
+    q = (q or "").strip()
     with get_connection() as conn:
+        match, like_terms = _ticket_search_terms(q) if q else ("", [])
+        use_fts = bool(match) and _ticket_fts_enabled(conn)
+        if not use_fts:
+            like_terms = q.split() if q else []
+        if sort not in _TICKET_SORT_KEYS or (sort == "relevance" and not use_fts):
+            sort = "newest"
+
+        weights = ", ".join(str(weight) for weight in _SEARCH_BM25_WEIGHTS)
+        rank_expr = f"bm25(service_desk_tickets_fts, {weights})"
+        keys = [(expr.format(rank=rank_expr), descending) for expr, descending in _TICKET_SORT_KEYS[sort]]
+        key_columns = ", ".join(f"{expr} AS _sort_key{index}" for index, (expr, _) in enumerate(keys))
+
+        params = {}
+        if use_fts:
+            sql = f"""
+                SELECT
+                    t.*,
+                    {rank_expr} AS search_rank,
+                    highlight(service_desk_tickets_fts, 0, :hl_open, :hl_close) AS title_highlight,
+                    snippet(service_desk_tickets_fts, 1, :hl_open, :hl_close, '…', 16) AS description_snippet,
+                    {key_columns}
+                FROM service_desk_tickets_fts
+                JOIN service_desk_tickets t ON t.id = service_desk_tickets_fts.rowid
+                WHERE service_desk_tickets_fts MATCH :match
+            """
+            params.update({"match": match, "hl_open": _HIGHLIGHT_OPEN, "hl_close": _HIGHLIGHT_CLOSE})
+        else:
+            sql = f"SELECT t.*, {key_columns} FROM service_desk_tickets t WHERE 1=1"
+
+        if category:
+            sql += " AND t.category = :category"
+            params["category"] = category
+        if status:
+            sql += " AND t.status = :status"
+            params["status"] = status
+        for index, term in enumerate(like_terms):
+            sql += f" AND (t.title LIKE :like{index} OR t.description LIKE :like{index} OR t.requester LIKE :like{index})"
+            params[f"like{index}"] = f"%{term}%"
+        if cursor:
+            sql += " AND " + _keyset_condition(keys, decode_cursor(cursor, sort), params)
+
+        sql += " ORDER BY " + ", ".join(f"{expr} {'DESC' if descending else 'ASC'}" for expr, descending in keys)
+        if limit is not None:
+            # 다음 페이지 존재 여부를 알기 위해 한 건 더 읽는다
+            sql += " LIMIT :limit"
+            params["limit"] = int(limit) + 1
+
         rows = conn.execute(sql, params).fetchall()
-    return [dict(row) for row in rows]
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, [last[f"_sort_key{index}"] for index in range(len(keys))])
+
+    result = []
+    for row in rows:
+        item = dict(row)
+        for index in range(len(keys)):
+            item.pop(f"_sort_key{index}", None)
+        if use_fts:
+            item["title_highlight"] = _render_highlight(item.get("title_highlight"))
+            item["description_snippet"] = _render_highlight(item.get("description_snippet"))
+        result.append(item)
+    return result, next_cursor
+
+
+def fetch_tickets(category=None, status=None, q=None, sort="newest"):
+    tickets, _ = _query_tickets(category=category, status=status, q=q, sort=sort)
+    return tickets
+
+
+def fetch_tickets_page(category=None, status=None, q=None, sort="newest", limit=50, cursor=None):
+    return _query_tickets(category=category, status=status, q=q, sort=sort, limit=limit, cursor=cursor)
 
 
 def fetch_summary():
@@ -272,11 +977,7 @@ def fetch_summary():
 
     with get_connection() as conn:
         rows = conn.execute(
-            """
-            SELECT category, status, COUNT(*) as count
-            FROM service_desk_tickets
-            GROUP BY category, status
-            """
+            "SELECT category, status, count FROM service_desk_ticket_counts WHERE count > 0"
         ).fetchall()
 
     for row in rows:
@@ -293,6 +994,70 @@ def fetch_summary():
     return summary
 
 
+def _count_tickets_by_category_status(conn: sqlite3.Connection) -> dict[tuple[str, str], int]:
+    rows = conn.execute(
+        """
+        SELECT category, status, COUNT(*) as count
+        FROM service_desk_tickets
+        GROUP BY category, status
+        """
+    ).fetchall()
+    return {(row["category"], row["status"]): row["count"] for row in rows}
+
+
+def _rebuild_ticket_counters(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM service_desk_ticket_counts")
+    conn.executemany(
+        "INSERT INTO service_desk_ticket_counts (category, status, count) VALUES (?, ?, ?)",
+        [(category, status, count) for (category, status), count in _count_tickets_by_category_status(conn).items()],
+    )
+
+
+def verify_ticket_counters(rebuild: bool = False) -> list[dict]:
+    # 카운터 테이블을 원본 테이블과 비교해 어긋난 (category, status)를 돌려준다
+    with get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        expected = _count_tickets_by_category_status(conn)
+        stored = {
+            (row["category"], row["status"]): row["count"]
+            for row in conn.execute("SELECT category, status, count FROM service_desk_ticket_counts").fetchall()
+        }
+        drift = []
+        for key in sorted(set(expected) | set(stored)):
+            if expected.get(key, 0) != stored.get(key, 0):
+                drift.append(
+                    {
+                        "category": key[0],
+                        "status": key[1],
+                        "expected": expected.get(key, 0),
+                        "stored": stored.get(key, 0),
+                    }
+                )
+        if rebuild and drift:
+            _rebuild_ticket_counters(conn)
+        conn.commit()
+    return drift
+
+
+_URGENCY_RANK = {"URGENT": 2, "NORMAL": 1, "LOW": 0}
+
+
+def _epoch_seconds(value: str) -> int:
+    # strftime('%s', ...)와 같은 기준(시간대 없는 ISO 문자열을 UTC로 간주)으로 변환한다
+    return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+
+
+def ticket_sort_columns(created_at: str, updated_at: str, urgency: str) -> dict:
+    created_ts = _epoch_seconds(created_at)
+    updated_ts = _epoch_seconds(updated_at)
+    return {
+        "created_ts": created_ts,
+        "updated_ts": updated_ts,
+        "age_seconds": updated_ts - created_ts,
+        "urgency_rank": _URGENCY_RANK.get(urgency, 0),
+    }
+
+
 def create_ticket(data):
     now = _now_iso()
     from app.fixtures.seed_data import find_user_id_by_name, user_name
@@ -303,15 +1068,18 @@ def create_ticket(data):
         requester = user_name(requester_user_id) or requester_user_id
     if requester and not requester_user_id:
         requester_user_id = find_user_id_by_name(requester)
+    urgency = data.get("urgency", "NORMAL")
     with get_connection() as conn:
         cur = conn.execute(
             """
             INSERT INTO service_desk_tickets (
                 category, owner_team, title, description, requester, requester_user_id, status,
-                urgency, attachment_name, attachment_path, created_at, updated_at
+                urgency, attachment_name, attachment_path, created_at, updated_at,
+                created_ts, updated_ts, age_seconds, urgency_rank
             ) VALUES (
                 :category, :owner_team, :title, :description, :requester, :requester_user_id, :status,
-                :urgency, :attachment_name, :attachment_path, :created_at, :updated_at
+                :urgency, :attachment_name, :attachment_path, :created_at, :updated_at,
+                :created_ts, :updated_ts, :age_seconds, :urgency_rank
             )
             """,
             {
@@ -322,11 +1090,12 @@ def create_ticket(data):
                 "requester": requester or "nota_inhouse",
                 "requester_user_id": requester_user_id,
                 "status": data.get("status", "PENDING"),
-                "urgency": data.get("urgency", "NORMAL"),
+                "urgency": urgency,
                 "attachment_name": data.get("attachment_name"),
                 "attachment_path": data.get("attachment_path"),
                 "created_at": now,
                 "updated_at": now,
+                **ticket_sort_columns(now, now, urgency),
             },
         )
         conn.commit()
@@ -341,10 +1110,13 @@ def update_ticket_status(ticket_id, status):
         conn.execute(
             """
             UPDATE service_desk_tickets
-            SET status = :status, updated_at = :updated_at
+            SET status = :status,
+                updated_at = :updated_at,
+                updated_ts = :updated_ts,
+                age_seconds = :updated_ts - created_ts
             WHERE id = :id
             """,
-            {"status": status, "updated_at": now, "id": ticket_id},
+            {"status": status, "updated_at": now, "updated_ts": _epoch_seconds(now), "id": ticket_id},
         )
         conn.commit()
 
@@ -405,7 +1177,6 @@ def seed_rooms(conn):
         """,
         rooms,
     )
-    conn.commit()
 
 
 def fetch_rooms():
@@ -414,7 +1185,69 @@ def fetch_rooms():
     return [dict(row) for row in rows]
 
 
-def fetch_bookings(date_value):
+def _fetch_booking_participants(conn, booking_ids: list[int]) -> dict[int, list[str]]:
+    participants: dict[int, list[str]] = {}
+    if not booking_ids:
+        return participants
+    rows = conn.execute(
+        """
+        SELECT booking_id, participant_name
+        FROM meeting_participants
+        WHERE booking_id IN (SELECT value FROM json_each(:booking_ids))
+        """,
+        {"booking_ids": json.dumps(booking_ids)},
+    ).fetchall()
+    for row in rows:
+        participants.setdefault(row["booking_id"], []).append(row["participant_name"])
+    return participants
+
+
+MEETING_LOG_CONTENT_FIELDS = ("notes", "transcript", "summary")
+
+
+def parse_meeting_log_fields(value: str | None) -> tuple[str, ...]:
+    if not value:
+        return ()
+    fields = tuple(dict.fromkeys(part.strip() for part in value.split(",") if part.strip()))
+    unknown = [name for name in fields if name not in MEETING_LOG_CONTENT_FIELDS]
+    if unknown:
+        raise ValueError(f"unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def _meeting_log_content_columns(fields, alias: str = "ml") -> list[str]:
+    # 큰 본문 컬럼은 요청한 것만 싣고, 나머지는 존재 여부 플래그로 대신한다
+    columns = [f"{alias}.{name} IS NOT NULL as has_{name}" for name in MEETING_LOG_CONTENT_FIELDS]
+    columns.extend(f"{alias}.{name} as {name}" for name in fields)
+    return columns
+
+
+def pack_meeting_text(value):
+    # 긴 본문은 zlib 압축해 BLOB으로 저장한다. 짧거나 줄지 않는 값은 TEXT 그대로 둔다
+    if not value or not MEETING_LOG_COMPRESSION_ENABLED:
+        return value
+    raw = value.encode("utf-8")
+    if len(raw) < MEETING_LOG_COMPRESS_MIN_BYTES:
+        return value
+    packed = zlib.compress(raw, MEETING_LOG_COMPRESS_LEVEL)
+    return packed if len(packed) < len(raw) else value
+
+
+def unpack_meeting_text(value):
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+def _with_content_flags(item: dict) -> dict:
+    for name in MEETING_LOG_CONTENT_FIELDS:
+        item[f"has_{name}"] = bool(item[f"has_{name}"])
+        if name in item:
+            item[name] = unpack_meeting_text(item[name])
+    return item
+
+
+def fetch_bookings(date_value, fields=()):
     with get_connection() as conn:
         rows = conn.execute(
             """
@@ -426,34 +1259,19 @@ def fetch_bookings(date_value):
             """,
             {"date": date_value},
         ).fetchall()
-
-        participants = conn.execute(
-            """
-            SELECT booking_id, participant_name
-            FROM meeting_participants
-            WHERE booking_id IN (
-                SELECT id FROM bookings WHERE date = :date
-            )
-            """,
-            {"date": date_value},
-        ).fetchall()
+        booking_ids = [row["id"] for row in rows]
+        participants_map = _fetch_booking_participants(conn, booking_ids)
 
         logs = conn.execute(
-            """
-            SELECT booking_id, summary, notes, audio_path, transcript
-            FROM meeting_logs
-            WHERE booking_id IN (
-                SELECT id FROM bookings WHERE date = :date
-            )
+            f"""
+            SELECT ml.booking_id, ml.id, ml.audio_path, {', '.join(_meeting_log_content_columns(fields))}
+            FROM meeting_logs ml
+            WHERE ml.booking_id IN (SELECT value FROM json_each(:booking_ids))
             """,
-            {"date": date_value},
+            {"booking_ids": json.dumps(booking_ids)},
         ).fetchall()
 
-    participants_map = {}
-    for row in participants:
-        participants_map.setdefault(row["booking_id"], []).append(row["participant_name"])
-
-    logs_map = {row["booking_id"]: dict(row) for row in logs}
+    logs_map = {row["booking_id"]: _with_content_flags(dict(row)) for row in logs}
 
     result = []
     for row in rows:
@@ -464,93 +1282,484 @@ def fetch_bookings(date_value):
     return result
 
 
-def fetch_all_bookings():
+BOOKING_RANGE_MAX_DAYS = 92
+
+
+def parse_date_range(date_from: str, date_to: str, max_days: int):
+    first_day = datetime.strptime(date_from, "%Y-%m-%d").date()
+    last_day = datetime.strptime(date_to, "%Y-%m-%d").date()
+    if last_day < first_day:
+        raise ValueError("date range is reversed")
+    if (last_day - first_day).days >= max_days:
+        raise ValueError(f"date range is longer than {max_days} days")
+    return first_day, last_day
+
+
+def fetch_bookings_range(date_from: str, date_to: str, room_id: int | None = None) -> list[dict]:
+    # 기간 전체를 쿼리 2번(예약+회의록 여부, 참석자)으로 가져온다. 날짜 수와 무관하다
+    first_day, last_day = parse_date_range(date_from, date_to, BOOKING_RANGE_MAX_DAYS)
+    conditions = ["b.date >= :date_from", "b.date <= :date_to"]
+    params: dict = {"date_from": first_day.isoformat(), "date_to": last_day.isoformat()}
+    if room_id is not None:
+        conditions.append("b.room_id = :room_id")
+        params["room_id"] = room_id
+
     with get_connection() as conn:
         rows = conn.execute(
-            """
-            SELECT b.*, r.name as room_name, r.room_type, r.feature, r.recommended_use, r.capacity
+            f"""
+            SELECT b.*, r.name as room_name, r.room_type, r.feature, r.recommended_use, r.capacity,
+                   EXISTS (SELECT 1 FROM meeting_logs ml WHERE ml.booking_id = b.id) AS has_log
             FROM bookings b
             JOIN rooms r ON r.id = b.room_id
-            ORDER BY b.date DESC, b.start_time DESC
-            """
+            WHERE {' AND '.join(conditions)}
+            ORDER BY b.date ASC, b.start_time ASC, b.id ASC
+            """,
+            params,
         ).fetchall()
+        participants_map = _fetch_booking_participants(conn, [row["id"] for row in rows])
 
-    result = [dict(row) for row in rows]
+    result = []
+    for row in rows:
+        item = dict(row)
+        item["has_log"] = bool(item["has_log"])
+        item["participants"] = participants_map.get(row["id"], [])
+        result.append(item)
     return result
 
 
+_BOOKING_LIST_KEYS = [("b.date", True), ("b.start_time", True), ("b.id", True)]
+_BOOKING_LIST_COLUMNS = "b.*, r.name as room_name, r.room_type, r.feature, r.recommended_use, r.capacity"
+BOOKING_EXPORT_FIELDS = [
+    "id",
+    "date",
+    "start_time",
+    "end_time",
+    "room_id",
+    "room_name",
+    "agenda",
+    "presenter",
+    "created_at",
+    "updated_at",
+]
+
+
+def _fetch_booking_list_rows(conn, limit: int, after: list | None = None):
+    params: dict = {"limit": limit}
+    where_clause = f"WHERE {_keyset_condition(_BOOKING_LIST_KEYS, after, params)}" if after else ""
+    return conn.execute(
+        f"""
+        SELECT {_BOOKING_LIST_COLUMNS}
+        FROM bookings b
+        JOIN rooms r ON r.id = b.room_id
+        {where_clause}
+        ORDER BY b.date DESC, b.start_time DESC, b.id DESC
+        LIMIT :limit
+        """,
+        params,
+    ).fetchall()
+
+
+def fetch_all_bookings():
+    return list(iter_all_bookings())
+
+
+def fetch_bookings_page(limit: int = 50, cursor: str | None = None) -> tuple[list[dict], str | None]:
+    after = decode_cursor(cursor, "bookings") if cursor else None
+    with get_connection() as conn:
+        rows = _fetch_booking_list_rows(conn, limit + 1, after)
+
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor("bookings", [last["date"], last["start_time"], last["id"]])
+    return items, next_cursor
+
+
+def iter_all_bookings(batch_size: int = 500):
+    # 키셋 단위로 끊어 읽어서 메모리 사용량과 읽기 트랜잭션 길이가 전체 건수와 무관하다
+    after = None
+    while True:
+        with get_connection() as conn:
+            rows = _fetch_booking_list_rows(conn, batch_size, after)
+        for row in rows:
+            yield dict(row)
+        if len(rows) < batch_size:
+            return
+        last = rows[-1]
+        after = [last["date"], last["start_time"], last["id"]]
+
+
 def fetch_booking_days(month_value):
-    month_like = f"{month_value}-%"
+    # LIKE 'YYYY-MM-%' 대신 범위 조건을 써야 idx_bookings_date_start를 탄다
     with get_connection() as conn:
         rows = conn.execute(
             """
             SELECT date, COUNT(*) as count
             FROM bookings
-            WHERE date LIKE :month
+            WHERE date >= :month_start AND date < :month_end
             GROUP BY date
             """,
-            {"month": month_like},
+            {"month_start": f"{month_value}-", "month_end": f"{month_value}-\uffff"},
         ).fetchall()
     return {row["date"]: row["count"] for row in rows}
 
 
-def create_booking(data):
+def minute_of_day(value: str) -> int:
+    hours, _, minutes = (value or "").strip().partition(":")
+    total = int(hours) * 60 + int(minutes[:2])
+    if not hours or not minutes or total < 0 or total > 24 * 60 or int(minutes[:2]) >= 60:
+        raise ValueError(f"invalid time: {value!r}")
+    return total
+
+
+class RoomDayIntervalIndex:
+    # (DB, room_id, date)별 예약 구간을 프로세스 안에 캐시한다.
+    # "비어 있는가"를 DB 왕복 없이 답하되(is_slot_free), 예약 허용/거절은 항상 BEGIN IMMEDIATE 트랜잭션이 정한다.
+    def __init__(self, max_days: int = 4096, ttl: float = BOOKING_INTERVAL_INDEX_TTL):
+        self.max_days = max_days
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._days: OrderedDict[tuple, tuple[float, list[tuple[int, int]]]] = OrderedDict()
+
+    def overlaps(self, key: tuple, start_min: int, end_min: int) -> bool | None:
+        with self._lock:
+            entry = self._days.get(key)
+            if entry is None:
+                return None
+            loaded_at, intervals = entry
+            if time.monotonic() - loaded_at > self.ttl:
+                del self._days[key]
+                return None
+            self._days.move_to_end(key)
+            return any(start < end_min and end > start_min for start, end in intervals)
+
+    def load(self, key: tuple, intervals: list[tuple[int, int]]) -> None:
+        with self._lock:
+            self._days[key] = (time.monotonic(), sorted(intervals))
+            self._days.move_to_end(key)
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+
+    def add(self, key: tuple, start_min: int, end_min: int) -> None:
+        with self._lock:
+            entry = self._days.get(key)
+            if entry is not None:
+                entry[1].append((start_min, end_min))
+                entry[1].sort()
+
+    def invalidate(self, key: tuple) -> None:
+        with self._lock:
+            self._days.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._days.clear()
+
+
+_BOOKING_INDEX = RoomDayIntervalIndex()
+
+
+def _room_day_key(room_id, date_value) -> tuple:
+    return (DB_PATH, int(room_id), date_value)
+
+
+def _fetch_room_day_intervals(conn, room_id, date_value) -> list[tuple[int, int]]:
+    rows = conn.execute(
+        """
+        SELECT start_min, end_min
+        FROM bookings
+        WHERE room_id = :room_id AND date = :date
+        """,
+        {"room_id": room_id, "date": date_value},
+    ).fetchall()
+    return [(row["start_min"], row["end_min"]) for row in rows]
+
+
+def _insert_booking(conn, data, start_min: int, end_min: int) -> int:
     now = _now_iso()
-    with get_connection() as conn:
-        cur = conn.execute(
+    cur = conn.execute(
+        """
+        INSERT INTO bookings (
+            room_id, date, start_time, end_time, start_min, end_min,
+            agenda, presenter, created_at, updated_at
+        ) VALUES (
+            :room_id, :date, :start_time, :end_time, :start_min, :end_min,
+            :agenda, :presenter, :created_at, :updated_at
+        )
+        """,
+        {
+            "room_id": data["room_id"],
+            "date": data["date"],
+            "start_time": data["start_time"],
+            "end_time": data["end_time"],
+            "start_min": start_min,
+            "end_min": end_min,
+            "agenda": data["agenda"],
+            "presenter": data["presenter"],
+            "created_at": now,
+            "updated_at": now,
+        },
+    )
+    booking_id = cur.lastrowid
+
+    participants = data.get("participants") or []
+    if participants:
+        conn.executemany(
             """
-            INSERT INTO bookings (
-                room_id, date, start_time, end_time, agenda, presenter, created_at, updated_at
-            ) VALUES (
-                :room_id, :date, :start_time, :end_time, :agenda, :presenter, :created_at, :updated_at
-            )
+            INSERT INTO meeting_participants (booking_id, participant_name)
+            VALUES (:booking_id, :participant_name)
             """,
-            {
-                "room_id": data["room_id"],
-                "date": data["date"],
-                "start_time": data["start_time"],
-                "end_time": data["end_time"],
-                "agenda": data["agenda"],
-                "presenter": data["presenter"],
-                "created_at": now,
-                "updated_at": now,
-            },
+            [{"booking_id": booking_id, "participant_name": name} for name in participants],
         )
-        booking_id = cur.lastrowid
+    _mark_room_occupancy(conn, data["room_id"], data["date"], start_min, end_min)
+    return booking_id
+
+
+def create_booking(data):
+    start_min = minute_of_day(data["start_time"])
+    end_min = minute_of_day(data["end_time"])
+    with get_connection() as conn:
+        booking_id = _insert_booking(conn, data, start_min, end_min)
+        conn.commit()
+
+    _BOOKING_INDEX.add(_room_day_key(data["room_id"], data["date"]), start_min, end_min)
+    return booking_id
+
 
-        participants = data.get("participants") or []
-        if participants:
-            conn.executemany(
+def book_room(data) -> int | None:
+    # 겹침 검사와 INSERT를 한 BEGIN IMMEDIATE 트랜잭션에서 처리한다. 겹치면 None.
+    start_min = minute_of_day(data["start_time"])
+    end_min = minute_of_day(data["end_time"])
+    key = _room_day_key(data["room_id"], data["date"])
+    # 캐시는 최대 TTL만큼 오래됐거나 다른 프로세스/직접 수정한 변경을 모를 수 있다.
+    # 그래서 거절 판정에는 쓰지 않고, 겹침 판정은 아래 트랜잭션만 한다
+    cache_says_taken = BOOKING_INTERVAL_INDEX_ENABLED and _BOOKING_INDEX.overlaps(key, start_min, end_min)
+
+    with get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conflict = conn.execute(
                 """
-                INSERT INTO meeting_participants (booking_id, participant_name)
-                VALUES (:booking_id, :participant_name)
+                SELECT 1
+                FROM bookings
+                WHERE room_id = :room_id
+                  AND date = :date
+                  AND start_min < :end_min
+                  AND end_min > :start_min
+                LIMIT 1
                 """,
-                [{"booking_id": booking_id, "participant_name": name} for name in participants],
-            )
+                {"room_id": data["room_id"], "date": data["date"], "start_min": start_min, "end_min": end_min},
+            ).fetchone()
+            if conflict:
+                conn.rollback()
+                # 다른 프로세스가 넣은 예약을 캐시가 몰랐던 경우이므로 다시 읽게 한다
+                _BOOKING_INDEX.invalidate(key)
+                return None
+            booking_id = _insert_booking(conn, data, start_min, end_min)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
-        conn.commit()
+    if cache_says_taken:
+        # 캐시가 틀렸다(비워진 자리를 몰랐다). 다음 조회 때 다시 읽게 한다
+        _BOOKING_INDEX.invalidate(key)
+    else:
+        _BOOKING_INDEX.add(key, start_min, end_min)
+    return booking_id
+
+
+def is_slot_free(room_id, date_value, start_time, end_time) -> bool:
+    start_min = minute_of_day(start_time)
+    end_min = minute_of_day(end_time)
+    key = _room_day_key(room_id, date_value)
+    if BOOKING_INTERVAL_INDEX_ENABLED:
+        cached = _BOOKING_INDEX.overlaps(key, start_min, end_min)
+        if cached is not None:
+            return not cached
+
+    with get_connection() as conn:
+        intervals = _fetch_room_day_intervals(conn, room_id, date_value)
+    if BOOKING_INTERVAL_INDEX_ENABLED:
+        _BOOKING_INDEX.load(key, intervals)
+    return not any(start < end_min and end > start_min for start, end in intervals)
+
+
+def has_booking_conflict(room_id, date_value, start_time, end_time):
+    with get_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*) as count
+            FROM bookings
+            WHERE room_id = :room_id
+              AND date = :date
+              AND start_min < :end_min
+              AND end_min > :start_min
+            """,
+            {
+                "room_id": room_id,
+                "date": date_value,
+                "start_min": minute_of_day(start_time),
+                "end_min": minute_of_day(end_time),
+            },
+        ).fetchone()
+    return row["count"] > 0
+
+
+OCCUPANCY_SLOT_MINUTES = 15
+OCCUPANCY_SLOTS_PER_DAY = 24 * 60 // OCCUPANCY_SLOT_MINUTES
+_OCCUPANCY_BYTES = OCCUPANCY_SLOTS_PER_DAY // 8
+AVAILABILITY_MAX_DAYS = 31
+
+
+def _occupancy_mask(start_min: int, end_min: int) -> int:
+    # 조금이라도 걸치는 슬롯은 점유로 본다(빈 슬롯이라고 답한 곳은 항상 예약 가능)
+    first = start_min // OCCUPANCY_SLOT_MINUTES
+    last = min(-(-end_min // OCCUPANCY_SLOT_MINUTES), OCCUPANCY_SLOTS_PER_DAY)
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+def _decode_slots(blob) -> int:
+    return int.from_bytes(blob, "little") if blob else 0
+
+
+def _encode_slots(bits: int) -> bytes:
+    return bits.to_bytes(_OCCUPANCY_BYTES, "little")
+
+
+def _mark_room_occupancy(conn, room_id, date_value, start_min: int, end_min: int) -> None:
+    row = conn.execute(
+        "SELECT slots FROM room_day_occupancy WHERE date = :date AND room_id = :room_id",
+        {"date": date_value, "room_id": room_id},
+    ).fetchone()
+    bits = _decode_slots(row["slots"] if row else None) | _occupancy_mask(start_min, end_min)
+    conn.execute(
+        """
+        INSERT INTO room_day_occupancy (date, room_id, slots)
+        VALUES (:date, :room_id, :slots)
+        ON CONFLICT(date, room_id) DO UPDATE SET slots = excluded.slots
+        """,
+        {"date": date_value, "room_id": room_id, "slots": _encode_slots(bits)},
+    )
+
+
+def _occupancy_from_bookings(conn) -> dict[tuple[str, int], int]:
+    occupancy: dict[tuple[str, int], int] = {}
+    for row in conn.execute("SELECT room_id, date, start_min, end_min FROM bookings"):
+        key = (row["date"], row["room_id"])
+        occupancy[key] = occupancy.get(key, 0) | _occupancy_mask(row["start_min"], row["end_min"])
+    return occupancy
+
+
+def _rebuild_room_occupancy(conn) -> None:
+    conn.execute("DELETE FROM room_day_occupancy")
+    conn.executemany(
+        "INSERT INTO room_day_occupancy (date, room_id, slots) VALUES (?, ?, ?)",
+        [(date_value, room_id, _encode_slots(bits)) for (date_value, room_id), bits in _occupancy_from_bookings(conn).items()],
+    )
 
-    return booking_id
 
+def verify_room_occupancy(rebuild: bool = False) -> list[dict]:
+    # 비트맵을 bookings 테이블과 비교해 어긋난 (date, room_id)를 돌려준다
+    with get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        expected = _occupancy_from_bookings(conn)
+        stored = {
+            (row["date"], row["room_id"]): _decode_slots(row["slots"])
+            for row in conn.execute("SELECT date, room_id, slots FROM room_day_occupancy").fetchall()
+        }
+        drift = [
+            {"date": key[0], "room_id": key[1]}
+            for key in sorted(set(expected) | set(stored))
+            if expected.get(key, 0) != stored.get(key, 0)
+        ]
+        if rebuild and drift:
+            _rebuild_room_occupancy(conn)
+        conn.commit()
+    return drift
+
+
+def _free_starts(occupied: int, window: int, slots_needed: int) -> list[int]:
+    free = ~occupied & window
+    run = free
+    for offset in range(1, slots_needed):
+        run &= free >> offset
+    starts = []
+    while run:
+        low = run & -run
+        starts.append(low.bit_length() - 1)
+        run ^= low
+    return starts
+
+
+def _format_minutes(total: int) -> str:
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
+def find_available_rooms(
+    date_from: str,
+    date_to: str,
+    duration_min: int,
+    capacity: int | None = None,
+    room_type: str | None = None,
+    window_start: str = "09:00",
+    window_end: str = "18:00",
+) -> list[dict]:
+    first_day, last_day = parse_date_range(date_from, date_to, AVAILABILITY_MAX_DAYS)
+    if duration_min <= 0:
+        raise ValueError("duration must be positive")
+
+    slots_needed = -(-duration_min // OCCUPANCY_SLOT_MINUTES)
+    window = _occupancy_mask(minute_of_day(window_start), minute_of_day(window_end))
+    days = [(first_day + timedelta(days=offset)).isoformat() for offset in range((last_day - first_day).days + 1)]
+
+    conditions = []
+    params: dict = {}
+    if room_type:
+        conditions.append("room_type = :room_type")
+        params["room_type"] = room_type
+    if capacity:
+        conditions.append("capacity >= :capacity")
+        params["capacity"] = capacity
+    where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
-def has_booking_conflict(room_id, date_value, start_time, end_time):
     with get_connection() as conn:
-        row = conn.execute(
-            """
-            SELECT COUNT(*) as count
-            FROM bookings
-            WHERE room_id = :room_id
-              AND date = :date
-              AND NOT (end_time <= :start_time OR start_time >= :end_time)
-            """,
-            {
-                "room_id": room_id,
-                "date": date_value,
-                "start_time": start_time,
-                "end_time": end_time,
-            },
-        ).fetchone()
-    return row["count"] > 0
+        rooms = conn.execute(
+            f"SELECT id, name, capacity, room_type FROM rooms {where_clause} ORDER BY name ASC",
+            params,
+        ).fetchall()
+        occupancy = {
+            (row["date"], row["room_id"]): _decode_slots(row["slots"])
+            for row in conn.execute(
+                """
+                SELECT date, room_id, slots
+                FROM room_day_occupancy
+                WHERE date >= :date_from AND date <= :date_to
+                """,
+                {"date_from": days[0], "date_to": days[-1]},
+            ).fetchall()
+        }
+
+    results = []
+    for room in rooms:
+        for day in days:
+            starts = _free_starts(occupancy.get((day, room["id"]), 0), window, slots_needed)
+            if not starts:
+                continue
+            results.append(
+                {
+                    "room_id": room["id"],
+                    "room_name": room["name"],
+                    "capacity": room["capacity"],
+                    "room_type": room["room_type"],
+                    "date": day,
+                    "start_times": [_format_minutes(slot * OCCUPANCY_SLOT_MINUTES) for slot in starts],
+                }
+            )
+    return results
 
 
 def upsert_meeting_log(booking_id, notes, audio_path, transcript, summary):
@@ -633,7 +1842,7 @@ def _ensure_meeting_logs_schema(conn):
     conn.execute("ALTER TABLE meeting_logs_new RENAME TO meeting_logs")
 
 
-def fetch_booking_by_id(booking_id):
+def fetch_booking_by_id(booking_id, fields=()):
     with get_connection() as conn:
         row = conn.execute(
             """
@@ -655,10 +1864,10 @@ def fetch_booking_by_id(booking_id):
         ).fetchall()
 
         log = conn.execute(
-            """
-            SELECT id, summary, notes, audio_path, transcript
-            FROM meeting_logs
-            WHERE booking_id = :booking_id
+            f"""
+            SELECT ml.id, ml.audio_path, {', '.join(_meeting_log_content_columns(fields))}
+            FROM meeting_logs ml
+            WHERE ml.booking_id = :booking_id
             """,
             {"booking_id": booking_id},
         ).fetchone()
@@ -668,75 +1877,153 @@ def fetch_booking_by_id(booking_id):
 
     result = dict(row)
     result["participants"] = [p["participant_name"] for p in participants]
-    result["log"] = dict(log) if log else None
+    result["log"] = _with_content_flags(dict(log)) if log else None
     return result
 
 
-def fetch_meeting_logs():
+# (meeting_date, start_time, source, entry_id) 역순. source는 예약 기반 1, 직접 작성 0
+_MEETING_LOG_BOOKING_KEYS = [("b.date", True), ("b.start_time", True), ("1", True), ("b.id", True)]
+_MEETING_LOG_DIRECT_KEYS = [
+    ("COALESCE(ml.meeting_date, '')", True),
+    ("COALESCE(ml.start_time, '')", True),
+    ("0", True),
+    ("ml.id", True),
+]
+_MEETING_LOG_MAX_DATE = "9999-12-31"
+
+
+def _query_meeting_logs(
+    room=None, author=None, date_from=None, date_to=None, limit=None, cursor=None, fields=()
+):
+    params: dict = {"date_to": date_to or _MEETING_LOG_MAX_DATE}
+    # 상한 조건을 항상 걸어야 직접 작성 회의록 쪽도 정렬 인덱스를 탄다
+    booking_conditions = ["b.date <= :date_to"]
+    direct_conditions = ["ml.booking_id IS NULL", "COALESCE(ml.meeting_date, '') <= :date_to"]
+    if date_from:
+        booking_conditions.append("b.date >= :date_from")
+        direct_conditions.append("COALESCE(ml.meeting_date, '') >= :date_from")
+        params["date_from"] = date_from
+    if room:
+        booking_conditions.append("b.room_id IN (SELECT id FROM rooms WHERE name = :room)")
+        direct_conditions.append("ml.room_name = :room")
+        params["room"] = room
+    if author:
+        booking_conditions.append("b.presenter = :author")
+        direct_conditions.append("ml.author = :author")
+        params["author"] = author
+    if cursor:
+        after = decode_cursor(cursor, "meeting_logs")
+        booking_conditions.append(_keyset_condition(_MEETING_LOG_BOOKING_KEYS, after, params))
+        direct_conditions.append(_keyset_condition(_MEETING_LOG_DIRECT_KEYS, after, params))
+
+    limit_clause = ""
+    if limit is not None:
+        limit_clause = "LIMIT :limit"
+        params["limit"] = limit + 1
+
     with get_connection() as conn:
-        booking_rows = conn.execute(
-            """
+        rows = conn.execute(
+            f"""
             SELECT
                 ml.id as log_id,
                 b.id as booking_id,
                 b.date as meeting_date,
-                b.start_time,
-                b.end_time,
+                b.start_time as start_time,
+                b.end_time as end_time,
                 r.name as room_name,
                 b.agenda as agenda,
                 b.presenter as presenter,
-                ml.summary as summary,
-                CASE WHEN ml.id IS NULL THEN 0 ELSE 1 END as has_log
+                {', '.join(_meeting_log_content_columns(fields))},
+                CASE WHEN ml.id IS NULL THEN 0 ELSE 1 END as has_log,
+                1 as source,
+                b.id as entry_id
             FROM bookings b
             JOIN rooms r ON r.id = b.room_id
             LEFT JOIN meeting_logs ml ON ml.booking_id = b.id
-            """
-        ).fetchall()
-
-        direct_rows = conn.execute(
-            """
+            WHERE {' AND '.join(booking_conditions)}
+            UNION ALL
             SELECT
-                ml.id as log_id,
-                NULL as booking_id,
-                ml.meeting_date,
-                ml.start_time,
+                ml.id,
+                NULL,
+                COALESCE(ml.meeting_date, ''),
+                COALESCE(ml.start_time, ''),
                 ml.end_time,
                 ml.room_name,
-                ml.title as agenda,
-                ml.author as presenter,
-                ml.summary as summary,
-                1 as has_log
+                ml.title,
+                ml.author,
+                {', '.join(_meeting_log_content_columns(fields))},
+                1,
+                0,
+                ml.id
             FROM meeting_logs ml
-            WHERE ml.booking_id IS NULL
-            """
+            WHERE {' AND '.join(direct_conditions)}
+            ORDER BY meeting_date DESC, start_time DESC, source DESC, entry_id DESC
+            {limit_clause}
+            """,
+            params,
         ).fetchall()
 
-    combined = [dict(row) for row in booking_rows] + [dict(row) for row in direct_rows]
-    combined.sort(
-        key=lambda item: (
-            item.get("meeting_date") or "",
-            item.get("start_time") or "",
-        ),
-        reverse=True,
+    items = []
+    next_cursor = None
+    for row in rows[:limit] if limit is not None else rows:
+        item = dict(row)
+        key = [item["meeting_date"], item["start_time"], item.pop("source"), item.pop("entry_id")]
+        if item["booking_id"] is None:
+            item["meeting_date"] = item["meeting_date"] or None
+            item["start_time"] = item["start_time"] or None
+        items.append(_with_content_flags(item))
+    if limit is not None and len(rows) > limit:
+        next_cursor = encode_cursor("meeting_logs", key)
+    return items, next_cursor
+
+
+def fetch_meeting_logs(room=None, author=None, date_from=None, date_to=None, fields=()):
+    items, _ = _query_meeting_logs(room=room, author=author, date_from=date_from, date_to=date_to, fields=fields)
+    return items
+
+
+def fetch_meeting_logs_page(
+    room=None, author=None, date_from=None, date_to=None, limit=50, cursor=None, fields=()
+):
+    return _query_meeting_logs(
+        room=room, author=author, date_from=date_from, date_to=date_to, limit=limit, cursor=cursor, fields=fields
     )
-    return combined
 
 
-def fetch_meeting_log_by_id(log_id):
+def fetch_meeting_log_by_id(log_id, fields=()):
     with get_connection() as conn:
         row = conn.execute(
-            """
-            SELECT id, booking_id, title, author, meeting_date, start_time, end_time, room_name,
-                   notes, audio_path, transcript, summary, created_at, updated_at
-            FROM meeting_logs
-            WHERE id = :log_id
+            f"""
+            SELECT ml.id, ml.booking_id, ml.title, ml.author, ml.meeting_date, ml.start_time, ml.end_time,
+                   ml.room_name, ml.audio_path, ml.created_at, ml.updated_at,
+                   {', '.join(_meeting_log_content_columns(fields))}
+            FROM meeting_logs ml
+            WHERE ml.id = :log_id
             """,
             {"log_id": log_id},
         ).fetchone()
-    return dict(row) if row else None
+    return _with_content_flags(dict(row)) if row else None
+
+
+def fetch_meeting_log_content(log_id, fields=MEETING_LOG_CONTENT_FIELDS):
+    # 목록/상세 응답에서 뺀 본문을 필요할 때만 따로 가져온다
+    fields = parse_meeting_log_fields(",".join(fields)) or MEETING_LOG_CONTENT_FIELDS
+    with get_connection() as conn:
+        row = conn.execute(
+            f"SELECT id, {', '.join(fields)} FROM meeting_logs WHERE id = :log_id",
+            {"log_id": log_id},
+        ).fetchone()
+    if not row:
+        return None
+    return {key: unpack_meeting_text(value) for key, value in dict(row).items()}
+
 
+def upsert_meeting_log_entry(*args, **kwargs):
+    _, updated_at = save_meeting_log_entry(*args, **kwargs)
+    return updated_at
 
-def upsert_meeting_log_entry(
+
+def save_meeting_log_entry(
     booking_id,
     notes,
     audio_path,
@@ -760,6 +2047,7 @@ def upsert_meeting_log_entry(
             existing = None
 
         if existing:
+            log_id = existing["id"]
             conn.execute(
                 """
                 UPDATE meeting_logs
@@ -771,16 +2059,16 @@ def upsert_meeting_log_entry(
                 WHERE booking_id = :booking_id
                 """,
                 {
-                    "notes": notes,
+                    "notes": pack_meeting_text(notes),
                     "audio_path": audio_path,
-                    "transcript": transcript,
-                    "summary": summary,
+                    "transcript": pack_meeting_text(transcript),
+                    "summary": pack_meeting_text(summary),
                     "updated_at": now,
                     "booking_id": booking_id,
                 },
             )
         else:
-            conn.execute(
+            log_id = conn.execute(
                 """
                 INSERT INTO meeting_logs (
                     booking_id, notes, audio_path, transcript, summary,
@@ -794,10 +2082,10 @@ def upsert_meeting_log_entry(
                 """,
                 {
                     "booking_id": booking_id,
-                    "notes": notes,
+                    "notes": pack_meeting_text(notes),
                     "audio_path": audio_path,
-                    "transcript": transcript,
-                    "summary": summary,
+                    "transcript": pack_meeting_text(transcript),
+                    "summary": pack_meeting_text(summary),
                     "title": title,
                     "author": author,
                     "meeting_date": meeting_date,
@@ -807,13 +2095,109 @@ def upsert_meeting_log_entry(
                     "created_at": now,
                     "updated_at": now,
                 },
-            )
+            ).lastrowid
 
         conn.commit()
 
+    return log_id, now
+
+
+def update_meeting_log_content(log_id, **values):
+    # 작업 큐가 전사/요약을 끝낸 뒤 해당 회의록의 본문만 채운다
+    columns = [name for name in MEETING_LOG_CONTENT_FIELDS if name in values]
+    if not columns:
+        return None
+    now = _now_iso()
+    params = {name: pack_meeting_text(values[name]) for name in columns}
+    params.update({"log_id": log_id, "updated_at": now})
+    assignments = ", ".join(f"{name} = :{name}" for name in columns)
+    with get_connection() as conn:
+        conn.execute(
+            f"UPDATE meeting_logs SET {assignments}, updated_at = :updated_at WHERE id = :log_id",
+            params,
+        )
+        conn.commit()
     return now
 
 
+def compress_meeting_logs(batch_size: int = 200) -> dict:
+    # 평문으로 남아 있는 본문을 압축 형식으로 다시 쓴다. 여러 번 실행해도 안전하다
+    stats = {"rows": 0, "bytes_before": 0, "bytes_after": 0}
+    last_id = 0
+    while True:
+        with get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                """
+                SELECT id, notes, transcript, summary
+                FROM meeting_logs
+                WHERE id > :last_id
+                ORDER BY id
+                LIMIT :limit
+                """,
+                {"last_id": last_id, "limit": batch_size},
+            ).fetchall()
+            updates = []
+            for row in rows:
+                changed = False
+                values = {"id": row["id"]}
+                for name in MEETING_LOG_CONTENT_FIELDS:
+                    value = row[name]
+                    packed = pack_meeting_text(value) if isinstance(value, str) else value
+                    values[name] = packed
+                    if packed is not value:
+                        changed = True
+                        stats["bytes_before"] += len(value.encode("utf-8"))
+                        stats["bytes_after"] += len(packed)
+                if changed:
+                    updates.append(values)
+            if updates:
+                conn.executemany(
+                    """
+                    UPDATE meeting_logs
+                    SET notes = :notes, transcript = :transcript, summary = :summary
+                    WHERE id = :id
+                    """,
+                    updates,
+                )
+            conn.commit()
+        stats["rows"] += len(updates)
+        if len(rows) < batch_size:
+            return stats
+        last_id = rows[-1]["id"]
+
+
+def database_size_report() -> dict:
+    with get_connection() as conn:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        content = conn.execute(
+            """
+            SELECT
+                COUNT(*) as rows,
+                COALESCE(SUM(length(CAST(notes AS BLOB))), 0)
+                + COALESCE(SUM(length(CAST(transcript AS BLOB))), 0)
+                + COALESCE(SUM(length(CAST(summary AS BLOB))), 0) as content_bytes,
+                SUM(typeof(notes) = 'blob') + SUM(typeof(transcript) = 'blob') + SUM(typeof(summary) = 'blob')
+                    as compressed_values
+            FROM meeting_logs
+            """
+        ).fetchone()
+    return {
+        "file_bytes": page_size * page_count,
+        "free_bytes": page_size * freelist,
+        "meeting_logs": content["rows"],
+        "meeting_log_content_bytes": content["content_bytes"],
+        "compressed_values": content["compressed_values"] or 0,
+    }
+
+
+def vacuum_database() -> None:
+    with get_connection() as conn:
+        conn.execute("VACUUM")
+
+
 def _ensure_idea_hub_schema(conn):
     conn.execute(
         """
@@ -1015,30 +2399,43 @@ def delete_idea(idea_id: int) -> bool:
         return (cur.rowcount or 0) > 0
 
 
-def _fetch_idea_timeline(conn, idea_id: int):
+def _fetch_idea_timelines(conn, idea_ids: list[int]) -> dict[int, list[dict]]:
+    # 아이디어마다 쿼리하지 않고 선택된 id 전체를 한 번에 읽어 묶는다
+    timelines: dict[int, list[dict]] = {}
+    if not idea_ids:
+        return timelines
     rows = conn.execute(
         """
-        SELECT status, message, created_at
+        SELECT idea_id, status, message, created_at
         FROM idea_timeline
-        WHERE idea_id = :idea_id
-        ORDER BY created_at ASC
+        WHERE idea_id IN (SELECT value FROM json_each(:idea_ids))
+        ORDER BY idea_id, created_at ASC, id ASC
         """,
-        {"idea_id": idea_id},
+        {"idea_ids": json.dumps(idea_ids)},
     ).fetchall()
-    return [dict(row) for row in rows]
+    for row in rows:
+        item = dict(row)
+        timelines.setdefault(item.pop("idea_id"), []).append(item)
+    return timelines
 
 
-def _fetch_idea_comments(conn, idea_id: int):
+def _fetch_idea_comments(conn, idea_ids: list[int]) -> dict[int, list[dict]]:
+    comments: dict[int, list[dict]] = {}
+    if not idea_ids:
+        return comments
     rows = conn.execute(
         """
-        SELECT author, author_user_id, comment, rating, created_at
+        SELECT idea_id, author, author_user_id, comment, rating, created_at
         FROM idea_comments
-        WHERE idea_id = :idea_id
-        ORDER BY created_at DESC
+        WHERE idea_id IN (SELECT value FROM json_each(:idea_ids))
+        ORDER BY idea_id, created_at DESC, id DESC
         """,
-        {"idea_id": idea_id},
+        {"idea_ids": json.dumps(idea_ids)},
     ).fetchall()
-    return [dict(row) for row in rows]
+    for row in rows:
+        item = dict(row)
+        comments.setdefault(item.pop("idea_id"), []).append(item)
+    return comments
 
 
 def fetch_ideas(status: str | None = None):
@@ -1062,38 +2459,29 @@ def fetch_ideas(status: str | None = None):
                 i.created_at,
                 i.completed_image,
                 i.completed_description,
-                COALESCE(u.upvotes, 0) AS upvotes,
-                COALESCE(r.rating, 0) AS rating,
-                COALESCE(r.rating_count, 0) AS rating_count
+                i.upvote_count AS upvotes,
+                CASE WHEN i.rating_count > 0 THEN i.rating_sum * 1.0 / i.rating_count ELSE 0 END AS rating,
+                i.rating_count
             FROM ideas i
-            LEFT JOIN (
-                SELECT idea_id, COUNT(*) AS upvotes
-                FROM idea_upvotes
-                GROUP BY idea_id
-            ) u ON u.idea_id = i.id
-            LEFT JOIN (
-                SELECT idea_id, AVG(rating) AS rating, COUNT(rating) AS rating_count
-                FROM idea_comments
-                WHERE rating IS NOT NULL
-                GROUP BY idea_id
-            ) r ON r.idea_id = i.id
             {where_clause}
             ORDER BY i.created_at DESC
             """,
             params,
         ).fetchall()
 
-        result = []
-        for row in rows:
-            idea = dict(row)
-            idea["upvotes"] = int(idea.get("upvotes") or 0)
-            idea["rating"] = float(idea.get("rating") or 0)
-            idea["rating_count"] = int(idea.get("rating_count") or 0)
-            idea["timeline"] = _fetch_idea_timeline(conn, idea["id"])
-            if idea.get("status") == "해결 완료":
-                idea["comments"] = _fetch_idea_comments(conn, idea["id"])
-            result.append(idea)
+        ideas = [dict(row) for row in rows]
+        timelines = _fetch_idea_timelines(conn, [idea["id"] for idea in ideas])
+        comments = _fetch_idea_comments(conn, [idea["id"] for idea in ideas if idea.get("status") == "해결 완료"])
 
+    result = []
+    for idea in ideas:
+        idea["upvotes"] = int(idea.get("upvotes") or 0)
+        idea["rating"] = float(idea.get("rating") or 0)
+        idea["rating_count"] = int(idea.get("rating_count") or 0)
+        idea["timeline"] = timelines.get(idea["id"], [])
+        if idea.get("status") == "해결 완료":
+            idea["comments"] = comments.get(idea["id"], [])
+        result.append(idea)
     return result
 
 
@@ -1110,16 +2498,17 @@ def upvote_idea(idea_id: int, user_id: str):
                 {"idea_id": idea_id, "user_id": user_id, "created_at": now},
             )
             inserted = True
-            conn.commit()
         except sqlite3.IntegrityError:
             inserted = False
 
-        upvotes = conn.execute(
-            "SELECT COUNT(*) FROM idea_upvotes WHERE idea_id = :idea_id",
+        # upvote_count는 idea_upvotes 트리거가 같은 트랜잭션 안에서 갱신한다
+        row = conn.execute(
+            "SELECT upvote_count FROM ideas WHERE id = :idea_id",
             {"idea_id": idea_id},
-        ).fetchone()[0]
+        ).fetchone()
+        conn.commit()
 
-    return inserted, int(upvotes)
+    return inserted, int(row["upvote_count"]) if row else 0
 
 
 def add_idea_comment(idea_id: int, author: str, comment: str, rating: int | None):
@@ -1144,9 +2533,15 @@ def add_idea_comment(idea_id: int, author: str, comment: str, rating: int | None
                 "created_at": now,
             },
         )
+        row = conn.execute(
+            "SELECT rating_sum, rating_count FROM ideas WHERE id = :idea_id",
+            {"idea_id": idea_id},
+        ).fetchone()
         conn.commit()
 
-    return now
+    rating_count = int(row["rating_count"]) if row else 0
+    rating_avg = float(row["rating_sum"]) / rating_count if rating_count else 0.0
+    return now, rating_avg, rating_count
 
 
 def _backfill_service_desk_requesters(conn: sqlite3.Connection) -> None:
@@ -1190,3 +2585,414 @@ def _backfill_idea_authors(conn: sqlite3.Connection) -> None:
                 "UPDATE idea_comments SET author_user_id = :uid WHERE id = :id",
                 {"uid": author_user_id, "id": row["id"]},
             )
+
+
+def job_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def enqueue_job(kind: str, payload: dict, max_attempts: int = JOB_MAX_ATTEMPTS) -> int:
+    now = _now_iso()
+    with get_connection() as conn:
+        job_id = conn.execute(
+            """
+            INSERT INTO jobs (kind, payload, status, max_attempts, run_after, created_at, updated_at)
+            VALUES (:kind, :payload, 'queued', :max_attempts, :run_after, :created_at, :updated_at)
+            """,
+            {
+                "kind": kind,
+                "payload": json.dumps(payload, ensure_ascii=False),
+                "max_attempts": max_attempts,
+                "run_after": time.time(),
+                "created_at": now,
+                "updated_at": now,
+            },
+        ).lastrowid
+        conn.commit()
+    return job_id
+
+
+def claim_job(worker_id: str, kinds=None, lease_seconds: float = JOB_LEASE_SECONDS) -> dict | None:
+    # 대기 중이거나 임대가 만료된 작업 하나를 원자적으로 가져온다(여러 프로세스가 동시에 불러도 안전)
+    kind_clause = ""
+    params: dict = {"worker_id": worker_id}
+    if kinds:
+        kind_clause = "AND kind IN (SELECT value FROM json_each(:kinds))"
+        params["kinds"] = json.dumps(list(kinds))
+
+    with get_connection() as conn:
+        while True:
+            now = time.time()
+            params.update({"now": now, "lease_until": now + lease_seconds, "updated_at": _now_iso()})
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    f"""
+                    SELECT id, attempts, max_attempts, status
+                    FROM jobs
+                    WHERE status IN ('queued', 'running') AND run_after <= :now {kind_clause}
+                    ORDER BY run_after, id
+                    LIMIT 1
+                    """,
+                    params,
+                ).fetchone()
+                if row is None:
+                    conn.commit()
+                    return None
+                if row["status"] == "running" and row["attempts"] >= row["max_attempts"]:
+                    # 임대 만료로 돌아온 작업인데 재시도 횟수를 다 썼다
+                    conn.execute(
+                        """
+                        UPDATE jobs
+                        SET status = 'failed', error = COALESCE(error, 'lease expired'),
+                            locked_by = NULL, updated_at = :updated_at
+                        WHERE id = :id
+                        """,
+                        {"id": row["id"], "updated_at": params["updated_at"]},
+                    )
+                    conn.commit()
+                    continue
+                job = conn.execute(
+                    """
+                    UPDATE jobs
+                    SET status = 'running', attempts = attempts + 1, locked_by = :worker_id,
+                        run_after = :lease_until, updated_at = :updated_at
+                    WHERE id = :id
+                    RETURNING id, kind, payload, attempts, max_attempts
+                    """,
+                    {**params, "id": row["id"]},
+                ).fetchone()
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            item = dict(job)
+            item["payload"] = json.loads(item["payload"])
+            return item
+
+
+def report_job_progress(
+    job_id: int, worker_id: str, progress: float, message: str | None = None, lease_seconds: float = JOB_LEASE_SECONDS
+) -> bool:
+    # 진행률을 남기면서 임대도 연장한다. 임대를 뺏겼으면 False
+    with get_connection() as conn:
+        cur = conn.execute(
+            """
+            UPDATE jobs
+            SET progress = :progress, message = COALESCE(:message, message),
+                run_after = :lease_until, updated_at = :updated_at
+            WHERE id = :id AND status = 'running' AND locked_by = :worker_id
+            """,
+            {
+                "id": job_id,
+                "worker_id": worker_id,
+                "progress": max(0.0, min(1.0, progress)),
+                "message": message,
+                "lease_until": time.time() + lease_seconds,
+                "updated_at": _now_iso(),
+            },
+        )
+        conn.commit()
+    return cur.rowcount == 1
+
+
+def renew_job_lease(job_id: int, worker_id: str, lease_seconds: float = JOB_LEASE_SECONDS) -> bool:
+    # 진행률은 그대로 두고 임대만 연장한다. 임대를 뺏겼거나 작업이 끝났으면 False
+    with get_connection() as conn:
+        cur = conn.execute(
+            """
+            UPDATE jobs
+            SET run_after = :lease_until, updated_at = :updated_at
+            WHERE id = :id AND status = 'running' AND locked_by = :worker_id
+            """,
+            {
+                "id": job_id,
+                "worker_id": worker_id,
+                "lease_until": time.time() + lease_seconds,
+                "updated_at": _now_iso(),
+            },
+        )
+        conn.commit()
+    return cur.rowcount == 1
+
+
+def complete_job(job_id: int, worker_id: str, result) -> bool:
+    with get_connection() as conn:
+        cur = conn.execute(
+            """
+            UPDATE jobs
+            SET status = 'succeeded', progress = 1, result = :result, error = NULL,
+                locked_by = NULL, updated_at = :updated_at
+            WHERE id = :id AND status = 'running' AND locked_by = :worker_id
+            """,
+            {
+                "id": job_id,
+                "worker_id": worker_id,
+                "result": json.dumps(result, ensure_ascii=False),
+                "updated_at": _now_iso(),
+            },
+        )
+        conn.commit()
+    return cur.rowcount == 1
+
+
+def job_retry_delay(attempts: int) -> float:
+    # 지수 백오프 + full jitter
+    ceiling = min(JOB_RETRY_MAX_SECONDS, JOB_RETRY_BASE_SECONDS * (2 ** max(0, attempts - 1)))
+    return random.uniform(ceiling / 2, ceiling)
+
+
+def fail_job(job_id: int, worker_id: str, error: str, retry: bool = True) -> str | None:
+    # 재시도 여유가 있으면 백오프 후 다시 대기열로, 아니면 failed. 바뀐 상태를 돌려준다
+    with get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = :id AND status = 'running' AND locked_by = :worker_id",
+                {"id": job_id, "worker_id": worker_id},
+            ).fetchone()
+            if row is None:
+                conn.commit()
+                return None
+            status = "queued" if retry and row["attempts"] < row["max_attempts"] else "failed"
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = :status, error = :error, locked_by = NULL,
+                    run_after = :run_after, updated_at = :updated_at
+                WHERE id = :id
+                """,
+                {
+                    "id": job_id,
+                    "status": status,
+                    "error": error,
+                    "run_after": time.time() + (job_retry_delay(row["attempts"]) if status == "queued" else 0),
+                    "updated_at": _now_iso(),
+                },
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return status
+
+
+def fetch_job(job_id: int) -> dict | None:
+    with get_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT id, kind, status, progress, message, result, error, attempts, max_attempts,
+                   created_at, updated_at
+            FROM jobs
+            WHERE id = :id
+            """,
+            {"id": job_id},
+        ).fetchone()
+    if not row:
+        return None
+    item = dict(row)
+    item["result"] = json.loads(item["result"]) if item["result"] else None
+    return item
+
+
+def fetch_cached_transcript(audio_sha256: str, model: str, language: str) -> str | None:
+    with get_connection() as conn:
+        row = conn.execute(
+            """
+            UPDATE transcript_cache
+            SET hits = hits + 1, last_used_at = :now
+            WHERE audio_sha256 = :sha AND model = :model AND language = :language
+            RETURNING transcript
+            """,
+            {"sha": audio_sha256, "model": model, "language": language, "now": time.time()},
+        ).fetchone()
+        conn.commit()
+    return unpack_meeting_text(row["transcript"]) if row else None
+
+
+def store_cached_transcript(
+    audio_sha256: str, model: str, language: str, transcript: str, max_bytes: int | None = None
+) -> None:
+    packed = pack_meeting_text(transcript)
+    size = len(packed) if isinstance(packed, bytes) else len(packed.encode("utf-8"))
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO transcript_cache (audio_sha256, model, language, transcript, size_bytes, created_at, last_used_at)
+            VALUES (:sha, :model, :language, :transcript, :size, :created_at, :now)
+            ON CONFLICT (audio_sha256, model, language) DO UPDATE SET
+                transcript = excluded.transcript,
+                size_bytes = excluded.size_bytes,
+                last_used_at = excluded.last_used_at
+            """,
+            {
+                "sha": audio_sha256,
+                "model": model,
+                "language": language,
+                "transcript": packed,
+                "size": size,
+                "created_at": _now_iso(),
+                "now": time.time(),
+            },
+        )
+        _evict_transcript_cache(conn, TRANSCRIPT_CACHE_MAX_BYTES if max_bytes is None else max_bytes)
+        conn.commit()
+
+
+def _evict_transcript_cache(conn, max_bytes: int) -> int:
+    # 최근 사용 순으로 누적한 크기가 상한을 넘는 항목(= 가장 오래 안 쓴 것들)을 지운다
+    return conn.execute(
+        """
+        DELETE FROM transcript_cache
+        WHERE rowid IN (
+            SELECT rowid
+            FROM (
+                SELECT rowid, SUM(size_bytes) OVER (ORDER BY last_used_at DESC, rowid DESC) AS kept_bytes
+                FROM transcript_cache
+            )
+            WHERE kept_bytes > :max_bytes
+        )
+        """,
+        {"max_bytes": max_bytes},
+    ).rowcount
+
+
+def transcript_cache_stats() -> dict:
+    with get_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*) AS entries, COALESCE(SUM(size_bytes), 0) AS bytes, COALESCE(SUM(hits), 0) AS hits
+            FROM transcript_cache
+            """
+        ).fetchone()
+    return {**dict(row), "max_bytes": TRANSCRIPT_CACHE_MAX_BYTES}
+
+
+def clear_transcript_cache() -> int:
+    with get_connection() as conn:
+        removed = conn.execute("DELETE FROM transcript_cache").rowcount
+        conn.commit()
+    return removed
+
+
+def _packed_size(value) -> int:
+    if value is None:
+        return 0
+    return len(value) if isinstance(value, bytes) else len(value.encode("utf-8"))
+
+
+def fetch_cached_summary(cache_key: str) -> dict | None:
+    now = time.time()
+    with get_connection() as conn:
+        row = conn.execute(
+            """
+            UPDATE summary_cache
+            SET hits = hits + 1, last_used_at = :now
+            WHERE cache_key = :key AND expires_at > :now
+            RETURNING source, summary_json, summary_text, warning
+            """,
+            {"key": cache_key, "now": now},
+        ).fetchone()
+        conn.commit()
+    if not row:
+        return None
+    return {
+        "source": row["source"],
+        "summary_json": json.loads(unpack_meeting_text(row["summary_json"])),
+        "summary_text": unpack_meeting_text(row["summary_text"]),
+        "warning": row["warning"],
+    }
+
+
+def store_cached_summary(
+    cache_key: str,
+    model: str,
+    prompt_version: int,
+    source: str,
+    summary_json: dict,
+    summary_text: str,
+    warning: str | None = None,
+    ttl_seconds: float | None = None,
+    max_bytes: int | None = None,
+) -> None:
+    packed_json = pack_meeting_text(json.dumps(summary_json, ensure_ascii=False))
+    packed_text = pack_meeting_text(summary_text)
+    now = time.time()
+    ttl = SUMMARY_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+    with get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO summary_cache (
+                cache_key, model, prompt_version, source, summary_json, summary_text, warning,
+                size_bytes, created_at, expires_at, last_used_at
+            )
+            VALUES (
+                :key, :model, :prompt_version, :source, :summary_json, :summary_text, :warning,
+                :size, :created_at, :expires_at, :now
+            )
+            ON CONFLICT (cache_key) DO UPDATE SET
+                source = excluded.source,
+                summary_json = excluded.summary_json,
+                summary_text = excluded.summary_text,
+                warning = excluded.warning,
+                size_bytes = excluded.size_bytes,
+                created_at = excluded.created_at,
+                expires_at = excluded.expires_at,
+                last_used_at = excluded.last_used_at
+            """,
+            {
+                "key": cache_key,
+                "model": model,
+                "prompt_version": prompt_version,
+                "source": source,
+                "summary_json": packed_json,
+                "summary_text": packed_text,
+                "warning": warning,
+                "size": _packed_size(packed_json) + _packed_size(packed_text) + _packed_size(warning),
+                "created_at": _now_iso(),
+                "expires_at": now + ttl,
+                "now": now,
+            },
+        )
+        conn.execute("DELETE FROM summary_cache WHERE expires_at <= :now", {"now": now})
+        _evict_summary_cache(conn, SUMMARY_CACHE_MAX_BYTES if max_bytes is None else max_bytes)
+        conn.commit()
+
+
+def _evict_summary_cache(conn, max_bytes: int) -> int:
+    return conn.execute(
+        """
+        DELETE FROM summary_cache
+        WHERE rowid IN (
+            SELECT rowid
+            FROM (
+                SELECT rowid, SUM(size_bytes) OVER (ORDER BY last_used_at DESC, rowid DESC) AS kept_bytes
+                FROM summary_cache
+            )
+            WHERE kept_bytes > :max_bytes
+        )
+        """,
+        {"max_bytes": max_bytes},
+    ).rowcount
+
+
+def summary_cache_stats() -> dict:
+    with get_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*) AS entries,
+                   COALESCE(SUM(size_bytes), 0) AS bytes,
+                   COALESCE(SUM(hits), 0) AS hits,
+                   COALESCE(SUM(expires_at <= :now), 0) AS expired
+            FROM summary_cache
+            """,
+            {"now": time.time()},
+        ).fetchone()
+    return {**dict(row), "max_bytes": SUMMARY_CACHE_MAX_BYTES}
+
+
+def clear_summary_cache() -> int:
+    with get_connection() as conn:
+        removed = conn.execute("DELETE FROM summary_cache").rowcount
+        conn.commit()
+    return removed
@@ -0,0 +1,276 @@
+# Gemini 호출 래퍼. 클라이언트와 모델 객체는 프로세스에서 한 번만 만들어 재사용하고,
+# 호출마다 전체 deadline 안에서만 재시도(지터 포함)한다. 일시적 실패가 이어지면 회로를 열어
+# 한동안은 Gemini를 부르지 않고 곧바로 CircuitOpenError를 낸다(호출하는 쪽이 로컬 요약으로 대체).
+
+import os
+import random
+import threading
+import time
+from collections import deque
+
+try:
+    import google.generativeai as genai
+except Exception:  # pragma: no cover
+    genai = None
+
+GEMINI_ATTEMPT_TIMEOUT_SECONDS = float(os.environ.get("INHOUSE_GEMINI_TIMEOUT", "20"))
+GEMINI_DEADLINE_SECONDS = float(os.environ.get("INHOUSE_GEMINI_DEADLINE", "45"))
+GEMINI_MAX_ATTEMPTS = int(os.environ.get("INHOUSE_GEMINI_MAX_ATTEMPTS", "3"))
+GEMINI_RETRY_BASE_SECONDS = 0.5
+GEMINI_RETRY_MAX_SECONDS = 4.0
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("INHOUSE_GEMINI_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.environ.get("INHOUSE_GEMINI_BREAKER_RESET", "30"))
+LATENCY_SAMPLES = 500
+
+_RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class GeminiUnavailable(Exception):
+    pass
+
+
+# 회로가 열려 있어 호출하지 않았다
+class CircuitOpenError(GeminiUnavailable):
+    pass
+
+
+# deadline 안에 응답을 받지 못했다
+class GeminiTimeout(GeminiUnavailable):
+    pass
+
+
+def is_transient(exc: Exception) -> bool:
+    # 타임아웃/연결 오류(requests 예외도 OSError 계열)와 429/5xx는 다시 시도할 만하다
+    if isinstance(exc, OSError):
+        return True
+    return getattr(exc, "code", None) in _RETRYABLE_STATUS
+
+
+def _is_timeout(exc: Exception) -> bool:
+    return isinstance(exc, TimeoutError) or "Timeout" in type(exc).__name__ or getattr(exc, "code", None) == 504
+
+
+class CircuitBreaker:
+    # closed: 정상 호출 / open: reset_seconds 동안 호출 차단 / half_open: 시험 호출 하나만 통과
+    def __init__(self, threshold=BREAKER_FAILURE_THRESHOLD, reset_seconds=BREAKER_RESET_SECONDS, clock=time.monotonic):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and self.clock() - self.opened_at >= self.reset_seconds:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == "half_open" or self.consecutive_failures >= self.threshold:
+                if self.state != "open":
+                    self.times_opened += 1
+                self.state = "open"
+                self.opened_at = self.clock()
+            self._trial_in_flight = False
+
+    def release(self) -> None:
+        # 시험 호출이 provider 상태와 무관한 이유로 끝났을 때(응답 파싱 오류 등)
+        with self._lock:
+            self._trial_in_flight = False
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = None
+            if self.state == "open":
+                retry_in = max(0.0, round(self.reset_seconds - (self.clock() - self.opened_at), 3))
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "times_opened": self.times_opened,
+                "retry_in_seconds": retry_in,
+            }
+
+
+class GeminiMetrics:
+    def __init__(self, samples=LATENCY_SAMPLES):
+        self.counters = {
+            "calls": 0,
+            "successes": 0,
+            "failures": 0,
+            "attempts": 0,
+            "retries": 0,
+            "timeouts": 0,
+            "short_circuited": 0,
+        }
+        self._latencies = deque(maxlen=samples)
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            counters = dict(self.counters)
+        percentiles = {}
+        for name, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            if latencies:
+                index = min(len(latencies) - 1, int(round(fraction * (len(latencies) - 1))))
+                percentiles[name] = round(latencies[index], 4)
+            else:
+                percentiles[name] = None
+        return {**counters, "latency_seconds": {**percentiles, "samples": len(latencies)}}
+
+
+class GeminiClient:
+    def __init__(
+        self,
+        attempt_timeout=GEMINI_ATTEMPT_TIMEOUT_SECONDS,
+        deadline=GEMINI_DEADLINE_SECONDS,
+        max_attempts=GEMINI_MAX_ATTEMPTS,
+        breaker=None,
+    ):
+        self.attempt_timeout = attempt_timeout
+        self.deadline = deadline
+        self.max_attempts = max(1, max_attempts)
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = GeminiMetrics()
+        self._models = {}
+        self._configured = None
+        self._lock = threading.Lock()
+
+    def _model(self, api_key: str, model_name: str):
+        # genai.configure는 전역 클라이언트를 새로 만들므로 설정이 바뀔 때만 부른다
+        endpoint = os.environ.get("INHOUSE_GEMINI_ENDPOINT", "").strip()
+        settings = (api_key, endpoint)
+        with self._lock:
+            if self._configured != settings:
+                options = {"api_key": api_key}
+                if endpoint:
+                    # 가짜 서버(tools.fake_gemini_server)나 프록시로 보낼 때는 REST로 붙는다
+                    options.update(transport="rest", client_options={"api_endpoint": endpoint})
+                genai.configure(**options)
+                self._configured = settings
+                self._models = {}
+            model = self._models.get(model_name)
+            if model is None:
+                model = genai.GenerativeModel(
+                    model_name,
+                    generation_config={"response_mime_type": "application/json"},
+                )
+                self._models[model_name] = model
+            return model
+
+    def generate_text(self, prompt: str, model_name: str, api_key: str) -> str:
+        self.metrics.incr("calls")
+        if genai is None:
+            # 시험 호출 자리를 잡기 전에 거른다
+            self.metrics.incr("failures")
+            raise GeminiUnavailable("google-generativeai 패키지가 설치되어 있지 않습니다.")
+        if not self.breaker.allow():
+            self.metrics.incr("short_circuited")
+            raise CircuitOpenError("Gemini 호출이 연속으로 실패해 잠시 로컬 요약으로 대체합니다.")
+
+        try:
+            model = self._model(api_key, model_name)
+        except Exception:
+            # 설정/모델 생성 실패는 provider 상태와 무관하다. half-open 시험 호출 자리를 돌려준다
+            self.breaker.release()
+            self.metrics.incr("failures")
+            raise
+        started = time.monotonic()
+        deadline_at = started + self.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = deadline_at - time.monotonic()
+            self.metrics.incr("attempts")
+            attempt_started = time.monotonic()
+            try:
+                # SDK 기본 재시도는 끄고(retry=None) 재시도 횟수와 대기 시간은 여기서 관리한다
+                response = model.generate_content(
+                    prompt,
+                    request_options={"timeout": max(0.1, min(self.attempt_timeout, remaining)), "retry": None},
+                )
+                text = (getattr(response, "text", None) or "").strip()
+            except Exception as exc:
+                self.metrics.observe(time.monotonic() - attempt_started)
+                if not is_transient(exc):
+                    self.breaker.release()
+                    self.metrics.incr("failures")
+                    raise
+                if _is_timeout(exc):
+                    self.metrics.incr("timeouts")
+                delay = min(GEMINI_RETRY_MAX_SECONDS, GEMINI_RETRY_BASE_SECONDS * 2 ** (attempt - 1))
+                delay = random.uniform(delay / 2, delay)
+                if attempt >= self.max_attempts or time.monotonic() + delay >= deadline_at:
+                    self.breaker.record_failure()
+                    self.metrics.incr("failures")
+                    if _is_timeout(exc):
+                        raise GeminiTimeout(f"Gemini 응답 시간 초과 ({attempt}회 시도): {exc}") from exc
+                    raise GeminiUnavailable(f"Gemini 호출 실패 ({attempt}회 시도): {exc}") from exc
+                self.metrics.incr("retries")
+                time.sleep(delay)
+                continue
+
+            self.metrics.observe(time.monotonic() - attempt_started)
+            self.breaker.record_success()
+            self.metrics.incr("successes")
+            return text
+
+    def status(self) -> dict:
+        return {
+            "available": genai is not None,
+            "breaker": self.breaker.snapshot(),
+            "metrics": self.metrics.snapshot(),
+            "attempt_timeout_seconds": self.attempt_timeout,
+            "deadline_seconds": self.deadline,
+            "max_attempts": self.max_attempts,
+        }
+
+
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client() -> GeminiClient:
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = GeminiClient()
+    return _CLIENT
+
+
+def _reset_after_fork():
+    # gRPC 채널과 락은 fork를 넘어 쓸 수 없으므로 자식에서 새로 만든다
+    global _CLIENT, _CLIENT_LOCK
+    _CLIENT = None
+    _CLIENT_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -1,54 +1,94 @@
-﻿import json
-import glob
+﻿import csv
+import hashlib
+import heapq
+import io
+import json
+import logging
 import os
 import random
 import re
-import shutil
 import time
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import accumulate, islice
 
-from flask import jsonify, redirect, render_template, request, url_for
+from flask import Response, jsonify, redirect, render_template, request, stream_with_context, url_for
 from werkzeug.utils import secure_filename
 
 try:
-    import google.generativeai as genai
+    import numpy as np
 except Exception:  # pragma: no cover
-    genai = None
+    np = None
 
 from . import bp
 from app.fixtures.seed_data import club_seed_store
+from app import gemini, speech
+from app.jobs import JobLeaseLost, PermanentJobError, job_handler, notify_workers
 from app.db import (
     BASE_DIR,
+    BOOKING_EXPORT_FIELDS,
     CATEGORY_TO_TEAM,
     IDEA_STATUS_OPTIONS,
     STATUS_OPTIONS,
     URGENCY_OPTIONS,
     add_idea_comment,
-    create_booking,
+    book_room,
     create_idea,
     create_ticket,
     delete_idea,
+    enqueue_job,
     fetch_club_categories,
     fetch_booking_by_id,
-    fetch_all_bookings,
+    fetch_bookings_page,
     fetch_meeting_log_by_id,
+    fetch_meeting_log_content,
     fetch_bookings,
+    fetch_bookings_range,
+    fetch_cached_summary,
+    fetch_cached_transcript,
     fetch_booking_days,
     fetch_ideas,
-    fetch_meeting_logs,
+    fetch_job,
+    fetch_meeting_logs_page,
     fetch_rooms,
     fetch_summary,
-    fetch_tickets,
+    fetch_tickets_page,
+    find_available_rooms,
     idea_exists,
-    has_booking_conflict,
-    upsert_meeting_log_entry,
+    iter_all_bookings,
+    minute_of_day,
+    parse_meeting_log_fields,
+    save_meeting_log_entry,
+    store_cached_summary,
+    store_cached_transcript,
+    update_meeting_log_content,
     upvote_idea,
     update_ticket_status,
 )
 
-_WHISPER_MODEL = None
+# 요약 경로는 작업 워커/청크 요약 스레드에서도 돌므로 앱 컨텍스트가 필요 없는 모듈 로거를 쓴다
+logger = logging.getLogger(__name__)
+
 _OPENAI_CLIENT = None
+
+_UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+# 요약 프롬프트나 응답 후처리를 바꾸면 올린다(이전 요약 캐시가 더 이상 쓰이지 않는다)
+_SUMMARY_PROMPT_VERSION = 2
+# Gemini 실패로 로컬 요약을 쓴 결과는 잠깐만 캐시한다(장애가 풀리면 다시 Gemini로 요약)
+_SUMMARY_FALLBACK_TTL_SECONDS = 600
+# 이보다 긴 회의 텍스트는 문장 단위 청크로 나눠 동시에 요약한 뒤 합친다(map-reduce)
+_SUMMARY_SINGLE_CALL_CHARS = 14000
+_SUMMARY_CHUNK_CHARS = 8000
+_SUMMARY_MAP_CONCURRENCY = int(os.environ.get("INHOUSE_SUMMARY_CONCURRENCY", "8"))
+
+_TICKET_PAGE_SIZE = 50
+_TICKET_PAGE_SIZE_MAX = 200
+_BOOKING_PAGE_SIZE = 50
+_BOOKING_PAGE_SIZE_MAX = 200
+_MEETING_LOG_PAGE_SIZE = 50
+_MEETING_LOG_PAGE_SIZE_MAX = 200
 
 
 _KOREAN_STOPWORDS = {
@@ -101,6 +141,39 @@ _ENGLISH_STOPWORDS = {
 
 _SECTION_ORDER = ["목표", "범위", "결정", "실행", "리스크", "기타"]
 
+_LINE_BREAKS = re.compile(r"\n+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_TERM_TOKEN = re.compile(r"[A-Za-z]{2,}|[0-9]{2,}|[가-힣]{2,}")
+_ASCII_WORD = re.compile(r"[A-Za-z]+")
+_DIGITS = re.compile(r"[0-9]+")
+_BULLET_PREFIX = re.compile(r"^\s*[-*•]\s*")
+_TITLE_LINE = re.compile(r"(회의|미팅)\s*[:：]\s*(.+)$")
+_DECISION_KEYWORDS = re.compile(r"(결정|하기로|확정|승인|합의|채택|결론)", re.I)
+_DECISION_HEADING = re.compile(r"(결정된\s*사항|결정\s*사항)\s*입니다\.?$")
+_ACTION_KEYWORDS = re.compile(r"(하기로|하자|진행|준비|작성|정리|공유|확인|세팅|설정|테스트|배포|점검|추가)", re.I)
+_ACTION_DUE = re.compile(
+    r"("
+    r"(다음\s*주|이번\s*주)?\s*(월|화|수|목|금|토|일)\s*요일(까지)?"
+    r"|[0-9]{4}[./-][0-9]{1,2}[./-][0-9]{1,2}"
+    r"|[0-9]{1,2}\s*월\s*[0-9]{1,2}\s*일(까지)?"
+    r"|[0-9]{1,2}[./-][0-9]{1,2}([./-][0-9]{1,2})?"
+    r"|내일|모레|오늘"
+    r")"
+)
+_ACTION_OWNER_FIELD = re.compile(r"(담당자|담당)\s*[:：]\s*([A-Za-z가-힣]{2,10})")
+_ACTION_DUE_FIELD = re.compile(r"(기한|마감|due)\s*[:：]\s*(.+)$", re.I)
+_ACTION_TASK_FIELD = re.compile(r"(할\s*일|작업|todo|task)\s*[:：]\s*(.+)$", re.I)
+_ACTION_NATURAL_OWNER = re.compile(r"^([A-Za-z가-힣]{2,10})(?:은|는|이|가)\s+")
+_DUE_SPACES = re.compile(r"\s+")
+_DUE_SUFFIX = re.compile(r"(까지|까지입니다|까지 입니다)$")
+_DUE_MONTH_DAY = re.compile(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일")
+_DUE_SHORT_DATE = re.compile(r"(\d{1,2})[./-](\d{1,2})(?:[./-](\d{1,2}))?")
+_DUE_FULL_DATE = re.compile(r"(\d{4})[./-](\d{1,2})[./-](\d{1,2})")
+_TASK_DATES = re.compile(
+    r"(\d{1,2}\s*월\s*\d{1,2}\s*일\s*까지|\d{4}[./-]\d{1,2}[./-]\d{1,2}|\d{1,2}[./-]\d{1,2}([./-]\d{1,2})?\s*까지?)"
+)
+_TASK_ENDINGS = re.compile(r"(하도록\s*합니다|하기로\s*합니다|하겠습니다|합니다|한다|한다\.)$")
+
 
 def _detect_section_marker(sentence: str) -> str | None:
     s = (sentence or "").strip()
@@ -128,11 +201,12 @@ def _detect_section_marker(sentence: str) -> str | None:
     return None
 
 
-def _group_sentences_by_sections(sentences: list[str]) -> dict[str, list[str]]:
+def _group_sentences_by_sections(sentences: list[str], markers: list[str | None] | None = None) -> dict[str, list[str]]:
+    if markers is None:
+        markers = [_detect_section_marker(sent) for sent in sentences]
     grouped = {k: [] for k in _SECTION_ORDER}
     current = "기타"
-    for sent in sentences:
-        marker = _detect_section_marker(sent)
+    for sent, marker in zip(sentences, markers):
         if marker:
             current = marker
             continue  # 마커 문장은 버린다
@@ -146,13 +220,13 @@ def _split_sentences(text: str) -> list[str]:
     if not cleaned:
         return []
 
-    chunks = re.split(r"\n+", cleaned)
+    chunks = _LINE_BREAKS.split(cleaned)
     sentences: list[str] = []
     for chunk in chunks:
         chunk = chunk.strip()
         if not chunk:
             continue
-        parts = re.split(r"(?<=[.!?])\s+", chunk)
+        parts = _SENTENCE_END.split(chunk)
         for part in parts:
             part = part.strip()
             if part:
@@ -161,78 +235,65 @@ def _split_sentences(text: str) -> list[str]:
     return sentences
 
 
-def _extract_action_items(sentences: list[str]) -> list[dict]:
-    items: list[dict] = []
-    seen = set()
+def _normalize_due(value: str) -> str:
+    due_value = (value or "").strip()
+    if not due_value:
+        return ""
 
-    action_kw = re.compile(r"(하기로|하자|진행|준비|작성|정리|공유|확인|세팅|설정|테스트|배포|점검|추가)", re.I)
-    due_pat = re.compile(
-        r"("
-        r"(다음\s*주|이번\s*주)?\s*(월|화|수|목|금|토|일)\s*요일(까지)?"
-        r"|[0-9]{4}[./-][0-9]{1,2}[./-][0-9]{1,2}"
-        r"|[0-9]{1,2}\s*월\s*[0-9]{1,2}\s*일(까지)?"
-        r"|[0-9]{1,2}[./-][0-9]{1,2}([./-][0-9]{1,2})?"
-        r"|내일|모레|오늘"
-        r")"
-    )
+    due_value = _DUE_SPACES.sub(" ", due_value)
+    due_value = _DUE_SUFFIX.sub("", due_value).strip()
 
-    def normalize_due(value: str) -> str:
-        due_value = (value or "").strip()
-        if not due_value:
-            return ""
+    match = _DUE_MONTH_DAY.search(due_value)
+    if match:
+        m = int(match.group(1))
+        d = int(match.group(2))
+        return f"{m}/{d}"
 
-        due_value = re.sub(r"\s+", " ", due_value)
-        due_value = re.sub(r"(까지|까지입니다|까지 입니다)$", "", due_value).strip()
+    match = _DUE_SHORT_DATE.fullmatch(due_value)
+    if match and match.group(3) is None:
+        m = int(match.group(1))
+        d = int(match.group(2))
+        return f"{m}/{d}"
 
-        match = re.search(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일", due_value)
-        if match:
-            m = int(match.group(1))
-            d = int(match.group(2))
-            return f"{m}/{d}"
+    match = _DUE_FULL_DATE.fullmatch(due_value)
+    if match:
+        y = match.group(1)
+        m = int(match.group(2))
+        d = int(match.group(3))
+        return f"{y}-{m:02d}-{d:02d}"
 
-        match = re.fullmatch(r"(\d{1,2})[./-](\d{1,2})(?:[./-](\d{1,2}))?", due_value)
-        if match and match.group(3) is None:
-            m = int(match.group(1))
-            d = int(match.group(2))
-            return f"{m}/{d}"
+    return due_value
 
-        match = re.fullmatch(r"(\d{4})[./-](\d{1,2})[./-](\d{1,2})", due_value)
-        if match:
-            y = match.group(1)
-            m = int(match.group(2))
-            d = int(match.group(3))
-            return f"{y}-{m:02d}-{d:02d}"
 
-        return due_value
+def _clean_action_task(sentence_text: str, owner: str, due_value: str) -> str:
+    task_value = (sentence_text or "").strip()
 
-    def clean_task(sentence_text: str, owner: str, due_value: str) -> str:
-        task_value = (sentence_text or "").strip()
+    if owner:
+        task_value = re.sub(rf"^{re.escape(owner)}(은|는|이|가)\s+", "", task_value)
 
-        if owner:
-            task_value = re.sub(rf"^{re.escape(owner)}(은|는|이|가)\s+", "", task_value)
+    if due_value and due_value != "미정":
+        task_value = re.sub(rf"\b{re.escape(due_value)}\b", "", task_value)
+    task_value = _TASK_DATES.sub("", task_value)
+
+    task_value = _TASK_ENDINGS.sub("", task_value).strip()
+    task_value = task_value.strip(" .·•-–—")
+    task_value = _DUE_SPACES.sub(" ", task_value).strip()
+    return task_value
 
-        if due_value and due_value != "미정":
-            task_value = re.sub(rf"\b{re.escape(due_value)}\b", "", task_value)
-        task_value = re.sub(
-            r"(\d{1,2}\s*월\s*\d{1,2}\s*일\s*까지|\d{4}[./-]\d{1,2}[./-]\d{1,2}|\d{1,2}[./-]\d{1,2}([./-]\d{1,2})?\s*까지?)",
-            "",
-            task_value,
-        )
 
-        task_value = re.sub(r"(하도록\s*합니다|하기로\s*합니다|하겠습니다|합니다|한다|한다\.)$", "", task_value).strip()
-        task_value = task_value.strip(" .·•-–—")
-        task_value = re.sub(r"\s+", " ", task_value).strip()
-        return task_value
+def _extract_action_items(sentences: list[str]) -> list[dict]:
+    items: list[dict] = []
+    seen = set()
 
     for sentence in sentences:
         s = sentence.strip()
         if not s:
             continue
 
-        owner_match = re.search(r"(담당자|담당)\s*[:：]\s*([A-Za-z가-힣]{2,10})", s)
-        due_match = re.search(r"(기한|마감|due)\s*[:：]\s*(.+)$", s, re.I)
-        task_match = re.search(r"(할\s*일|작업|todo|task)\s*[:：]\s*(.+)$", s, re.I)
-        natural_owner = re.match(r"^([A-Za-z가-힣]{2,10})(?:은|는|이|가)\s+", s)
+        owner_match = _ACTION_OWNER_FIELD.search(s)
+        due_match = _ACTION_DUE_FIELD.search(s)
+        task_match = _ACTION_TASK_FIELD.search(s)
+        natural_owner = _ACTION_NATURAL_OWNER.match(s)
 
         owner = owner_match.group(2).strip() if owner_match else ""
         due = ""
@@ -244,23 +305,23 @@ def _extract_action_items(sentences: list[str]) -> list[dict]:
         if due_match:
             due = due_match.group(2).strip()
         else:
-            m = due_pat.search(s)
+            m = _ACTION_DUE.search(s)
             if m:
                 due = m.group(1).strip()
 
         if not owner and natural_owner:
             owner = natural_owner.group(1).strip()
 
-        due = normalize_due(due)
+        due = _normalize_due(due)
 
         if (owner_match or due_match or task_match) and (task or s):
             task = task or s
         else:
-            if not (action_kw.search(s) or natural_owner):
+            if not (_ACTION_KEYWORDS.search(s) or natural_owner):
                 continue
             task = s
 
-        task = clean_task(task, owner, due)
+        task = _clean_action_task(task, owner, due)
         if not task:
             continue
 
@@ -268,7 +329,6 @@ def _extract_action_items(sentences: list[str]) -> list[dict]:
         if key in seen:
             continue
         seen.add(key)
-
         items.append({"owner": owner or "미정", "task": task[:120], "due": due or "미정"})
 
         if len(items) >= 10:
@@ -277,16 +337,17 @@ def _extract_action_items(sentences: list[str]) -> list[dict]:
     return items
 
 
-def _extract_decisions(sentences: list[str]) -> list[str]:
-    decision_keywords = re.compile(r"(결정|하기로|확정|승인|합의|채택|결론)", re.I)
+def _extract_decisions(sentences: list[str], markers: list[str | None] | None = None) -> list[str]:
+    if markers is None:
+        markers = [_detect_section_marker(sentence) for sentence in sentences]
     decisions: list[str] = []
     seen = set()
-    for sentence in sentences:
-        if _detect_section_marker(sentence):
+    for sentence, marker in zip(sentences, markers):
+        if marker:
             continue
-        if re.search(r"(결정된\s*사항|결정\s*사항)\s*입니다\.?$", (sentence or "").strip()):
+        if _DECISION_HEADING.search((sentence or "").strip()):
             continue
-        if not decision_keywords.search(sentence):
+        if not _DECISION_KEYWORDS.search(sentence):
             continue
         normalized = sentence.strip()
         if normalized and normalized not in seen:
@@ -297,7 +358,7 @@ def _extract_decisions(sentences: list[str]) -> list[str]:
 
 def _pick_title(text: str, sentences: list[str]) -> str:
     for candidate in sentences[:3]:
-        match = re.search(r"(회의|미팅)\s*[:：]\s*(.+)$", candidate)
+        match = _TITLE_LINE.search(candidate)
         if match:
             return match.group(2).strip()[:80]
     first = (sentences[0] if sentences else "").strip()
@@ -306,13 +367,52 @@ def _pick_title(text: str, sentences: list[str]) -> str:
     return "회의 요약"
 
 
+def _term_matrix(sentences: list[str], terms: list[str]):
+    # 문장 x 용어 포함(부분 문자열) 여부. numpy가 있으면 용어마다 전체 텍스트를 한 번만 훑어
+    # 찾은 위치를 문장 번호로 바꾸고, 없으면 문장마다 검사한다
+    if np is None:
+        return [[term in sentence for term in terms] for sentence in sentences]
+
+    matrix = np.zeros((len(sentences), len(terms)), dtype=bool)
+    if not sentences or not terms:
+        return matrix
+    # 용어에는 줄바꿈이 없으므로 "\n"으로 이어 붙여도 문장 경계를 넘는 일치가 생기지 않는다
+    haystack = "\n".join(sentences)
+    starts = np.fromiter(accumulate((len(s) + 1 for s in sentences[:-1]), initial=0), dtype=np.int64)
+    for column, term in enumerate(terms):
+        positions = np.fromiter((m.start() for m in re.finditer(re.escape(term), haystack)), dtype=np.int64)
+        matrix[np.searchsorted(starts, positions, side="right") - 1, column] = True
+    return matrix
+
+
+def _rank_sentences(scores, candidates: list[int], first_seen: list[int], limit: int) -> list[int]:
+    # 점수 내림차순, 같은 점수면 처음 나온 문장 순서. 상위 limit개만 필요하므로 전체를 정렬하지 않는다
+    if np is None:
+        return heapq.nsmallest(limit, candidates, key=lambda i: (-scores[i], first_seen[i], i))
+
+    rows = np.asarray(candidates, dtype=np.int64)
+    if not len(rows):
+        return []
+    n = len(first_seen)
+    keys = (int(scores.max()) - scores[rows]) * n * n + np.asarray(first_seen, dtype=np.int64)[rows] * n + rows
+    if len(rows) > limit:
+        picked = np.argpartition(keys, limit - 1)[:limit]
+        rows, keys = rows[picked], keys[picked]
+    return rows[np.argsort(keys)].tolist()
+
+
 def _summarize_locally_structured(text: str) -> dict:
-    input_text = _truncate_meeting_text(text)
+    return _summarize_sentences_locally(_truncate_meeting_text(text))
+
+
+def _summarize_sentences_locally(input_text: str) -> dict:
+    # 문장 분리와 섹션 마커 판별은 한 번만 하고, 점수 계산은 문장 x 용어 행렬 한 번으로 끝낸다
     sentences = _split_sentences(input_text)
     if not sentences:
         return {"title": "회의 요약", "topics": [], "action_items": [], "overall_summary": ""}
 
-    grouped_sections = _group_sentences_by_sections(sentences)
+    markers = [_detect_section_marker(sentence) for sentence in sentences]
+    grouped_sections = _group_sentences_by_sections(sentences, markers)
     section_non_empty = sum(
         1
         for key in ("목표", "범위", "결정", "실행", "리스크")
@@ -324,11 +424,11 @@ def _summarize_locally_structured(text: str) -> dict:
         t = (sentence_text or "").strip()
         if _detect_section_marker(t):
             return ""
-        t = re.sub(r"^\s*[-*•]\s*", "", t).strip()
+        t = _BULLET_PREFIX.sub("", t).strip()
         t = t.strip(" .·•-–—")
         return t
 
-    def pick_one(sent_list: list[str]) -> str:
+    def pick_one(sent_list) -> str:
         for s in sent_list or []:
             t = clean_bullet(s)
             if t:
@@ -336,21 +436,17 @@ def _summarize_locally_structured(text: str) -> dict:
         return ""
 
     if section_mode:
-        goals = [clean_bullet(s) for s in (grouped_sections.get("목표") or [])]
-        goals = [s for s in goals if s]
-        scope = [clean_bullet(s) for s in (grouped_sections.get("범위") or [])]
-        scope = [s for s in scope if s]
-        risks = [clean_bullet(s) for s in (grouped_sections.get("리스크") or [])]
-        risks = [s for s in risks if s]
-        misc = [clean_bullet(s) for s in (grouped_sections.get("기타") or [])]
-        misc = [s for s in misc if s]
+        def section_bullets(name: str):
+            return (t for t in map(clean_bullet, grouped_sections.get(name) or []) if t)
+
+        goals = list(islice(section_bullets("목표"), 4))
+        scope = list(islice(section_bullets("범위"), 4))
+        risks = list(islice(section_bullets("리스크"), 4))
+        misc = list(islice(section_bullets("기타"), 4))
 
         decisions = []
         seen_decisions = set()
-        for s in grouped_sections.get("결정") or []:
-            t = clean_bullet(s)
-            if not t:
-                continue
+        for t in section_bullets("결정"):
             if t in seen_decisions:
                 continue
             seen_decisions.add(t)
@@ -364,16 +460,16 @@ def _summarize_locally_structured(text: str) -> dict:
 
         topics = []
         if goals:
-            topics.append({"title": "목표", "summary_bullets": goals[:4], "decisions": []})
+            topics.append({"title": "목표", "summary_bullets": goals, "decisions": []})
         if scope:
-            topics.append({"title": "범위", "summary_bullets": scope[:4], "decisions": []})
+            topics.append({"title": "범위", "summary_bullets": scope, "decisions": []})
         if risks:
-            topics.append({"title": "리스크", "summary_bullets": risks[:4], "decisions": []})
+            topics.append({"title": "리스크", "summary_bullets": risks, "decisions": []})
         if misc:
-            topics.append({"title": "기타", "summary_bullets": misc[:4], "decisions": []})
+            topics.append({"title": "기타", "summary_bullets": misc, "decisions": []})
 
         overall_sentences = []
-        for part in (pick_one(goals), pick_one(scope), pick_one(decisions)):
+        for part in (pick_one(section_bullets("목표")), pick_one(section_bullets("범위")), pick_one(decisions)):
             if part:
                 overall_sentences.append(part)
         overall_summary = " ".join(overall_sentences[:3]).strip()
@@ -386,39 +482,40 @@ def _summarize_locally_structured(text: str) -> dict:
             "decisions": decisions[:6],
         }
 
-    tokens = re.findall(r"[A-Za-z]{2,}|[0-9]{2,}|[가-힣]{2,}", input_text)
-    filtered = []
-    for t in tokens:
+    # 토큰은 그대로 세고 정규화/불용어 처리는 서로 다른 토큰마다 한 번만 한다(처음 나온 순서 유지)
+    filtered = Counter()
+    for t, count in Counter(_TERM_TOKEN.findall(input_text)).items():
         lower = t.lower()
-        if lower in _ENGLISH_STOPWORDS:
+        if lower in _ENGLISH_STOPWORDS or t in _KOREAN_STOPWORDS:
             continue
-        if t in _KOREAN_STOPWORDS:
-            continue
-        if len(t) < 2:
-            continue
-        filtered.append(lower if re.fullmatch(r"[A-Za-z]+", t) else t)
-
-    top_terms = [w for w, _ in Counter(filtered).most_common(12) if not re.fullmatch(r"[0-9]+", str(w))]
+        filtered[lower if _ASCII_WORD.fullmatch(t) else t] += count
+    top_terms = [w for w, _ in filtered.most_common(12) if not _DIGITS.fullmatch(str(w))]
     term_weights = {term: 3 if i < 4 else 2 if i < 8 else 1 for i, term in enumerate(top_terms)}
 
-    decisions = _extract_decisions(sentences)
+    decisions = _extract_decisions(sentences, markers)
     action_items = _extract_action_items(sentences)
 
-    def score(sentence: str) -> int:
-        s = sentence.lower()
-        return sum(weight for term, weight in term_weights.items() if term.lower() in s)
+    # 용어는 소문자 영어 또는 한글이라 소문자로 바꾼 문장에서 찾으면 원래 비교와 같다
+    lowered = [s.lower() for s in sentences]
+    hits = _term_matrix(lowered, top_terms)
+    weights = [term_weights[term] for term in top_terms]
+    if np is None:
+        scores = [sum(w for hit, w in zip(row, weights) if hit) for row in hits]
+    else:
+        scores = hits.astype(np.int64) @ np.asarray(weights, dtype=np.int64)
 
     decision_set = set(decisions)
-    scored = []
-    for s in sentences:
-        if s in decision_set:
-            continue
-        if any((ai.get("task") or "") in s for ai in action_items):
-            continue
-        scored.append((score(s), s))
-
-    scored.sort(key=lambda x: (-x[0], sentences.index(x[1])))
-    key_points = [s for _, s in scored[:12]] if scored else sentences[:8]
+    tasks = list(dict.fromkeys(ai.get("task") or "" for ai in action_items))
+    task_hits = _term_matrix(sentences, tasks)
+    first_seen_at: dict[str, int] = {}
+    first_seen = [first_seen_at.setdefault(s, i) for i, s in enumerate(sentences)]
+    has_task = [any(row) for row in task_hits] if np is None else task_hits.any(axis=1).tolist()
+    candidates = [i for i, s in enumerate(sentences) if s not in decision_set and not has_task[i]]
+
+    key_rows = _rank_sentences(scores, candidates, first_seen, 12) if candidates else list(range(min(8, len(sentences))))
+    key_points = [sentences[i] for i in key_rows]
+    key_scores = [int(scores[i]) for i in key_rows]
+    key_hits = [[bool(hit) for hit in hits[i]] for i in key_rows]
 
     overall_pieces = []
     for s in key_points:
@@ -433,37 +530,30 @@ def _summarize_locally_structured(text: str) -> dict:
                 break
     overall_summary = " ".join(overall_pieces).strip()
 
-    def contains_term(sentence: str, term: str) -> bool:
-        if not term:
-            return False
-        if re.fullmatch(r"[A-Za-z]+", term or ""):
-            return term.lower() in sentence.lower()
-        return term in sentence
-
-    grouped: dict[str, list[str]] = {}
-    for sentence in key_points:
-        assigned = None
-        for term in top_terms[:10]:
-            if contains_term(sentence, term):
-                assigned = term
-                break
-        grouped.setdefault(assigned or "기타", []).append(sentence)
+    grouped: dict[str, list[int]] = {}
+    for position, row in enumerate(key_hits):
+        assigned = next((top_terms[j] for j, hit in enumerate(row[:10]) if hit), None)
+        grouped.setdefault(assigned or "기타", []).append(position)
 
-    candidates = []
-    for term, group_sentences in grouped.items():
+    candidates_by_term = []
+    for term, positions in grouped.items():
         if term == "기타":
             continue
-        group_score = sum(score(s) for s in group_sentences)
-        candidates.append((len(group_sentences), group_score, term))
-    candidates.sort(key=lambda x: (-x[0], -x[1]))
+        group_score = sum(key_scores[p] for p in positions)
+        candidates_by_term.append((len(positions), group_score, term))
+    candidates_by_term.sort(key=lambda x: (-x[0], -x[1]))
 
     topics = [{"title": "주요 논의", "summary_bullets": key_points[:10], "decisions": []}]
 
-    for _, __, term in candidates[:3]:
-        group_sentences = grouped.get(term, [])
-        ranked = sorted(group_sentences, key=lambda s: (-score(s), key_points.index(s)))
+    key_first_seen: dict[str, int] = {}
+    for position, s in enumerate(key_points):
+        key_first_seen.setdefault(s, position)
+    for _, __, term in candidates_by_term[:3]:
+        positions = grouped.get(term, [])
+        ranked = sorted(positions, key=lambda p: (-key_scores[p], key_first_seen[key_points[p]]))
         bullets = []
-        for s in ranked:
+        for p in ranked:
+            s = key_points[p]
             if s and s not in bullets:
                 bullets.append(s)
             if len(bullets) >= 5:
@@ -487,7 +577,7 @@ def _summarize_locally_structured(text: str) -> dict:
         topics.append({"title": "실행", "summary_bullets": action_bullets[:10], "decisions": []})
 
     if len(topics) < 3 and grouped.get("기타"):
-        topics.append({"title": "기타", "summary_bullets": grouped.get("기타", [])[:8], "decisions": []})
+        topics.append({"title": "기타", "summary_bullets": [key_points[p] for p in grouped["기타"]][:8], "decisions": []})
 
     for topic in topics:
         topic.setdefault("title", "")
@@ -502,64 +592,59 @@ def _summarize_locally_structured(text: str) -> dict:
     }
 
 
-def _ensure_ffmpeg_in_path():
-    if shutil.which("ffmpeg"):
-        return
-
-    local_app = os.environ.get("LOCALAPPDATA")
-    if not local_app:
-        return
-
-    pattern = os.path.join(
-        local_app,
-        "Microsoft",
-        "WinGet",
-        "Packages",
-        "Gyan.FFmpeg_*",
-        "ffmpeg-*-full_build",
-        "bin",
-        "ffmpeg.exe",
-    )
-    matches = glob.glob(pattern)
-    if not matches:
-        return
-
-    ffmpeg_dir = os.path.dirname(matches[0])
-    os.environ["PATH"] = f"{ffmpeg_dir};{os.environ.get('PATH', '')}"
-
-
 def _current_user_id() -> str:
     return "user_001"
 
 
 def _save_upload(file, folder_name):
+    return _save_upload_hashed(file, folder_name)[0]
+
+
+def _save_upload_hashed(file, folder_name):
+    # 저장하면서 SHA-256을 같이 계산한다(전사 캐시 키). 파일을 다시 읽지 않는다
     if not file or not file.filename:
-        return None
+        return None, None
 
     filename = secure_filename(file.filename)
     if not filename:
-        return None
+        return None, None
 
     upload_dir = os.path.join(BASE_DIR, "app", "static", "uploads", folder_name)
     os.makedirs(upload_dir, exist_ok=True)
     stored_name = f"{int(time.time())}_{filename}"
-    file.save(os.path.join(upload_dir, stored_name))
-    return f"/static/uploads/{folder_name}/{stored_name}"
+    digest = hashlib.sha256()
+    with open(os.path.join(upload_dir, stored_name), "wb") as out:
+        for chunk in iter(lambda: file.stream.read(_UPLOAD_CHUNK_BYTES), b""):
+            digest.update(chunk)
+            out.write(chunk)
+    return f"/static/uploads/{folder_name}/{stored_name}", digest.hexdigest()
 
 
-def _transcribe_audio(audio_path, language="ko"):
-    global _WHISPER_MODEL
+def _file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(_UPLOAD_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _transcribe_audio(audio_path, language="ko", on_progress=None, audio_sha256=None):
     if not audio_path:
         return ""
 
     try:
-        _ensure_ffmpeg_in_path()
-        import whisper
-
-        if _WHISPER_MODEL is None:
-            _WHISPER_MODEL = whisper.load_model("base")
-        result = _WHISPER_MODEL.transcribe(audio_path, language=language)
-        return (result.get("text") or "").strip()
+        # 같은 바이트의 녹음을 같은 모델/언어로 전사한 적이 있으면 Whisper를 돌리지 않는다
+        audio_sha256 = audio_sha256 or _file_sha256(audio_path)
+        model = speech.model_name()
+        cached = fetch_cached_transcript(audio_sha256, model, language)
+        if cached is not None:
+            return cached
+        transcript = speech.transcribe(audio_path, language=language, on_progress=on_progress)
+        if transcript:
+            store_cached_transcript(audio_sha256, model, language, transcript)
+        return transcript
+    except JobLeaseLost:
+        raise
     except Exception as exc:
         print(f"[nota-space] whisper failed: {exc}")
         return ""
@@ -604,6 +689,22 @@ def _truncate_meeting_text(text: str, max_chars: int = 14000) -> str:
     return f"{head}\n\n...(중간 내용 생략됨)...\n\n{tail}"
 
 
+def _gemini_model_name() -> str:
+    model_name = os.environ.get("GEMINI_MODEL", "models/gemini-flash-latest")
+    if not model_name.startswith("models/"):
+        model_name = f"models/{model_name}"
+    return model_name
+
+
+def _summary_cache_key(text: str, model_name: str) -> str | None:
+    # 긴 회의도 청크로 나눠 전부 요약하므로 전체 텍스트 기준. 공백 차이만 있는 텍스트는 같은 키가 된다
+    input_text = " ".join((text or "").split())
+    if not input_text:
+        return None
+    raw = f"{_SUMMARY_PROMPT_VERSION}\n{model_name}\n{input_text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 def _summarize_with_gemini(text: str) -> tuple[dict | None, str | None, str | None]:
     input_text = _truncate_meeting_text(text)
     if not input_text:
@@ -617,20 +718,10 @@ def _summarize_with_gemini(text: str) -> tuple[dict | None, str | None, str | No
             "서버에 GOOGLE_API_KEY(또는 GEMINI_API_KEY)가 설정되지 않았습니다. (instance/.env 또는 환경변수 확인)",
         )
 
-    if genai is None:
+    if gemini.genai is None:
         return None, "GEMINI_SDK_MISSING", "google-generativeai 패키지가 설치되지 않았습니다. (requirements.txt 확인)"
 
     try:
-        genai.configure(api_key=api_key)
-        model_name = os.environ.get("GEMINI_MODEL", "models/gemini-flash-latest")
-        if not model_name.startswith("models/"):
-            model_name = f"models/{model_name}"
-
-        model = genai.GenerativeModel(
-            model_name,
-            generation_config={"response_mime_type": "application/json"},
-        )
-
         system_prompt = (
             "너는 회의록 요약 전문가다. 입력된 텍스트는 STT 결과물이라 오타가 많으니 문맥을 파악해 정제해라.\n"
             "다음 JSON 구조를 엄격히 지켜서 출력해라:\n"
@@ -646,8 +737,10 @@ def _summarize_with_gemini(text: str) -> tuple[dict | None, str | None, str | No
             "}\n"
         )
 
-        response = model.generate_content(f"{system_prompt}\n\n[회의 내용]\n{input_text}")
-        output_text = (getattr(response, "text", None) or "").strip()
+        # 클라이언트는 프로세스 전역으로 재사용되며, deadline/재시도/서킷 브레이커를 거친다
+        output_text = gemini.get_client().generate_text(
+            f"{system_prompt}\n\n[회의 내용]\n{input_text}", model_name=_gemini_model_name(), api_key=api_key
+        )
 
         if output_text.startswith("```"):
             output_text = re.sub(r"^```[a-zA-Z]*\n?", "", output_text).strip()
@@ -657,8 +750,13 @@ def _summarize_with_gemini(text: str) -> tuple[dict | None, str | None, str | No
         if not isinstance(parsed, dict):
             return None, "GEMINI_INVALID_RESPONSE", "Gemini 응답을 파싱하지 못했습니다."
         return parsed, None, None
+    except gemini.CircuitOpenError as exc:
+        return None, "GEMINI_CIRCUIT_OPEN", str(exc)
+    except gemini.GeminiTimeout as exc:
+        logger.warning("Gemini 요약 시간 초과: %s", exc)
+        return None, "GEMINI_TIMEOUT", str(exc)
     except Exception as exc:
-        print(f"❌ Gemini 요약 실패: {exc}")
+        logger.warning("Gemini 요약 실패: %s", exc)
         return None, "GEMINI_ERROR", str(exc)
 
 
@@ -720,6 +818,106 @@ def _render_summary_text(summary: dict) -> str:
     lines.append(overall_summary)
     return "\n".join(lines).strip()
 
+
+def _summarize_locally_backend(text: str) -> tuple[dict | None, str | None, str | None]:
+    return _summarize_locally_structured(text), None, None
+
+
+# 청크 요약에 쓸 백엔드. 앞에서부터 시도하고 실패하면 다음 것으로 넘어간다
+_SUMMARY_BACKENDS = (
+    ("gemini", _summarize_with_gemini),
+    ("local", _summarize_locally_backend),
+)
+
+
+def _split_summary_chunks(text: str, max_chars: int = _SUMMARY_CHUNK_CHARS) -> list[str]:
+    chunks: list[str] = []
+    current: list[str] = []
+    size = 0
+    for sentence in _split_sentences(text):
+        # 구두점 없이 길게 이어진 STT 문장은 글자 수로 자른다
+        pieces = [sentence[i : i + max_chars] for i in range(0, len(sentence), max_chars)]
+        for piece in pieces:
+            if current and size + len(piece) + 1 > max_chars:
+                chunks.append("\n".join(current))
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def _summarize_chunk(chunk: str) -> dict:
+    errors = []
+    for name, backend in _SUMMARY_BACKENDS:
+        summary, error_code, error_message = backend(chunk)
+        if summary:
+            return {"summary": summary, "source": name, "errors": errors}
+        errors.append((error_code, error_message))
+    return {"summary": None, "source": None, "errors": errors}
+
+
+def _merge_partial_summaries(partials: list[dict]) -> dict:
+    title = ""
+    topics: dict[str, dict] = {}
+    decisions: list[str] = []
+    action_items: list[dict] = []
+    seen_actions = set()
+    overall_parts: list[str] = []
+
+    def extend_unique(target: list, values) -> None:
+        for value in values or []:
+            if value and value not in target:
+                target.append(value)
+
+    for partial in partials:
+        partial_title = (partial.get("title") or "").strip()
+        if not title and partial_title != "회의 요약":
+            title = partial_title
+        for topic in partial.get("topics") or []:
+            topic_title = ((topic or {}).get("title") or "기타").strip()
+            merged = topics.setdefault(
+                " ".join(topic_title.lower().split()),
+                {"title": topic_title, "summary_bullets": [], "decisions": []},
+            )
+            extend_unique(merged["summary_bullets"], topic.get("summary_bullets"))
+            extend_unique(merged["decisions"], topic.get("decisions"))
+        extend_unique(decisions, partial.get("decisions"))
+        for item in partial.get("action_items") or []:
+            key = ((item or {}).get("owner") or "", ((item or {}).get("task") or "").strip())
+            if key[1] and key not in seen_actions:
+                seen_actions.add(key)
+                action_items.append(item)
+        extend_unique(overall_parts, [(partial.get("overall_summary") or "").strip()])
+
+    merged_summary = {
+        "title": title or "회의 요약",
+        "topics": list(topics.values()),
+        "action_items": action_items,
+        "overall_summary": " ".join(overall_parts),
+    }
+    if decisions:
+        merged_summary["decisions"] = decisions
+    return merged_summary
+
+
+def _summarize_map_reduce(text: str) -> tuple[dict, list[str], list[tuple]]:
+    # 긴 회의는 앞뒤만 남기고 자르지 않고, 청크별 요약을 동시에 받아 하나로 합친다.
+    # 청크 수가 동시 실행 한도 이내면 전체 지연은 단일 호출 한 번과 비슷하다
+    # 청크가 동시 실행 한도를 넘지 않도록 크기를 늘리되, 한 번에 보낼 수 있는 길이는 넘지 않는다
+    chunk_chars = len(text) * 115 // (100 * _SUMMARY_MAP_CONCURRENCY)
+    chunks = _split_summary_chunks(text, min(_SUMMARY_SINGLE_CALL_CHARS, max(_SUMMARY_CHUNK_CHARS, chunk_chars)))
+    workers = max(1, min(_SUMMARY_MAP_CONCURRENCY, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summary-map") as pool:
+        results = list(pool.map(_summarize_chunk, chunks))
+
+    sources = [result["source"] for result in results if result["summary"]]
+    errors = [error for result in results for error in result["errors"] if error[0]]
+    merged = _merge_partial_summaries([result["summary"] for result in results if result["summary"]])
+    return merged, sources, errors
+
+
 @bp.get("/")
 def home():
     return redirect(url_for("inhouse_service.service_desk"))
@@ -884,8 +1082,8 @@ def create_idea_comment_api(idea_id):
     else:
         rating_value = None
 
-    add_idea_comment(idea_id, author, comment, rating_value)
-    return jsonify({"success": True}), 201
+    _, rating_avg, rating_count = add_idea_comment(idea_id, author, comment, rating_value)
+    return jsonify({"success": True, "rating": rating_avg, "rating_count": rating_count}), 201
 
 
 @bp.get("/api/service-desk/summary")
@@ -899,10 +1097,23 @@ def get_service_desk_requests():
     category = request.args.get("category") or None
     status = request.args.get("status") or None
     q = request.args.get("q") or None
-    sort = request.args.get("sort") or "newest"
+    # 검색어가 있고 정렬을 지정하지 않았으면 관련도(BM25) 순으로 보여준다
+    sort = request.args.get("sort") or ("relevance" if q else "newest")
+    cursor = request.args.get("cursor") or None
 
-    tickets = fetch_tickets(category=category, status=status, q=q, sort=sort)
-    return jsonify({"requests": tickets})
+    try:
+        limit = int(request.args.get("limit") or _TICKET_PAGE_SIZE)
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), 400
+    limit = max(1, min(limit, _TICKET_PAGE_SIZE_MAX))
+
+    try:
+        tickets, next_cursor = fetch_tickets_page(
+            category=category, status=status, q=q, sort=sort, limit=limit, cursor=cursor
+        )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    return jsonify({"requests": tickets, "next_cursor": next_cursor})
 
 
 @bp.post("/api/service-desk/requests")
@@ -955,10 +1166,68 @@ def nota_space_rooms():
     return jsonify({"rooms": fetch_rooms()})
 
 
+@bp.get("/api/nota-space/rooms/available")
+def nota_space_available_rooms():
+    date_from = request.args.get("from") or request.args.get("date")
+    date_to = request.args.get("to") or date_from
+    if not date_from:
+        return jsonify({"error": "from is required"}), 400
+
+    try:
+        duration = int(request.args.get("duration", "60"))
+        capacity = int(request.args["capacity"]) if request.args.get("capacity") else None
+    except ValueError:
+        return jsonify({"error": "Invalid duration or capacity"}), 400
+
+    try:
+        rooms = find_available_rooms(
+            date_from,
+            date_to,
+            duration,
+            capacity=capacity,
+            room_type=request.args.get("room_type") or None,
+            window_start=request.args.get("start_time") or "09:00",
+            window_end=request.args.get("end_time") or "18:00",
+        )
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    return jsonify({"from": date_from, "to": date_to, "duration": duration, "rooms": rooms})
+
+
 @bp.get("/api/nota-space/bookings")
 def nota_space_bookings():
     if request.args.get("all"):
-        return jsonify({"bookings": fetch_all_bookings()})
+        export_format = request.args.get("format")
+        if export_format:
+            if export_format not in {"ndjson", "csv"}:
+                return jsonify({"error": "Invalid format"}), 400
+            return _booking_export_response(export_format)
+        if "limit" not in request.args and "cursor" not in request.args:
+            # 예전 클라이언트 호환: limit/cursor 없이 all=1이면 전체 목록을 예전과 같은 모양으로 준다
+            return _booking_list_response()
+
+        try:
+            limit = int(request.args.get("limit") or _BOOKING_PAGE_SIZE)
+        except ValueError:
+            return jsonify({"error": "Invalid limit"}), 400
+        limit = max(1, min(limit, _BOOKING_PAGE_SIZE_MAX))
+
+        try:
+            bookings, next_cursor = fetch_bookings_page(limit=limit, cursor=request.args.get("cursor") or None)
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+        return jsonify({"bookings": bookings, "next_cursor": next_cursor})
+
+    date_from = request.args.get("from")
+    if date_from:
+        date_to = request.args.get("to") or date_from
+        try:
+            room_id = int(request.args["room_id"]) if request.args.get("room_id") else None
+            bookings = fetch_bookings_range(date_from, date_to, room_id=room_id)
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+        return jsonify({"from": date_from, "to": date_to, "bookings": bookings})
 
     month_value = request.args.get("month")
     if month_value:
@@ -968,12 +1237,58 @@ def nota_space_bookings():
     if not date_value:
         date_value = datetime.now().strftime("%Y-%m-%d")
 
-    return jsonify({"date": date_value, "bookings": fetch_bookings(date_value)})
+    try:
+        fields = parse_meeting_log_fields(request.args.get("fields"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    return jsonify({"date": date_value, "bookings": fetch_bookings(date_value, fields=fields)})
+
+
+def _booking_list_response():
+    # {"bookings": [...]}를 한 건씩 흘려보낸다(전체 목록을 메모리에 올리지 않는다)
+    def generate():
+        yield '{"bookings": ['
+        for index, booking in enumerate(iter_all_bookings()):
+            yield ("," if index else "") + json.dumps(booking, ensure_ascii=False)
+        yield "]}\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
+def _booking_export_response(export_format):
+    # 전체 예약을 한 번에 메모리에 올리지 않고 한 줄씩 흘려보낸다
+    if export_format == "csv":
+        def generate():
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=BOOKING_EXPORT_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            yield "\ufeff" + buffer.getvalue()
+            for booking in iter_all_bookings():
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerow(booking)
+                yield buffer.getvalue()
+
+        mimetype = "text/csv"
+    else:
+        def generate():
+            for booking in iter_all_bookings():
+                yield json.dumps(booking, ensure_ascii=False) + "\n"
+
+        mimetype = "application/x-ndjson"
+
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers["Content-Disposition"] = f'attachment; filename="bookings.{export_format}"'
+    return response
 
 
 @bp.get("/api/nota-space/bookings/<int:booking_id>")
 def nota_space_booking_detail(booking_id):
-    booking = fetch_booking_by_id(booking_id)
+    try:
+        fields = parse_meeting_log_fields(request.args.get("fields"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    booking = fetch_booking_by_id(booking_id, fields=fields)
     if not booking:
         return jsonify({"error": "Booking not found"}), 404
     return jsonify({"booking": booking})
@@ -981,18 +1296,138 @@ def nota_space_booking_detail(booking_id):
 
 @bp.get("/api/nota-space/meeting-logs")
 def nota_space_meeting_logs():
-    logs = fetch_meeting_logs()
-    return jsonify({"logs": logs})
+    try:
+        limit = int(request.args.get("limit") or _MEETING_LOG_PAGE_SIZE)
+    except ValueError:
+        return jsonify({"error": "Invalid limit"}), 400
+    limit = max(1, min(limit, _MEETING_LOG_PAGE_SIZE_MAX))
+
+    try:
+        fields = parse_meeting_log_fields(request.args.get("fields"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    try:
+        logs, next_cursor = fetch_meeting_logs_page(
+            room=request.args.get("room") or None,
+            author=request.args.get("author") or None,
+            date_from=request.args.get("from") or None,
+            date_to=request.args.get("to") or None,
+            limit=limit,
+            cursor=request.args.get("cursor") or None,
+            fields=fields,
+        )
+    except ValueError:
+        return jsonify({"error": "Invalid cursor"}), 400
+    return jsonify({"logs": logs, "next_cursor": next_cursor})
 
 
 @bp.get("/api/nota-space/meeting-logs/<int:log_id>")
 def nota_space_meeting_log_detail(log_id):
-    log = fetch_meeting_log_by_id(log_id)
+    try:
+        fields = parse_meeting_log_fields(request.args.get("fields"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    log = fetch_meeting_log_by_id(log_id, fields=fields)
     if not log:
         return jsonify({"error": "Meeting log not found"}), 404
     return jsonify({"log": log})
 
 
+@bp.get("/api/nota-space/meeting-logs/<int:log_id>/content")
+def nota_space_meeting_log_content(log_id):
+    # notes/transcript/summary 본문 전용. fields 없이 부르면 세 컬럼을 모두 준다
+    try:
+        fields = parse_meeting_log_fields(request.args.get("fields"))
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    content = fetch_meeting_log_content(log_id, fields=fields)
+    if not content:
+        return jsonify({"error": "Meeting log not found"}), 404
+    return jsonify({"content": content})
+
+
+def _combine_meeting_text(notes: str, transcript: str) -> str:
+    combined_parts = []
+    if notes:
+        combined_parts.append(notes)
+    if transcript:
+        combined_parts.append(f"녹음 텍스트:\n{transcript}")
+    return "\n\n".join(combined_parts)
+
+
+def _transcribe_job_audio(audio_path, ctx, progress: float, progress_end: float = 0.6, audio_sha256=None) -> str:
+    if not audio_path:
+        return ""
+    ctx.progress(progress, "녹음 파일을 텍스트로 변환하는 중")
+    absolute_audio = os.path.join(BASE_DIR, "app", audio_path.lstrip("/"))
+
+    # 긴 녹음은 청크 단위로 나눠 전사되므로 청크가 끝날 때마다 진행률을 올린다
+    def on_progress(done, total):
+        ctx.progress(
+            progress + (progress_end - progress) * done / total,
+            f"녹음 파일을 텍스트로 변환하는 중 ({done}/{total})",
+        )
+
+    return _transcribe_audio(absolute_audio, on_progress=on_progress, audio_sha256=audio_sha256)
+
+
+@job_handler("meeting_summary")
+def _run_meeting_summary_job(payload, ctx):
+    transcript = _transcribe_job_audio(payload.get("audio_path"), ctx, 0.1, audio_sha256=payload.get("audio_sha256"))
+    combined_text = _combine_meeting_text(payload.get("meeting_text") or "", transcript)
+    if not combined_text.strip():
+        raise PermanentJobError("녹음 텍스트를 추출하지 못했습니다.")
+
+    ctx.progress(0.6, "요약을 생성하는 중")
+    return _summarize_meeting_text(combined_text)
+
+
+@job_handler("meeting_log")
+def _run_meeting_log_job(payload, ctx):
+    log_id = payload["log_id"]
+    transcript = _transcribe_job_audio(payload.get("audio_path"), ctx, 0.1, audio_sha256=payload.get("audio_sha256"))
+    if transcript:
+        update_meeting_log_content(log_id, transcript=transcript)
+
+    summary = payload.get("summary") or ""
+    if not summary:
+        ctx.progress(0.6, "요약을 생성하는 중")
+        combined_text = _combine_meeting_text(payload.get("notes") or "", transcript)
+        # 미리보기(meeting-summary)에서 같은 텍스트를 요약했다면 캐시에서 바로 나온다
+        summary = _summarize_meeting_text(combined_text)["summary"] if combined_text.strip() else ""
+        update_meeting_log_content(log_id, summary=summary or None)
+
+    return {"log_id": log_id, "booking_id": payload.get("booking_id"), "summary": summary}
+
+
+def _enqueue_job(kind: str, payload: dict) -> int:
+    job_id = enqueue_job(kind, payload)
+    notify_workers()
+    return job_id
+
+
+@bp.get("/api/nota-space/jobs/<int:job_id>")
+def nota_space_job_status(job_id):
+    job = fetch_job(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify({"job": job})
+
+
+@bp.get("/api/nota-space/transcription/status")
+def nota_space_transcription_status():
+    # 로드밸런서 readiness 확인용. 모델 로드/워밍업이 끝나기 전에는 503
+    status = speech.status()
+    return jsonify(status), (200 if status["ready"] else 503)
+
+
+@bp.get("/api/nota-space/summary/status")
+def nota_space_summary_status():
+    # Gemini 호출 지연(p50/p95/p99), 재시도/타임아웃 횟수와 서킷 브레이커 상태
+    return jsonify(gemini.get_client().status())
+
+
 @bp.post("/api/nota-space/meeting-summary")
 def nota_space_meeting_summary():
     meeting_text = (request.form.get("meeting_text") or "").strip()
@@ -1001,51 +1436,91 @@ def nota_space_meeting_summary():
     if not meeting_text and not (audio_file and audio_file.filename):
         return jsonify({"error": "회의 내용 또는 녹음 파일을 추가하세요."}), 400
 
-    audio_path = None
-    transcript = ""
-    if audio_file and audio_file.filename:
-        audio_path = _save_upload(audio_file, "nota_space")
-        if audio_path:
-            absolute_audio = os.path.join(BASE_DIR, "app", audio_path.lstrip("/"))
-            transcript = _transcribe_audio(absolute_audio)
+    audio_path, audio_sha256 = _save_upload_hashed(audio_file, "nota_space")
 
-    combined_parts = []
-    if meeting_text:
-        combined_parts.append(meeting_text)
-    if transcript:
-        combined_parts.append(f"녹음 텍스트:\n{transcript}")
-    combined_text = "\n\n".join(combined_parts)
-    if not combined_text.strip():
-        return jsonify({"error": "녹음 텍스트를 추출하지 못했습니다."}), 400
+    # 전사/요약은 몇 분씩 걸릴 수 있어 작업 큐로 넘기고 바로 job id를 돌려준다
+    job_id = _enqueue_job(
+        "meeting_summary",
+        {"meeting_text": meeting_text, "audio_path": audio_path, "audio_sha256": audio_sha256},
+    )
+    return jsonify({"job_id": job_id, "status_url": url_for("inhouse_service.nota_space_job_status", job_id=job_id)}), 202
+
+
+def _summarize_meeting_text(combined_text: str) -> dict:
+    model_name = _gemini_model_name()
+    cache_key = _summary_cache_key(combined_text, model_name)
+    cached = fetch_cached_summary(cache_key) if cache_key else None
+    if cached:
+        response = {
+            "summary": cached["summary_text"],
+            "summary_json": cached["summary_json"],
+            "summary_source": cached["source"],
+            "summary_cached": True,
+        }
+        if cached["warning"]:
+            response["summary_warning"] = cached["warning"]
+        return response
+
+    response = _summarize_meeting_text_uncached(combined_text)
+    if cache_key:
+        store_cached_summary(
+            cache_key,
+            model_name,
+            _SUMMARY_PROMPT_VERSION,
+            response["summary_source"],
+            response["summary_json"],
+            response["summary"],
+            warning=response.get("summary_warning"),
+            ttl_seconds=_SUMMARY_FALLBACK_TTL_SECONDS if response["summary_source"] == "local" else None,
+        )
+    return response
+
+
+def _summarize_meeting_text_uncached(combined_text: str) -> dict:
+    logger.info("Gemini 요약 요청 (텍스트 길이: %d)", len(combined_text))
 
-    print(f"🚀 Gemini 요약 요청 시작! (텍스트 길이: {len(combined_text)})")
+    if len(combined_text.strip()) > _SUMMARY_SINGLE_CALL_CHARS:
+        return _summarize_long_meeting_text(combined_text)
 
     result, summary_error, summary_error_message = _summarize_with_gemini(combined_text)
     if not result:
-        print("\n" + "!" * 50)
-        print("❌ Gemini 요약 실패! 원인을 확인하세요.")
-        print(f"👉 에러 코드: {summary_error}")
-        print(f"👉 에러 메시지: {summary_error_message}")
-        print("!" * 50 + "\n")
+        logger.warning("Gemini 요약 실패, 로컬 요약으로 대체 (%s: %s)", summary_error, summary_error_message)
 
         local_summary = _summarize_locally_structured(combined_text)
         summary_text = _render_summary_text(local_summary)
-        return jsonify(
-            {
-                "summary": summary_text,
-                "summary_json": local_summary,
-                "summary_source": "local",
-                "summary_warning": (
-                    f"AI 요약 실패({summary_error}): {summary_error_message}. 로컬 알고리즘으로 대체됨."
-                    if (summary_error or summary_error_message)
-                    else "AI 요약이 불가하여 로컬 요약으로 대체했습니다."
-                ),
-            }
-        )
+        return {
+            "summary": summary_text,
+            "summary_json": local_summary,
+            "summary_source": "local",
+            "summary_warning": (
+                f"AI 요약 실패({summary_error}): {summary_error_message}. 로컬 알고리즘으로 대체됨."
+                if (summary_error or summary_error_message)
+                else "AI 요약이 불가하여 로컬 요약으로 대체했습니다."
+            ),
+        }
 
-    print("✅ Gemini 요약 성공!")
+    logger.info("Gemini 요약 성공")
     summary_text = _render_summary_text(result)
-    return jsonify({"summary": summary_text, "summary_json": result, "summary_source": "gemini"})
+    return {"summary": summary_text, "summary_json": result, "summary_source": "gemini"}
+
+
+def _summarize_long_meeting_text(combined_text: str) -> dict:
+    summary, sources, errors = _summarize_map_reduce(combined_text)
+    local_chunks = sources.count("local")
+    logger.info("청크 요약 완료 (청크 %d개, 로컬 대체 %d개)", len(sources), local_chunks)
+
+    response = {
+        "summary": _render_summary_text(summary),
+        "summary_json": summary,
+        "summary_source": "local" if local_chunks == len(sources) else "gemini",
+    }
+    if local_chunks:
+        summary_error, summary_error_message = errors[0] if errors else (None, None)
+        replaced = "로컬 알고리즘으로 대체됨." if local_chunks == len(sources) else (
+            f"일부 구간({local_chunks}/{len(sources)})은 로컬 알고리즘으로 대체됨."
+        )
+        response["summary_warning"] = f"AI 요약 실패({summary_error}): {summary_error_message}. {replaced}"
+    return response
 
 
 
@@ -1063,7 +1538,13 @@ def create_nota_space_booking():
     if not all([room_id, date_value, start_time, end_time, agenda, presenter]):
         return jsonify({"error": "All fields are required"}), 400
 
-    if start_time >= end_time:
+    try:
+        start_min = minute_of_day(start_time)
+        end_min = minute_of_day(end_time)
+    except ValueError:
+        return jsonify({"error": "Invalid time"}), 400
+
+    if start_min >= end_min:
         return jsonify({"error": "End time must be later than start time"}), 400
 
     try:
@@ -1071,12 +1552,10 @@ def create_nota_space_booking():
     except ValueError:
         return jsonify({"error": "Invalid room"}), 400
 
-    if has_booking_conflict(room_id_value, date_value, start_time, end_time):
-        return jsonify({"error": "Time slot already booked"}), 409
-
     participants = [name.strip() for name in participants_raw.split(",") if name.strip()]
 
-    booking_id = create_booking(
+    # 겹침 검사와 저장을 한 트랜잭션에서 처리하므로 동시 요청이 같은 시간대를 이중 예약하지 못한다
+    booking_id = book_room(
         {
             "room_id": room_id_value,
             "date": date_value,
@@ -1087,6 +1566,8 @@ def create_nota_space_booking():
             "participants": participants,
         }
     )
+    if booking_id is None:
+        return jsonify({"error": "Time slot already booked"}), 409
 
     return jsonify({"id": booking_id}), 201
 
@@ -1121,33 +1602,13 @@ def create_nota_space_meeting_log():
         if not fetch_booking_by_id(booking_id_value):
             return jsonify({"error": "Booking not found"}), 404
 
-    audio_path = None
-    transcript = ""
-    if audio_file and audio_file.filename:
-        audio_path = _save_upload(audio_file, "nota_space")
-        if audio_path:
-            absolute_audio = os.path.join(BASE_DIR, "app", audio_path.lstrip("/"))
-            transcript = _transcribe_audio(absolute_audio)
+    audio_path, audio_sha256 = _save_upload_hashed(audio_file, "nota_space")
 
-    combined_parts = []
-    if notes:
-        combined_parts.append(notes)
-    if transcript:
-        combined_parts.append(f"녹음 텍스트:\n{transcript}")
-    combined_text = "\n\n".join(combined_parts)
-
-    if not summary:
-        result, _, _ = _summarize_with_gemini(combined_text)
-        if not result:
-            result = _summarize_locally_structured(combined_text)
-        summary = _render_summary_text(result) if result else ""
-
-
-    updated_at = upsert_meeting_log_entry(
+    log_id, updated_at = save_meeting_log_entry(
         booking_id_value,
         notes or None,
         audio_path,
-        transcript or None,
+        None,
         summary or None,
         title=title or None,
         author=author or None,
@@ -1157,4 +1618,20 @@ def create_nota_space_meeting_log():
         room_name=room_name,
     )
 
-    return jsonify({"booking_id": booking_id_value, "summary": summary, "updated_at": updated_at}), 201
+    response = {"booking_id": booking_id_value, "log_id": log_id, "summary": summary, "updated_at": updated_at}
+    if not audio_path and summary:
+        return jsonify(response), 201
+
+    # 전사나 요약이 필요하면 로그는 먼저 저장해 두고 나머지는 작업 큐에서 채운다
+    response["job_id"] = _enqueue_job(
+        "meeting_log",
+        {
+            "log_id": log_id,
+            "booking_id": booking_id_value,
+            "notes": notes,
+            "audio_path": audio_path,
+            "audio_sha256": audio_sha256,
+            "summary": summary,
+        },
+    )
+    return jsonify(response), 202
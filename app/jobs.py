@@ -0,0 +1,183 @@
+# 작업 큐 워커. 웹 프로세스 안의 스레드 풀로도, `flask jobs-worker`로 별도 프로세스로도 돌린다.
+# 작업을 가져가는 것(claim)은 db.claim_job이 원자적으로 처리하므로 워커 수/프로세스 수에 제한이 없다.
+
+import logging
+import os
+import threading
+
+from .db import (
+    JOB_LEASE_SECONDS,
+    claim_job,
+    complete_job,
+    fail_job,
+    job_worker_id,
+    renew_job_lease,
+    report_job_progress,
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS_DEFAULT = 2
+JOB_POLL_INTERVAL = float(os.environ.get("INHOUSE_JOB_POLL_INTERVAL", "1.0"))
+
+_HANDLERS = {}
+
+
+# 재시도해도 결과가 같은 실패(입력 오류 등). 바로 failed 처리한다
+class PermanentJobError(Exception):
+    pass
+
+
+# 임대가 만료되어 다른 워커가 작업을 가져갔다
+class JobLeaseLost(Exception):
+    pass
+
+
+def job_handler(kind):
+    def decorator(func):
+        _HANDLERS[kind] = func
+        return func
+
+    return decorator
+
+
+class JobContext:
+    def __init__(self, job, worker_id, lease_lost=None):
+        self.job_id = job["id"]
+        self.attempt = job["attempts"]
+        self.worker_id = worker_id
+        self.lease_lost = lease_lost or threading.Event()
+
+    def progress(self, fraction, message=None):
+        if self.lease_lost.is_set() or not report_job_progress(self.job_id, self.worker_id, fraction, message):
+            raise JobLeaseLost(f"job {self.job_id} lease lost")
+
+
+class _LeaseHeartbeat:
+    # 핸들러가 progress를 부르지 않고 오래 걸려도(긴 Whisper 호출 등) 임대가 만료되지 않도록
+    # 실행 중에는 lease/3마다 임대를 연장한다. 연장이 0행이면 임대를 뺏긴 것이니 멈추고 lost를 세운다
+    def __init__(self, job_id, worker_id, lease_seconds=JOB_LEASE_SECONDS):
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.lost = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"job-lease-{job_id}", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        return False
+
+    def _run(self):
+        while not self._stop.wait(self.lease_seconds / 3):
+            try:
+                renewed = renew_job_lease(self.job_id, self.worker_id, self.lease_seconds)
+            except Exception as exc:
+                # DB가 잠깐 잠겨 있었을 수 있다. 임대가 남아 있는 동안 다음 차례에 다시 시도한다
+                logger.warning("job #%s lease renewal failed, retrying: %s", self.job_id, exc)
+                continue
+            if not renewed:
+                self.lost.set()
+                return
+
+
+def run_one(worker_id=None, kinds=None) -> bool:
+    # 작업 하나를 가져와 실행한다. 가져올 작업이 없으면 False
+    worker_id = worker_id or job_worker_id()
+    job = claim_job(worker_id, kinds=kinds or list(_HANDLERS), lease_seconds=JOB_LEASE_SECONDS)
+    if job is None:
+        return False
+
+    handler = _HANDLERS.get(job["kind"])
+    if handler is None:
+        fail_job(job["id"], worker_id, f"no handler for {job['kind']}", retry=False)
+        return True
+
+    try:
+        with _LeaseHeartbeat(job["id"], worker_id) as heartbeat:
+            result = handler(job["payload"], JobContext(job, worker_id, heartbeat.lost))
+        if heartbeat.lost.is_set():
+            raise JobLeaseLost(f"job {job['id']} lease lost")
+    except JobLeaseLost:
+        return True
+    except PermanentJobError as exc:
+        fail_job(job["id"], worker_id, str(exc), retry=False)
+    except Exception as exc:
+        logger.exception("job %s #%s failed (attempt %s)", job["kind"], job["id"], job["attempts"])
+        fail_job(job["id"], worker_id, f"{type(exc).__name__}: {exc}")
+    else:
+        complete_job(job["id"], worker_id, result)
+    return True
+
+
+class JobWorkerPool:
+    def __init__(self, size=JOB_WORKERS_DEFAULT, poll_interval=JOB_POLL_INTERVAL, kinds=None):
+        self.size = size
+        self.poll_interval = poll_interval
+        self.kinds = kinds
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads = []
+
+    def start(self):
+        for index in range(self.size):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def wake(self):
+        self._wake.set()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+    def _run(self):
+        worker_id = job_worker_id()
+        while not self._stop.is_set():
+            try:
+                worked = run_one(worker_id, kinds=self.kinds)
+            except Exception:
+                logger.exception("job worker loop failed")
+                worked = False
+            if not worked:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+
+_POOL = None
+_POOL_PID = None
+_POOL_LOCK = threading.Lock()
+
+
+def ensure_worker_pool():
+    # 웹 프로세스에서는 첫 작업이 들어올 때 워커 스레드를 띄운다(INHOUSE_JOB_WORKERS=0이면 외부 워커에 맡김)
+    global _POOL, _POOL_PID
+    # instance/.env는 create_app에서 읽히므로 import 시점이 아니라 여기서 확인한다
+    size = int(os.environ.get("INHOUSE_JOB_WORKERS", str(JOB_WORKERS_DEFAULT)))
+    if size <= 0:
+        return None
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_PID != os.getpid():
+            _POOL = JobWorkerPool(size=size).start()
+            _POOL_PID = os.getpid()
+    return _POOL
+
+
+def notify_workers():
+    pool = ensure_worker_pool()
+    if pool is not None:
+        pool.wake()
@@ -0,0 +1,399 @@
+# Whisper 모델 관리. 모델 로드와 워밍업을 앱 시작 시점에 끝내 두면 첫 업로드도 평소 속도로 전사된다.
+# gunicorn --preload처럼 포크 전에 로드하면 워커 프로세스끼리 모델 메모리를 copy-on-write로 공유한다.
+# whisper는 추론할 때마다 모델에 kv-cache hook을 붙였다 떼므로 같은 모델을 여러 스레드가 동시에 쓰면 안 된다.
+#
+# 긴 녹음의 청크 병렬 전사는 전용 작업 워커(`flask jobs-worker`)에서만 쓴다. 풀의 워커 프로세스는 spawn으로 떠서
+# 각자 모델을 따로 올리므로 메모리가 워커 수만큼 더 든다(base 약 0.5GB, large 약 3~4GB씩).
+# INHOUSE_TRANSCRIBE_WORKERS(기본 1)로 풀 크기를 정하고, 웹 프로세스는 값과 상관없이 공유 모델로 한 번에 전사한다.
+
+import glob
+import logging
+import multiprocessing
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from difflib import SequenceMatcher
+from pathlib import Path
+
+WHISPER_MODEL_DEFAULT = "base"
+WARMUP_CLIP = Path(__file__).resolve().parent / "fixtures" / "silence_1s.wav"
+
+# 긴 녹음은 무음 구간에서 잘라 여러 프로세스가 나눠 전사한다(청크 풀을 켠 프로세스만)
+SAMPLE_RATE = 16000
+CHUNK_TARGET_SECONDS = float(os.environ.get("INHOUSE_TRANSCRIBE_CHUNK_SECONDS", "60"))
+CHUNK_MIN_RATIO = 0.75
+CHUNK_MAX_RATIO = 1.5
+CHUNK_OVERLAP_SECONDS = 1.0
+CHUNKED_MIN_SECONDS = 120
+SILENCE_FRAME_SECONDS = 0.03
+SILENCE_SMOOTH_FRAMES = 10
+SILENCE_FLOOR_RATIO = 2.0
+SILENCE_FLOOR_EPSILON = 1e-4
+STITCH_WINDOW_WORDS = 20
+STITCH_SEAM_SLACK = 3
+
+logger = logging.getLogger(__name__)
+
+_MODEL = None
+_CHUNK_POOL_ENABLED = False
+_LOAD_LOCK = threading.Lock()
+_INFERENCE_LOCK = threading.Lock()
+_READY = threading.Event()
+_STATUS = {
+    "state": "idle",
+    "model": None,
+    "error": None,
+    "load_seconds": None,
+    "warmup_seconds": None,
+}
+
+
+def ensure_ffmpeg_in_path():
+    if shutil.which("ffmpeg"):
+        return
+
+    local_app = os.environ.get("LOCALAPPDATA")
+    if not local_app:
+        return
+
+    pattern = os.path.join(
+        local_app,
+        "Microsoft",
+        "WinGet",
+        "Packages",
+        "Gyan.FFmpeg_*",
+        "ffmpeg-*-full_build",
+        "bin",
+        "ffmpeg.exe",
+    )
+    matches = glob.glob(pattern)
+    if not matches:
+        return
+
+    ffmpeg_dir = os.path.dirname(matches[0])
+    os.environ["PATH"] = f"{ffmpeg_dir};{os.environ.get('PATH', '')}"
+
+
+def model_name() -> str:
+    # instance/.env는 create_app에서 읽히므로 import 시점이 아니라 호출할 때 확인한다
+    return os.environ.get("INHOUSE_WHISPER_MODEL", WHISPER_MODEL_DEFAULT).strip() or WHISPER_MODEL_DEFAULT
+
+
+def load_model(warm_up=False):
+    global _MODEL
+    if _MODEL is not None:
+        return _MODEL
+
+    # 백그라운드 preload가 도는 중이면 여기서 끝나길 기다린다(모델을 두 번 올리지 않는다)
+    with _LOAD_LOCK:
+        if _MODEL is not None:
+            return _MODEL
+
+        name = model_name()
+        _STATUS.update(state="loading", model=name, error=None)
+        started = time.perf_counter()
+        try:
+            ensure_ffmpeg_in_path()
+            import whisper
+
+            model = whisper.load_model(name)
+        except Exception as exc:
+            _STATUS.update(state="failed", error=f"{type(exc).__name__}: {exc}")
+            raise
+        _STATUS["load_seconds"] = round(time.perf_counter() - started, 3)
+
+        if warm_up:
+            _STATUS["state"] = "warming_up"
+            _warm_up(model)
+
+        _MODEL = model
+        _STATUS["state"] = "ready"
+        _READY.set()
+    return _MODEL
+
+
+def _warm_up(model):
+    # 짧은 무음 파일로 한 번 추론해 두면 mel 필터, 연산 커널, 스레드 풀 초기화가 첫 요청에서 빠진다
+    started = time.perf_counter()
+    try:
+        with _INFERENCE_LOCK:
+            model.transcribe(str(WARMUP_CLIP), language="ko")
+    except Exception as exc:
+        logger.warning("whisper warm-up failed: %s", exc)
+        return
+    _STATUS["warmup_seconds"] = round(time.perf_counter() - started, 3)
+
+
+def preload(warm_up=True) -> bool:
+    try:
+        load_model(warm_up=warm_up)
+    except Exception:
+        logger.exception("whisper preload failed")
+        return False
+    logger.info(
+        "whisper '%s' ready (load %ss, warm-up %ss)",
+        _STATUS["model"],
+        _STATUS["load_seconds"],
+        _STATUS["warmup_seconds"],
+    )
+    return True
+
+
+def preload_from_env():
+    # INHOUSE_WHISPER_PRELOAD: 0(기본, 첫 전사 때 로드) | 1(앱 시작 시 로드 후 서빙) | background(서빙하면서 로드)
+    mode = os.environ.get("INHOUSE_WHISPER_PRELOAD", "0").strip().lower()
+    if mode in ("", "0", "off", "false", "no"):
+        return
+    warm_up = os.environ.get("INHOUSE_WHISPER_WARMUP", "1").strip().lower() not in ("0", "off", "false", "no")
+    if mode == "background":
+        threading.Thread(target=preload, kwargs={"warm_up": warm_up}, name="whisper-preload", daemon=True).start()
+    else:
+        preload(warm_up=warm_up)
+
+
+def is_ready() -> bool:
+    return _READY.is_set()
+
+
+def status() -> dict:
+    return {**_STATUS, "ready": _READY.is_set()}
+
+
+def enable_chunk_pool():
+    # 전용 작업 워커에서만 부른다. 웹/gunicorn 워커마다 풀을 띄우면 모델 사본이 프로세스 수만큼 곱해진다
+    global _CHUNK_POOL_ENABLED
+    _CHUNK_POOL_ENABLED = True
+
+
+def transcribe_workers() -> int:
+    # 청크 풀의 워커 프로세스 수. 1(기본)이면 청크 분할 없이 공유 모델로 한 번에 전사한다
+    value = os.environ.get("INHOUSE_TRANSCRIBE_WORKERS", "").strip()
+    return max(1, min(int(value or "1"), _available_cores()))
+
+
+def _available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def transcribe(audio_path, language="ko", on_progress=None) -> str:
+    audio = audio_path
+    workers = transcribe_workers() if _CHUNK_POOL_ENABLED else 1
+    if workers > 1:
+        ensure_ffmpeg_in_path()
+        import whisper
+
+        audio = whisper.load_audio(audio_path)
+        if len(audio) >= CHUNKED_MIN_SECONDS * SAMPLE_RATE:
+            return transcribe_samples(audio, language=language, workers=workers, on_progress=on_progress)
+
+    model = load_model()
+    with _INFERENCE_LOCK:
+        result = model.transcribe(audio, language=language)
+    return (result.get("text") or "").strip()
+
+
+def transcribe_samples(samples, language="ko", workers=None, on_progress=None) -> str:
+    # 16kHz mono float32 샘플을 무음 경계로 잘라 프로세스 풀에서 전사한 뒤 이어 붙인다
+    workers = workers or transcribe_workers()
+    spans = split_on_silence(samples)
+    pool = _chunk_pool(workers)
+    futures = [pool.submit(_transcribe_chunk, samples[start:end], language) for start, end in spans]
+    texts = []
+    try:
+        for done, future in enumerate(futures, start=1):
+            texts.append(future.result())
+            if on_progress:
+                on_progress(done, len(futures))
+    except BrokenProcessPool:
+        # 워커가 죽으면(OOM 등) 풀을 버리고 다음 호출에서 새로 만든다
+        shutdown_chunk_pool()
+        raise
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return stitch_transcripts(texts)
+
+
+def split_on_silence(samples, sample_rate=SAMPLE_RATE, target_seconds=None, overlap_seconds=CHUNK_OVERLAP_SECONDS):
+    # 반환값은 겹침을 포함한 (start, end) 샘플 구간 목록
+    target_seconds = target_seconds or CHUNK_TARGET_SECONDS
+    frame = int(sample_rate * SILENCE_FRAME_SECONDS)
+    energies = _frame_energies(samples, frame)
+    frames_per_second = sample_rate / frame
+    cuts = choose_cuts(
+        energies,
+        min_frames=int(target_seconds * CHUNK_MIN_RATIO * frames_per_second),
+        target_frames=int(target_seconds * frames_per_second),
+        max_frames=int(target_seconds * CHUNK_MAX_RATIO * frames_per_second),
+    )
+
+    total = len(samples)
+    overlap = int(overlap_seconds * sample_rate)
+    bounds = [0] + [cut * frame for cut in cuts] + [total]
+    return [
+        (max(0, start - overlap), min(total, end + overlap))
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def _frame_energies(samples, frame):
+    import numpy as np
+
+    usable = len(samples) // frame * frame
+    frames = np.asarray(samples[:usable], dtype=np.float32).reshape(-1, frame)
+    return np.sqrt(np.mean(frames * frames, axis=1)).tolist()
+
+
+def choose_cuts(energies, min_frames, target_frames, max_frames) -> list[int]:
+    # 각 청크는 [min, max] 길이 안의 무음(짧은 잡음에 끌리지 않도록 이동 평균) 중 target 길이에 가장 가까운 곳에서 끊는다.
+    # 구간 최솟값의 SILENCE_FLOOR_RATIO배 이내면 같은 무음으로 본다
+    count = len(energies)
+    smoothed = _moving_average(energies, SILENCE_SMOOTH_FRAMES)
+    cuts = []
+    start = 0
+    while count - start > max_frames:
+        lo = start + min_frames
+        hi = min(start + max_frames, count - 1)
+        target = start + target_frames
+        floor = min(smoothed[lo : hi + 1]) * SILENCE_FLOOR_RATIO + SILENCE_FLOOR_EPSILON
+        cut = min(range(lo, hi + 1), key=lambda index: (smoothed[index] > floor, abs(index - target)))
+        cuts.append(cut)
+        start = cut
+    return cuts
+
+
+def _moving_average(values, width):
+    half = width // 2
+    prefix = [0.0]
+    for value in values:
+        prefix.append(prefix[-1] + value)
+    averaged = []
+    for index in range(len(values)):
+        lo = max(0, index - half)
+        hi = min(len(values), index + half + 1)
+        averaged.append((prefix[hi] - prefix[lo]) / (hi - lo))
+    return averaged
+
+
+_WORD_EDGE = re.compile(r"^\W+|\W+$")
+
+
+def _normalize_word(word: str) -> str:
+    return _WORD_EDGE.sub("", word).lower() or word
+
+
+def stitch_transcripts(texts) -> str:
+    # 청크는 앞뒤로 겹쳐 잘렸으므로 이음매 근처에서 같은 단어열이 두 번 나올 수 있다.
+    # 앞 청크 끝과 뒤 청크 앞에서 가장 길게 일치하는 단어열을 찾아 한 번만 남긴다
+    words = []
+    for text in texts:
+        incoming = (text or "").split()
+        if not incoming:
+            continue
+        if words:
+            keep_prev, skip_next = _overlap_seam(words, incoming)
+            words = words[:keep_prev]
+            incoming = incoming[skip_next:]
+        words.extend(incoming)
+    return " ".join(words)
+
+
+def _overlap_seam(prev_words, next_words) -> tuple[int, int]:
+    tail = [_normalize_word(word) for word in prev_words[-STITCH_WINDOW_WORDS:]]
+    head = [_normalize_word(word) for word in next_words[:STITCH_WINDOW_WORDS]]
+    match = SequenceMatcher(None, tail, head, autojunk=False).find_longest_match(0, len(tail), 0, len(head))
+    near_seam = match.a + match.size >= len(tail) - STITCH_SEAM_SLACK and match.b <= STITCH_SEAM_SLACK
+    if match.size < min(2, len(head)) or not near_seam:
+        return len(prev_words), 0
+    # 겹친 단어열은 뒤 청크 쪽을 쓰고, 이음매 바깥의 잘린 단어는 버린다
+    return len(prev_words) - len(tail) + match.a, match.b
+
+
+_CHUNK_POOL = None
+_CHUNK_POOL_SIZE = 0
+_CHUNK_POOL_LOCK = threading.Lock()
+
+
+def _chunk_pool(workers):
+    global _CHUNK_POOL, _CHUNK_POOL_SIZE
+    with _CHUNK_POOL_LOCK:
+        if _CHUNK_POOL is None or _CHUNK_POOL_SIZE != workers:
+            if _CHUNK_POOL is not None:
+                _CHUNK_POOL.shutdown(wait=False, cancel_futures=True)
+            # 스레드가 도는 웹 프로세스를 fork하면 락 상태까지 복제되므로 spawn으로 띄우고,
+            # 워커마다 처음 한 번 모델을 올린 뒤 계속 재사용한다
+            threads = max(1, _available_cores() // workers)
+            _CHUNK_POOL = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_chunk_worker,
+                initargs=(model_name(), threads),
+            )
+            _CHUNK_POOL_SIZE = workers
+        return _CHUNK_POOL
+
+
+def shutdown_chunk_pool(wait=False):
+    global _CHUNK_POOL, _CHUNK_POOL_SIZE
+    with _CHUNK_POOL_LOCK:
+        if _CHUNK_POOL is not None:
+            _CHUNK_POOL.shutdown(wait=wait, cancel_futures=True)
+        _CHUNK_POOL = None
+        _CHUNK_POOL_SIZE = 0
+
+
+def start_chunk_pool(workers=None) -> int:
+    # 워커 프로세스를 미리 띄우고 모델 로드/워밍업까지 끝내 둔다
+    workers = workers or transcribe_workers()
+    pool = _chunk_pool(workers)
+    for future in [pool.submit(_chunk_worker_ready) for _ in range(workers)]:
+        future.result()
+    return workers
+
+
+def _init_chunk_worker(name, threads):
+    os.environ["INHOUSE_WHISPER_MODEL"] = name
+    # 프로세스마다 코어를 나눠 쓰도록 torch 연산 스레드 수를 줄인다
+    import torch
+
+    torch.set_num_threads(threads)
+    load_model(warm_up=True)
+
+
+def _chunk_worker_ready() -> int:
+    return os.getpid()
+
+
+def _transcribe_chunk(samples, language):
+    model = load_model()
+    with _INFERENCE_LOCK:
+        result = model.transcribe(samples, language=language)
+    return (result.get("text") or "").strip()
+
+
+def _reset_after_fork():
+    # 포크 순간 다른 스레드가 쥐고 있던 락은 자식에서 영원히 풀리지 않으므로 새로 만든다
+    global _LOAD_LOCK, _INFERENCE_LOCK, _READY, _CHUNK_POOL, _CHUNK_POOL_SIZE, _CHUNK_POOL_LOCK
+    _LOAD_LOCK = threading.Lock()
+    _INFERENCE_LOCK = threading.Lock()
+    _READY = threading.Event()
+    # 부모의 프로세스 풀은 자식에서 쓸 수 없다
+    _CHUNK_POOL = None
+    _CHUNK_POOL_SIZE = 0
+    _CHUNK_POOL_LOCK = threading.Lock()
+    if _MODEL is not None:
+        _READY.set()
+    elif _STATUS["state"] in ("loading", "warming_up"):
+        # 부모에서 로드 중이던 스레드는 자식에 없다. 첫 전사 때 다시 로드한다
+        _STATUS["state"] = "idle"
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -25,6 +25,18 @@
     return { res, data };
   };
 
+  // 작업 큐(job)가 끝날 때까지 상태를 폴링한다. 끝나면 job 객체를 돌려준다
+  App.waitForJob = async (jobId, { interval = 1500, onProgress } = {}) => {
+    for (;;) {
+      const { res, data } = await App.fetchJson(`/api/nota-space/jobs/${jobId}`);
+      const job = data && data.job;
+      if (!res.ok || !job) return { status: "failed", error: (data && data.error) || "작업 상태를 확인하지 못했습니다." };
+      if (job.status === "succeeded" || job.status === "failed") return job;
+      if (onProgress) onProgress(job);
+      await new Promise((resolve) => setTimeout(resolve, interval));
+    }
+  };
+
   App.setActive = (elements, activeEl, className = "is-active") => {
     elements.forEach((el) => {
       el.classList.toggle(className, el === activeEl);
@@ -33,11 +33,25 @@
     if (notes) formData.set("meeting_text", notes);
     if (audioFile) formData.set("audio_file", audioFile);
 
-    const { res, data } = await App.fetchJson("/api/nota-space/meeting-summary", {
+    const { res, data: queued } = await App.fetchJson("/api/nota-space/meeting-summary", {
       method: "POST",
       body: formData
     });
 
+    let data = queued;
+    if (res.ok && queued && queued.job_id) {
+      const job = await App.waitForJob(queued.job_id, {
+        onProgress: (item) => {
+          if (summaryMessage && item.message) summaryMessage.textContent = `${item.message}...`;
+        }
+      });
+      if (job.status !== "succeeded") {
+        if (summaryMessage) summaryMessage.textContent = job.error || "AI 요약 생성에 실패했습니다.";
+        return;
+      }
+      data = job.result;
+    }
+
     if (!res.ok) {
       const fallback = "AI 요약 생성에 실패했습니다.";
       const errorCode = data && (data.summary_error || data.error_code);
@@ -13,6 +13,8 @@ if (notaSpacePage) {
     bookings: [],
     logs: [],
     monthDays: {},
+    bookingsCursor: null,
+    logsCursor: null,
     view: "daily"
   };
 
@@ -69,9 +71,14 @@ if (notaSpacePage) {
     state.date = (data && data.date) || dateValue;
   }
 
-  async function fetchAllBookings() {
-    const { data } = await App.fetchJson("/api/nota-space/bookings?all=1");
-    state.bookings = (data && data.bookings) || [];
+  async function fetchAllBookings({ append = false } = {}) {
+    const params = new URLSearchParams({ all: "1", limit: "50" });
+    if (append && state.bookingsCursor) params.set("cursor", state.bookingsCursor);
+
+    const { data } = await App.fetchJson(`/api/nota-space/bookings?${params.toString()}`);
+    const items = (data && data.bookings) || [];
+    state.bookings = append ? state.bookings.concat(items) : items;
+    state.bookingsCursor = (data && data.next_cursor) || null;
   }
 
   async function fetchMonthlyBookings(monthValue) {
@@ -79,18 +86,23 @@ if (notaSpacePage) {
     state.monthDays = (data && data.days) || {};
   }
 
-  async function fetchMeetingLogs() {
-    const { data } = await App.fetchJson("/api/nota-space/meeting-logs");
-    state.logs = (data && data.logs) || [];
+  async function fetchMeetingLogs({ append = false } = {}) {
+    const params = new URLSearchParams();
+    if (append && state.logsCursor) params.set("cursor", state.logsCursor);
+
+    const { data } = await App.fetchJson(`/api/nota-space/meeting-logs?${params.toString()}`);
+    const items = (data && data.logs) || [];
+    state.logs = append ? state.logs.concat(items) : items;
+    state.logsCursor = (data && data.next_cursor) || null;
   }
 
   async function fetchBookingDetail(idValue) {
-    const { data } = await App.fetchJson(`/api/nota-space/bookings/${idValue}`);
+    const { data } = await App.fetchJson(`/api/nota-space/bookings/${idValue}?fields=notes,summary`);
     return data && data.booking ? data.booking : null;
   }
 
   async function fetchMeetingLogDetail(idValue) {
-    const { data } = await App.fetchJson(`/api/nota-space/meeting-logs/${idValue}`);
+    const { data } = await App.fetchJson(`/api/nota-space/meeting-logs/${idValue}?fields=notes,summary`);
     return data && data.log ? data.log : null;
   }
 
@@ -253,6 +265,9 @@ if (notaSpacePage) {
     const list = $("#ns-booking-list");
     if (!list) return;
 
+    const loadMoreBtn = $("#ns-load-more");
+    if (loadMoreBtn) loadMoreBtn.hidden = !state.bookingsCursor;
+
     if (!state.bookings.length) {
       list.innerHTML = "<div class=\"ns-empty\">등록된 예약이 없습니다.</div>";
       return;
@@ -415,6 +430,9 @@ if (notaSpacePage) {
     const table = $("#ns-log-table");
     if (!table) return;
 
+    const loadMoreBtn = $("#ns-log-load-more");
+    if (loadMoreBtn) loadMoreBtn.hidden = !state.logsCursor;
+
     if (!state.logs.length) {
       table.innerHTML = "<div class=\"ns-empty\">회의록이 없습니다.</div>";
       return;
@@ -555,6 +573,22 @@ if (notaSpacePage) {
         return;
       }
 
+      if (!data || !data.job_id) {
+        if (message) message.textContent = "로그가 저장되었습니다.";
+        return;
+      }
+
+      if (message) message.textContent = "로그가 저장되었습니다. 녹음 변환/요약을 처리하는 중...";
+      const job = await App.waitForJob(data.job_id, {
+        onProgress: (item) => {
+          if (message && item.message) message.textContent = `로그가 저장되었습니다. ${item.message}...`;
+        }
+      });
+      if (job.status !== "succeeded") {
+        if (message) message.textContent = `로그는 저장되었지만 후처리에 실패했습니다: ${job.error || ""}`;
+        return;
+      }
+      if (job.result && job.result.summary) setSummaryText(job.result.summary);
       if (message) message.textContent = "로그가 저장되었습니다.";
     });
   }
@@ -573,10 +607,24 @@ if (notaSpacePage) {
 
     if (pageType === "room-booking-list") {
       await refreshBookingListPage();
+      const loadMoreBtn = $("#ns-load-more");
+      if (loadMoreBtn) {
+        loadMoreBtn.addEventListener("click", async () => {
+          await fetchAllBookings({ append: true });
+          renderBookingList();
+        });
+      }
     }
 
     if (pageType === "meeting-log-list") {
       await refreshMeetingLogList();
+      const loadMoreBtn = $("#ns-log-load-more");
+      if (loadMoreBtn) {
+        loadMoreBtn.addEventListener("click", async () => {
+          await fetchMeetingLogs({ append: true });
+          renderMeetingLogTable();
+        });
+      }
     }
 
     if (pageType === "meeting-log-form") {
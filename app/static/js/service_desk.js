@@ -21,7 +21,8 @@ const state = {
   category: "",
   status: "",
   q: "",
-  sort: "newest",
+  // 비워 두면 서버 기본 정렬(검색어가 있으면 관련도순, 없으면 최신순)을 쓴다
+  sort: "",
   summaryMode: "category",
   mode: "user"
 };
@@ -29,6 +30,7 @@ const state = {
 let searchTimer = null;
 let summaryData = null;
 let lastRequests = [];
+let nextCursor = null;
 
 const $ = (selector) => App.qs(selector);
 const $$ = (selector) => App.qsa(selector);
@@ -48,7 +50,8 @@ const ui = {
   form: $("#sd-form"),
   cancelBtn: $("#sd-cancel"),
   filterPills: $("#sd-filter-pills"),
-  resetBtn: $("#sd-reset")
+  resetBtn: $("#sd-reset"),
+  loadMoreBtn: $("#sd-load-more")
 };
 
 function getCategoryInfo(value) {
@@ -96,16 +99,19 @@ async function fetchSummary() {
   renderSummary();
 }
 
-async function fetchRequests() {
+async function fetchRequests({ append = false } = {}) {
   const params = new URLSearchParams();
   if (state.category) params.set("category", state.category);
   if (state.status) params.set("status", state.status);
   if (state.q) params.set("q", state.q);
   if (state.sort) params.set("sort", state.sort);
+  if (append && nextCursor) params.set("cursor", nextCursor);
 
   const res = await fetch(`/api/service-desk/requests?${params.toString()}`);
   const data = await res.json();
-  lastRequests = data.requests || [];
+  const page = data.requests || [];
+  lastRequests = append ? lastRequests.concat(page) : page;
+  nextCursor = data.next_cursor || null;
   renderTable(lastRequests);
 }
 
@@ -197,11 +203,12 @@ function renderFilterPills() {
     `);
     activeFilters.push("q");
   }
-  if (state.sort && state.sort !== "newest") {
+  if (state.sort) {
     const sortLabelMap = {
       newest: "최신순",
       pending_oldest: "대기 오래된 순",
-      urgency: "긴급도순"
+      urgency: "긴급도순",
+      relevance: "관련도순"
     };
     pills.push(`
       <button class="sd-filter-pill" data-type="sort" type="button">
@@ -216,7 +223,8 @@ function renderFilterPills() {
 }
 
 function renderTable(tickets) {
-  ui.totalCount.textContent = `총 ${tickets.length}건`;
+  ui.totalCount.textContent = `총 ${tickets.length}건${nextCursor ? "+" : ""}`;
+  ui.loadMoreBtn.hidden = !nextCursor;
 
   if (!tickets.length) {
     ui.tableBody.innerHTML = `
@@ -257,9 +265,15 @@ function renderTable(tickets) {
       `
       : "";
 
+    // 검색 결과는 서버에서 이스케이프 후 <mark>로 강조한 제목/본문 스니펫을 내려준다
+    const titleHtml = ticket.title_highlight || ticket.title;
+    const snippetHtml = ticket.description_snippet && ticket.description_snippet.includes("<mark>")
+      ? `<div class="sd-snippet">${ticket.description_snippet}</div>`
+      : "";
+
     return `
       <tr>
-        <td>${ticket.title}</td>
+        <td>${titleHtml}${snippetHtml}</td>
         <td>
           <span class="sd-urgency-text ${urgency ? urgency.className : "sd-urgency-normal"}">${
             urgency ? urgency.label : "보통"
@@ -378,7 +392,7 @@ function resetFilters() {
   state.category = "";
   state.status = "";
   state.q = "";
-  state.sort = "newest";
+  state.sort = "";
   state.summaryMode = "category";
   state.mode = "user";
   syncUIFromFilters();
@@ -396,7 +410,7 @@ function bindEvents() {
     if (type === "category") state.category = "";
     if (type === "status") state.status = "";
     if (type === "q") state.q = "";
-    if (type === "sort") state.sort = "newest";
+    if (type === "sort") state.sort = "";
     syncUIFromFilters();
     fetchRequests();
   });
@@ -435,6 +449,7 @@ function bindEvents() {
   ui.overlay.addEventListener("click", closePanel);
   ui.form.addEventListener("submit", submitForm);
   ui.resetBtn.addEventListener("click", resetFilters);
+  ui.loadMoreBtn.addEventListener("click", () => fetchRequests({ append: true }));
 
   document.addEventListener("keydown", (event) => {
     if (event.key === "Escape" && ui.panel.classList.contains("is-open")) {
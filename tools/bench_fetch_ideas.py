@@ -0,0 +1,54 @@
+# fetch_ideas 한 번에 실행되는 쿼리 수와 소요 시간을 아이디어 개수별로 측정한다.
+# 쿼리 수가 아이디어 개수에 따라 늘어나면(N+1) exit code 1로 실패한다.
+#
+# 사용 예) python -m tools.bench_fetch_ideas --sizes 100 1000 5000
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+
+from app import db
+from tools import synthetic_db
+
+
+def measure(repeat: int = 5) -> tuple[int, float]:
+    conn = db.get_connection()
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    try:
+        db.fetch_ideas()
+    finally:
+        conn.set_trace_callback(None)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        db.fetch_ideas()
+        timings.append(time.perf_counter() - started)
+    return len(statements), statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="fetch_ideas 쿼리 수/지연 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'ideas':>8} {'queries':>8} {'median ms':>10}")
+    counts = []
+    for size in args.sizes:
+        synthetic_db.build(tickets=0, bookings=0, ideas=size)
+        queries, median = measure(args.repeat)
+        counts.append(queries)
+        print(f"{size:>8} {queries:>8} {median * 1000:>10.1f}")
+
+    if len(set(counts)) > 1:
+        print("query count grows with the number of ideas (N+1)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# 로컬 요약 엔진이 문장 수에 선형으로 늘어나는지 잰다.
+# 앱에서는 입력을 14,000자로 자른 뒤 요약하지만 여기서는 자르지 않고 엔진(_summarize_sentences_locally)에
+# 바로 넣는다. 문장당 시간이 문장 수와 함께 커지면 어딘가 이차 비용이 남아 있다는 뜻이다.
+#
+# 사용 예) python -m tools.bench_local_summary --sentences 1000 10000 100000 --engine numpy python
+
+from __future__ import annotations
+
+import argparse
+import time
+import warnings
+
+from tools.synthetic_meetings import synthetic_meeting
+
+# 합성 문장 하나가 평균 45자 안팎
+_CHARS_PER_SENTENCE = 45
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 요약 엔진 확장성 벤치마크")
+    parser.add_argument("--sentences", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--engine", nargs="+", choices=["numpy", "python"], default=["numpy", "python"])
+    parser.add_argument("--repeat", type=int, default=3, help="크기마다 반복해 가장 빠른 값을 쓴다")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    from app.inhouse_service import routes
+
+    numpy_module = routes.np
+    for engine in args.engine:
+        if engine == "numpy" and numpy_module is None:
+            print("numpy가 설치되어 있지 않아 numpy 경로는 건너뜁니다")
+            continue
+        routes.np = numpy_module if engine == "numpy" else None
+        for mode in ("plain", "sections"):
+            print(f"{engine} / {mode}")
+            base = None
+            for target in args.sentences:
+                text = synthetic_meeting(target * _CHARS_PER_SENTENCE, seed=target, sections=mode == "sections")
+                count = len(routes._split_sentences(text))
+                best = min(_timed(routes._summarize_sentences_locally, text) for _ in range(args.repeat))
+                per_sentence = best / count * 1e6
+                base = base or per_sentence
+                print(
+                    f"  {count:8,d} sentences  {best:8.3f}s  {per_sentence:6.1f}us/sentence"
+                    f"  x{per_sentence / base:.2f} per-sentence cost vs smallest"
+                )
+    routes.np = numpy_module
+
+
+def _timed(fn, text: str) -> float:
+    started = time.perf_counter()
+    fn(text)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# 긴 회의 텍스트 요약(map-reduce)의 소요 시간을 가짜 Gemini 서버로 잰다.
+# 서버 응답 지연을 고정해 두고 단일 호출(14,000자 이하) 한 번과 비교한다. 실제 Gemini는 부르지 않는다.
+#
+# 사용 예) python -m tools.bench_summary_map_reduce --minutes 120 --latency 2
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import warnings
+
+from tools import fake_gemini_server
+
+_WORDS = "예산 일정 배포 검토 리스크 고객 데모 서버 테스트 문서 디자인 채용 보안 지표 계약".split()
+
+
+def synthetic_transcript(minutes: float, seed: int = 0, chars_per_minute: int = 550) -> str:
+    # 한국어 회의 STT는 분당 500~600자 안팎. 가끔 실행 항목/결정 문장을 섞는다
+    rng = random.Random(seed)
+    sentences = []
+    length = 0
+    while length < minutes * chars_per_minute:
+        roll = rng.random()
+        if roll < 0.03:
+            sentence = f"{rng.choice(['김민수', '이지은', '박서준'])} 님이 {rng.choice(_WORDS)} 정리해서 금요일까지 공유하기로 했습니다."
+        elif roll < 0.05:
+            sentence = f"{rng.choice(_WORDS)} 일정은 다음 주로 확정했습니다."
+        else:
+            sentence = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(5, 12))) + "."
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(sentences)
+
+
+def _timed(fn, text: str) -> tuple[float, dict]:
+    started = time.perf_counter()
+    response = fn(text)
+    return time.perf_counter() - started, response
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="map-reduce 요약 벤치마크")
+    parser.add_argument("--minutes", type=float, default=120)
+    parser.add_argument("--latency", type=float, default=2.0, help="가짜 Gemini 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.3)
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    server, state = fake_gemini_server.start(latency=args.latency, jitter=args.jitter)
+    os.environ["INHOUSE_GEMINI_ENDPOINT"] = f"http://127.0.0.1:{server.server_address[1]}"
+
+    from app import gemini
+    from app.inhouse_service import routes
+
+    if gemini.genai is None:
+        print("google-generativeai가 설치되어 있지 않습니다 (pip install -r requirements.txt)")
+        sys.exit(1)
+
+    text = synthetic_transcript(args.minutes)
+    single, _ = _timed(routes._summarize_meeting_text_uncached, text[: routes._SUMMARY_SINGLE_CALL_CHARS])
+    requests_before = state.snapshot()["requests"]
+    elapsed, response = _timed(routes._summarize_meeting_text_uncached, text)
+    chunks = state.snapshot()["requests"] - requests_before
+
+    print(f"{args.minutes:g} min transcript, {len(text):,} chars, latency {args.latency}s ±{args.jitter}s")
+    print(f"  single call (first {routes._SUMMARY_SINGLE_CALL_CHARS:,} chars)  {single:6.2f}s")
+    print(
+        f"  map-reduce ({chunks} chunk(s), concurrency {routes._SUMMARY_MAP_CONCURRENCY})  {elapsed:6.2f}s"
+        f"  x{elapsed / single:.2f} of single call, source={response['summary_source']}"
+    )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
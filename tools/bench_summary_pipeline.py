@@ -0,0 +1,252 @@
+# 회의 요약 대체 경로(로컬 요약)의 단계별 벤치마크.
+# 합성 회의 텍스트(tools.synthetic_meetings)를 크기(1KB~5MB, UTF-8 기준) x 섹션 마커 유무 x 실행 항목 밀도로
+# 만들고, 단계마다 지연 p50/p95/p99, 처리량(문장/초), 최대 메모리(tracemalloc)를 잰다.
+# 저장된 기준값(tools/baseline_summary_pipeline.json)보다 가장 빠른 실행 시간이나 최대 메모리가 허용 폭 이상
+# 나빠지면 exit code 1. p50/p95는 다른 프로세스 부하에 크게 흔들리므로 회귀 판정에는 가장 빠른 값을 쓰고,
+# 느려진 단계는 --retries 만큼 다시 재서 계속 느릴 때만 회귀로 본다.
+# 시간은 기계마다 다르므로 기준값은 저장소에 넣지 않는다(.gitignore). 비교할 기계에서 먼저 --save-baseline으로
+# 만들고, 같은 기계에서 코드를 바꾼 뒤 다시 돌려 비교한다.
+#
+# 사용 예) python -m tools.bench_summary_pipeline
+#          python -m tools.bench_summary_pipeline --sizes 1KB 256KB --stages engine render
+#          python -m tools.bench_summary_pipeline --save-baseline
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+from tools.synthetic_meetings import synthetic_meeting
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline_summary_pipeline.json")
+
+_SIZES = {"1KB": 1 << 10, "16KB": 16 << 10, "256KB": 256 << 10, "1MB": 1 << 20, "5MB": 5 << 20}
+_ACTION_DENSITIES = (0.0, 0.05, 0.3)
+_STAGES = ("split", "actions", "decisions", "structured", "engine", "render")
+# 이보다 작은 메모리 증가는 할당기 상태에 따른 흔들림으로 본다
+_MIN_MEMORY_DELTA = 64 << 10
+
+
+def _stage_functions(routes) -> dict:
+    # 단계 이름 -> (입력, 측정할 호출, 처리량 계산에 쓸 문장 수). structured는 앱과 같이 14,000자로 자른 뒤
+    # 요약하므로 잘린 텍스트의 문장 수를 쓰고, engine은 자르지 않은 전체 텍스트를 요약한다.
+    # render는 요약 결과만 다루므로 처리량을 내지 않는다
+    return {
+        "split": lambda case: (case["text"], routes._split_sentences, case["sentence_count"]),
+        "actions": lambda case: (case["sentences"], routes._extract_action_items, case["sentence_count"]),
+        "decisions": lambda case: (case["sentences"], routes._extract_decisions, case["sentence_count"]),
+        "structured": lambda case: (case["text"], routes._summarize_locally_structured, case["truncated_count"]),
+        "engine": lambda case: (case["text"], routes._summarize_sentences_locally, case["sentence_count"]),
+        "render": lambda case: (case["summary"], routes._render_summary_text, 0),
+    }
+
+
+def _repeats_for(size: int) -> int:
+    if size <= 16 << 10:
+        return 50
+    if size <= 1 << 20:
+        return 10
+    return 3
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def _case_name(size_name: str, sections: bool, action_density: float) -> str:
+    return f"{size_name}/{'sections' if sections else 'plain'}/actions={action_density:g}"
+
+
+def build_case(routes, size: int, sections: bool, action_density: float) -> dict:
+    seed = size + (1 if sections else 0) + int(action_density * 100)
+    text = synthetic_meeting(size, seed=seed, sections=sections, action_density=action_density)
+    # synthetic_meeting은 글자 수 기준이라 UTF-8 바이트로 다시 자른다
+    text = text.encode("utf-8")[:size].decode("utf-8", "ignore")
+    sentences = routes._split_sentences(text)
+    return {
+        "text": text,
+        "sentences": sentences,
+        "summary": routes._summarize_locally_structured(text),
+        "sentence_count": len(sentences),
+        "truncated_count": len(routes._split_sentences(routes._truncate_meeting_text(text))),
+    }
+
+
+def measure(fn, arg, repeats: int, sentence_count: int) -> dict:
+    fn(arg)  # 정규식 캐시 등 첫 호출 비용은 뺀다
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn(arg)
+        samples.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn(arg)
+        peak = tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+    p50 = _percentile(samples, 0.5)
+    return {
+        "min": round(min(samples), 6),
+        "p50": round(p50, 6),
+        "p95": round(_percentile(samples, 0.95), 6),
+        "p99": round(_percentile(samples, 0.99), 6),
+        "sentences_per_second": round(sentence_count / p50) if sentence_count and p50 > 0 else None,
+        "peak_bytes": max(0, peak),
+        "repeats": repeats,
+    }
+
+
+def _slower(previous: dict, current: dict, tolerance: float, min_delta: float) -> bool:
+    return current["min"] - previous["min"] > min_delta and current["min"] > previous["min"] * (1 + tolerance)
+
+
+def compare(baseline: dict, results: dict, tolerance: float, min_delta: float) -> list[str]:
+    regressions = []
+    for case, stages in results.items():
+        for stage, current in stages.items():
+            previous = (baseline.get(case) or {}).get(stage)
+            if not previous:
+                continue
+            if _slower(previous, current, tolerance, min_delta):
+                regressions.append(
+                    f"{case} {stage}: fastest run {previous['min'] * 1000:.3f}ms -> {current['min'] * 1000:.3f}ms"
+                )
+            grown = current["peak_bytes"] - previous["peak_bytes"]
+            if grown > _MIN_MEMORY_DELTA and current["peak_bytes"] > previous["peak_bytes"] * (1 + tolerance):
+                regressions.append(
+                    f"{case} {stage}: peak memory {previous['peak_bytes'] / 1024:.0f}KiB -> "
+                    f"{current['peak_bytes'] / 1024:.0f}KiB"
+                )
+    return regressions
+
+
+def _throughput(value: int | None) -> str:
+    return f"{value:,}/s" if value else "-"
+
+
+def _format_row(case: str, stage: str, result: dict, previous: dict | None) -> str:
+    row = (
+        f"  {case:<26} {stage:<10} p50 {result['p50'] * 1000:9.3f}ms  p95 {result['p95'] * 1000:9.3f}ms"
+        f"  p99 {result['p99'] * 1000:9.3f}ms  {_throughput(result['sentences_per_second']):>13}"
+        f"  peak {result['peak_bytes'] / 1024:9.0f}KiB"
+    )
+    if previous and previous["min"]:
+        row += f"  ({(result['min'] / previous['min'] - 1) * 100:+.0f}% fastest run)"
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="회의 요약 대체 경로 단계별 벤치마크")
+    parser.add_argument("--sizes", nargs="+", choices=list(_SIZES), default=list(_SIZES))
+    parser.add_argument("--stages", nargs="+", choices=_STAGES, default=list(_STAGES))
+    parser.add_argument("--action-densities", type=float, nargs="+", default=list(_ACTION_DENSITIES))
+    parser.add_argument("--no-sections", action="store_true", help="섹션 마커가 있는 텍스트는 건너뛴다")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장한다")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="기준값 대비 허용 비율(0.3 = 30%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="이보다 작은 지연 차이는 무시한다")
+    parser.add_argument("--retries", type=int, default=2, help="느려진 단계를 다시 재는 횟수")
+    parser.add_argument("--json", help="결과를 이 경로에 JSON으로도 쓴다")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    from app.inhouse_service import routes
+
+    baseline = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    stage_functions = _stage_functions(routes)
+    min_delta = args.min_delta_ms / 1000
+    plan = [
+        (size_name, sections, action_density)
+        for size_name in args.sizes
+        for sections in ((False,) if args.no_sections else (False, True))
+        for action_density in args.action_densities
+    ]
+    print(f"python {platform.python_version()}, numpy {getattr(routes.np, '__version__', 'not installed')}")
+    results: dict[str, dict] = {}
+    for size_name, sections, action_density in plan:
+        case_name = _case_name(size_name, sections, action_density)
+        case = build_case(routes, _SIZES[size_name], sections, action_density)
+        results[case_name] = {}
+        for stage in args.stages:
+            arg, fn, sentence_count = stage_functions[stage](case)
+            results[case_name][stage] = measure(fn, arg, _repeats_for(_SIZES[size_name]), sentence_count)
+            print(_format_row(case_name, stage, results[case_name][stage], (baseline.get(case_name) or {}).get(stage)))
+
+    # 순간적인 부하로 느려 보였을 수 있으니 느려진 단계만 다시 재서 가장 빠른 결과를 쓴다
+    for attempt in range(args.retries):
+        suspects: dict[tuple, list[str]] = {}
+        for size_name, sections, action_density in plan:
+            case_name = _case_name(size_name, sections, action_density)
+            for stage, current in results[case_name].items():
+                previous = (baseline.get(case_name) or {}).get(stage)
+                if previous and _slower(previous, current, args.tolerance, min_delta):
+                    suspects.setdefault((size_name, sections, action_density), []).append(stage)
+        if not suspects:
+            break
+        print(f"re-measuring {sum(map(len, suspects.values()))} slower stage(s) ({attempt + 1}/{args.retries})")
+        for (size_name, sections, action_density), stages in suspects.items():
+            case_name = _case_name(size_name, sections, action_density)
+            case = build_case(routes, _SIZES[size_name], sections, action_density)
+            for stage in stages:
+                arg, fn, sentence_count = stage_functions[stage](case)
+                result = measure(fn, arg, _repeats_for(_SIZES[size_name]), sentence_count)
+                if result["min"] < results[case_name][stage]["min"]:
+                    results[case_name][stage] = result
+                print(_format_row(case_name, stage, results[case_name][stage], baseline[case_name][stage]))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+
+    if args.save_baseline:
+        # 일부 크기/단계만 돌렸다면 기존 기준값에 덮어 쓴다
+        saved = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                saved = json.load(f).get("results", {})
+        for case_name, stages in results.items():
+            saved.setdefault(case_name, {}).update(stages)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "numpy": getattr(routes.np, "__version__", None),
+                    "machine": platform.machine(),
+                    "results": saved,
+                },
+                f,
+                indent=1,
+                sort_keys=True,
+            )
+            f.write("\n")
+        print(f"saved baseline for {len(results)} case(s) to {args.baseline}")
+        return
+
+    if not baseline:
+        print(f"no baseline at {args.baseline} (run with --save-baseline)")
+        return
+    regressions = compare(baseline, results, args.tolerance, min_delta)
+    for line in regressions:
+        print(f"  REGRESSION {line}")
+    print(f"{len(regressions)} regression(s) vs baseline (tolerance {args.tolerance:.0%})")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# 긴 합성 녹음으로 청크 병렬 전사의 워커 수별 소요 시간을 잰다.
+# 워커 1개(청크 순차 처리)와 예전 방식(파일 전체를 한 번에 transcribe)을 기준으로 배속을 출력한다.
+# whisper/torch/ffmpeg가 설치된 환경에서 돌린다. 워커 풀 기동과 모델 로드 시간은 측정에서 뺀다.
+#
+# 사용 예) python -m tools.bench_transcription --minutes 20 --workers 1 2 4 8
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+from app import speech
+
+
+def synthetic_meeting(minutes: float, seed: int = 0):
+    # 2~8초 발화(배음이 섞인 변조음)와 0.3~1.5초 쉼(약한 잡음)을 번갈아 이어 붙인다
+    import numpy as np
+
+    rng = random.Random(seed)
+    noise = np.random.default_rng(seed)
+    rate = speech.SAMPLE_RATE
+    total = int(minutes * 60 * rate)
+    parts = []
+    length = 0
+    while length < total:
+        seconds = rng.uniform(2, 8)
+        t = np.arange(int(seconds * rate), dtype=np.float32) / rate
+        pitch = rng.uniform(110, 240)
+        voice = sum(np.sin(2 * math.pi * pitch * k * t) / k for k in (1, 2, 3))
+        envelope = 0.5 + 0.5 * np.sin(2 * math.pi * rng.uniform(3, 6) * t)
+        parts.append((0.2 * voice * envelope).astype(np.float32))
+        pause = int(rng.uniform(0.3, 1.5) * rate)
+        parts.append((0.002 * noise.standard_normal(pause)).astype(np.float32))
+        length += len(parts[-2]) + pause
+    return np.concatenate(parts)[:total]
+
+
+def _single_call(samples, language: str) -> float:
+    model = speech.load_model()
+    started = time.perf_counter()
+    model.transcribe(samples, language=language)
+    return time.perf_counter() - started
+
+
+def _chunked(samples, language: str, workers: int) -> float:
+    speech.shutdown_chunk_pool(wait=True)
+    speech.start_chunk_pool(workers)
+    started = time.perf_counter()
+    speech.transcribe_samples(samples, language=language, workers=workers)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="청크 병렬 전사 벤치마크")
+    parser.add_argument("--minutes", type=float, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, 4, cores}))
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--skip-single", action="store_true", help="예전 방식(한 번에 전사) 측정을 건너뛴다")
+    args = parser.parse_args()
+
+    try:
+        import whisper  # noqa: F401
+    except ImportError:
+        print("whisper가 설치되어 있지 않습니다 (pip install -r requirements.txt)")
+        sys.exit(1)
+
+    samples = synthetic_meeting(args.minutes)
+    spans = speech.split_on_silence(samples)
+    print(f"{args.minutes:g} min synthetic audio, {len(spans)} chunk(s), {cores} core(s), model={speech.model_name()}")
+
+    baseline = None
+    if not args.skip_single:
+        baseline = _single_call(samples, args.language)
+        print(f"  single call      {baseline:8.1f}s")
+
+    sequential = None
+    try:
+        for workers in args.workers:
+            elapsed = _chunked(samples, args.language, workers)
+            sequential = sequential or (elapsed if workers == 1 else None)
+            notes = []
+            if sequential:
+                notes.append(f"x{sequential / elapsed:.2f} vs 1 worker")
+            if baseline:
+                notes.append(f"x{baseline / elapsed:.2f} vs single call")
+            print(f"  {workers:2d} worker(s)     {elapsed:8.1f}s  {', '.join(notes)}")
+    finally:
+        speech.shutdown_chunk_pool(wait=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# 조작된 페이지 커서가 500이 아니라 400으로 거절되는지 확인한다.
+# 작은 합성 DB로 앱을 띄워 목록 API마다 깨진 base64, 다른 정렬의 커서, 길이가 다른 키,
+# 스칼라가 아닌 키 값(dict/list/bool)을 보낸다. 기대와 다르면 exit code 1.
+#
+# 사용 예) python -m tools.check_bad_cursors
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import sys
+import tempfile
+import warnings
+
+from app import db
+from tools import synthetic_db
+
+
+def _cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _cases(sort: str, key_length: int) -> dict[str, str]:
+    filler = ["2025-01-01"] + [1] * (key_length - 1)
+    return {
+        "not base64": "!!!",
+        "not json": base64.urlsafe_b64encode(b"not json").decode("ascii"),
+        "json array": _cursor([sort, filler]),
+        "other sort": _cursor({"s": "other", "k": filler}),
+        "missing keys": _cursor({"s": sort}),
+        "short keys": _cursor({"s": sort, "k": filler[:-1]}),
+        "dict value": _cursor({"s": sort, "k": [{"a": 1}] + filler[1:]}),
+        "list value": _cursor({"s": sort, "k": [[1]] + filler[1:]}),
+        "bool value": _cursor({"s": sort, "k": [True] + filler[1:]}),
+    }
+
+
+# (이름, URL 앞부분, 커서 정렬 이름, 키 개수)
+_ENDPOINTS = [
+    ("tickets", "/api/service-desk/requests?sort=newest&cursor=", "newest", 2),
+    ("bookings", "/api/nota-space/bookings?all=1&cursor=", "bookings", 3),
+]
+
+
+def main() -> None:
+    warnings.simplefilter("ignore")
+    os.environ.setdefault("INHOUSE_GEMINI_ENDPOINT", "http://127.0.0.1:9")
+    path = os.path.join(tempfile.mkdtemp(prefix="inhouse-cursors-"), "service_desk.db")
+    synthetic_db.use_database(path)
+    synthetic_db.populate(tickets=200, bookings=200, ideas=10)
+
+    from app import create_app
+
+    app = create_app()
+    db.DB_PATH = path
+    client = app.test_client()
+
+    problems = 0
+    for name, prefix, sort, key_length in _ENDPOINTS:
+        for case, cursor in _cases(sort, key_length).items():
+            status = client.get(prefix + cursor).status_code
+            ok = status == 400
+            problems += not ok
+            print(f"  [{'OK' if ok else 'FAIL'}] {name} {case}: {status}")
+    print(f"{problems} unexpected response(s)")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# 가짜 Gemini 서버(tools.fake_gemini_server)에 지연/오류를 주입해 Gemini 클라이언트를 점검한다.
+# - 정상: 응답을 받고 지연 시간이 기록된다
+# - 간헐적 503: 재시도 예산 안에서 대부분 성공한다
+# - 응답 지연(장애): 호출이 deadline 안에 끝나고, 연속 실패 후 회로가 열려 곧바로 대체된다
+# - 복구: reset 시간이 지나면 시험 호출 하나로 회로가 닫힌다
+# 기대와 다르면 exit code 1.
+#
+# 사용 예) python -m tools.check_gemini_resilience
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import warnings
+
+from app import gemini
+from tools import fake_gemini_server
+
+_PROMPT = "회의록을 JSON으로 요약해라.\n\n[회의 내용]\n예산 검토\n다음 분기 목표 정리"
+
+
+def _call(client: gemini.GeminiClient) -> tuple[str, float]:
+    started = time.perf_counter()
+    try:
+        client.generate_text(_PROMPT, model_name="models/fake-gemini", api_key="test")
+        outcome = "ok"
+    except gemini.CircuitOpenError:
+        outcome = "short_circuit"
+    except gemini.GeminiTimeout:
+        outcome = "timeout"
+    except gemini.GeminiUnavailable:
+        outcome = "unavailable"
+    return outcome, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gemini 클라이언트 타임아웃/재시도/서킷 브레이커 점검")
+    parser.add_argument("--attempt-timeout", type=float, default=0.3)
+    parser.add_argument("--deadline", type=float, default=1.0)
+    parser.add_argument("--threshold", type=int, default=3)
+    parser.add_argument("--reset", type=float, default=1.0)
+    args = parser.parse_args()
+
+    if gemini.genai is None:
+        print("google-generativeai가 설치되어 있지 않습니다 (pip install -r requirements.txt)")
+        sys.exit(1)
+    warnings.simplefilter("ignore")
+
+    server, state = fake_gemini_server.start(latency=0.02)
+    os.environ["INHOUSE_GEMINI_ENDPOINT"] = f"http://127.0.0.1:{server.server_address[1]}"
+    client = gemini.GeminiClient(
+        attempt_timeout=args.attempt_timeout,
+        deadline=args.deadline,
+        max_attempts=3,
+        breaker=gemini.CircuitBreaker(threshold=args.threshold, reset_seconds=args.reset),
+    )
+    problems = []
+
+    def expect(condition: bool, message: str) -> None:
+        print(f"  [{'OK' if condition else 'FAIL'}] {message}")
+        if not condition:
+            problems.append(message)
+
+    print("healthy")
+    outcomes = [_call(client) for _ in range(20)]
+    expect(all(outcome == "ok" for outcome, _ in outcomes), "20/20 calls succeed")
+    expect(client.breaker.state == "closed", "breaker stays closed")
+
+    print("flaky (30% 503)")
+    state.update(error_rate=0.3)
+    retries_before = client.metrics.counters["retries"]
+    outcomes = [_call(client) for _ in range(40)]
+    succeeded = sum(outcome == "ok" for outcome, _ in outcomes)
+    expect(succeeded >= 36, f"{succeeded}/40 calls succeed within the retry budget")
+    expect(client.metrics.counters["retries"] > retries_before, "failed attempts are retried")
+    state.update(error_rate=0.0)
+    client.breaker.record_success()
+
+    print(f"outage (latency 5s, attempt timeout {args.attempt_timeout}s, deadline {args.deadline}s)")
+    state.update(latency=5.0)
+    outcomes = [_call(client) for _ in range(args.threshold)]
+    slowest = max(elapsed for _, elapsed in outcomes)
+    expect(all(outcome == "timeout" for outcome, _ in outcomes), "calls fail with a timeout")
+    expect(slowest <= args.deadline + 0.5, f"each call returns within the deadline (slowest {slowest:.2f}s)")
+    expect(client.breaker.state == "open", f"breaker opens after {args.threshold} failed calls")
+
+    requests_before = state.snapshot()["requests"]
+    outcomes = [_call(client) for _ in range(50)]
+    slowest = max(elapsed for _, elapsed in outcomes)
+    expect(all(outcome == "short_circuit" for outcome, _ in outcomes), "open breaker short-circuits every call")
+    expect(slowest < 0.01, f"short-circuited calls return immediately (slowest {slowest * 1000:.2f}ms)")
+    expect(state.snapshot()["requests"] == requests_before, "no requests reach the provider while open")
+
+    print("half-open trial fails")
+    time.sleep(args.reset)
+    outcome, _ = _call(client)
+    expect(outcome == "timeout" and client.breaker.state == "open", "a failed trial re-opens the breaker")
+
+    print("half-open trial cannot build the model")
+    state.update(latency=0.02)
+    time.sleep(args.reset)
+    generative_model = gemini.genai.GenerativeModel
+
+    def _broken_model(*args, **kwargs):
+        raise ValueError("model construction failed")
+
+    gemini.genai.GenerativeModel = _broken_model
+    try:
+        client.generate_text(_PROMPT, model_name="models/fake-gemini-uncached", api_key="test")
+        outcome = "ok"
+    except ValueError:
+        outcome = "error"
+    finally:
+        gemini.genai.GenerativeModel = generative_model
+    expect(outcome == "error" and not client.breaker._trial_in_flight, "the trial slot is released")
+
+    print("recovery")
+    outcome, _ = _call(client)
+    expect(outcome == "ok" and client.breaker.state == "closed", "a successful trial closes the breaker")
+
+    print(json.dumps(client.status(), ensure_ascii=False, indent=2))
+    server.shutdown()
+    if problems:
+        print(f"{len(problems)} expectation(s) failed")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# 로컬 요약(_summarize_locally_structured) 결과가 저장된 골든 출력과 똑같은지 확인한다.
+# 합성 회의 텍스트(tools.synthetic_meetings)와 손으로 만든 경계 사례를 numpy 경로와 순수 파이썬 경로
+# 양쪽으로 돌려 비교하고, 다르면 첫 차이를 보여 주고 exit code 1.
+# 요약 규칙을 의도적으로 바꿨을 때만 --update로 골든 파일을 다시 만든다.
+#
+# 사용 예) python -m tools.check_local_summary
+#          python -m tools.check_local_summary --update
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import warnings
+
+from tools.synthetic_meetings import synthetic_meeting
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden_local_summary.json")
+
+_HANDWRITTEN = {
+    "empty": "",
+    "whitespace": " \n\r\n  \n",
+    "markers_only": "목표입니다.\n결정 사항입니다.\n실행 항목입니다.",
+    "single_long_line": "배포 일정 검토 " * 400,
+    "english_only": (
+        "Meeting: Q3 roadmap review\n"
+        "We agreed to ship the API v2 release on 7/15. Alex will prepare the release notes by Friday.\n"
+        "TODO: update the latency dashboard. The budget review is blocked on finance!\n"
+        "Is the onboarding backlog still growing? The onboarding backlog is still growing."
+    ),
+    "mixed_case_unicode": (
+        "İstanbul 오피스 API 점검 회의입니다. API 응답 지연이 API 게이트웨이에서 발생합니다. "
+        "ΣΊΣΥΦΟΣ 프로젝트 API 범위를 줄이기로 결정했습니다. Api 문서는 Jamie가 다음 주 수요일까지 작성합니다."
+    ),
+    "duplicates": "\n".join(["서버 점검 일정 공유 부탁드립니다."] * 5 + ["서버 점검 결과 리포트 작성 필요합니다."] * 3),
+    "numbers": "2024년 3분기 매출 1200억 2024년 목표 1500억 달성률 80% 회의: 2024 실적 점검\n매출 1200억 1200억 1200억.",
+    "action_fields": (
+        "담당: 김민수 / 할 일: 배포 체크리스트 작성 / 기한: 2025.4.2\n"
+        "담당자: 이지은, 작업: 온보딩 문서 정리, 마감: 3월 14일까지\n"
+        "박서준은 보안 점검을 다음 주 수요일까지 진행하도록 합니다.\n"
+        "task: rotate the api keys, due: 4/18\n"
+        "최유나가 대시보드 지표를 내일 공유하겠습니다."
+    ),
+}
+
+
+def corpus() -> dict[str, str]:
+    cases = dict(_HANDWRITTEN)
+    seed = 0
+    for chars in (600, 3000, 12000, 40000):
+        for sections in (False, True):
+            for action_density in (0.0, 0.05, 0.3):
+                seed += 1
+                name = f"synthetic_{chars}_{'sections' if sections else 'plain'}_{action_density:g}"
+                cases[name] = synthetic_meeting(chars, seed=seed, sections=sections, action_density=action_density)
+    return cases
+
+
+def _run(routes, cases: dict[str, str]) -> dict[str, dict]:
+    return {
+        name: {
+            "input_sha256": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            "summary": routes._summarize_locally_structured(text),
+        }
+        for name, text in cases.items()
+    }
+
+
+def _first_difference(expected, actual, path="$"):
+    if type(expected) is not type(actual):
+        return path, expected, actual
+    if isinstance(expected, dict):
+        for key in sorted(set(expected) | set(actual)):
+            if key not in expected or key not in actual:
+                return f"{path}.{key}", expected.get(key), actual.get(key)
+            found = _first_difference(expected[key], actual[key], f"{path}.{key}")
+            if found:
+                return found
+        return None
+    if isinstance(expected, list):
+        for index, (left, right) in enumerate(zip(expected, actual)):
+            found = _first_difference(left, right, f"{path}[{index}]")
+            if found:
+                return found
+        if len(expected) != len(actual):
+            return f"{path}.length", len(expected), len(actual)
+        return None
+    return None if expected == actual else (path, expected, actual)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 요약 골든 출력 비교")
+    parser.add_argument("--update", action="store_true", help="현재 구현의 출력으로 골든 파일을 다시 쓴다")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    from app.inhouse_service import routes
+
+    cases = corpus()
+    if args.update:
+        with open(GOLDEN_PATH, "w", encoding="utf-8") as f:
+            json.dump(_run(routes, cases), f, ensure_ascii=False, indent=1, sort_keys=True)
+            f.write("\n")
+        print(f"wrote {len(cases)} case(s) to {GOLDEN_PATH}")
+        return
+
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        golden = json.load(f)
+
+    engines = [("numpy", getattr(routes, "np", None)), ("python", None)]
+    problems = 0
+    for engine, module in engines:
+        if engine == "numpy" and module is None:
+            print("numpy가 설치되어 있지 않아 순수 파이썬 경로만 확인합니다")
+            continue
+        saved = getattr(routes, "np", None)
+        routes.np = module
+        try:
+            results = _run(routes, cases)
+        finally:
+            routes.np = saved
+        for name, result in results.items():
+            expected = golden.get(name)
+            if expected is None:
+                print(f"  [{engine}] {name}: not in golden file (run with --update)")
+                problems += 1
+                continue
+            if expected["input_sha256"] != result["input_sha256"]:
+                print(f"  [{engine}] {name}: corpus text changed (run with --update if intended)")
+                problems += 1
+                continue
+            found = _first_difference(expected["summary"], result["summary"])
+            if found:
+                path, left, right = found
+                print(f"  [{engine}] {name}: {path}\n      golden: {left!r}\n      actual: {right!r}")
+                problems += 1
+        print(f"{engine}: {len(results)} case(s) compared")
+
+    if problems:
+        print(f"{problems} case(s) differ from {os.path.basename(GOLDEN_PATH)}")
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# app/db.py의 모든 쿼리를 대용량 합성 DB에서 EXPLAIN QUERY PLAN으로 점검한다.
+# 인덱스 없이 테이블 전체를 읽는(SCAN <table>) 쿼리가 있으면 exit code 1로 실패한다.
+#
+# 사용 예) python -m tools.check_query_plans [--tickets 30000 --bookings 30000]
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+
+from app import db
+from tools import synthetic_db
+
+# 의도적으로 전체를 훑는 쿼리만 이유와 함께 허용한다
+ALLOWED_FULL_SCANS = {
+    "fetch_summary": "카운터 테이블은 (category, status) 조합 최대 12행",
+}
+
+_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS \w+)?$")
+# 스키마 카탈로그 조회는 작고 캐시되므로 점검 대상에서 뺀다
+_CATALOG_TABLES = {"sqlite_master", "sqlite_schema"}
+_SUBQUERY = re.compile(r"^(?:MATERIALIZE|CO-ROUTINE) (\w+)")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def _workload() -> list[tuple[str, callable]]:
+    booking = db.fetch_all_bookings()[0]
+    ideas = db.fetch_ideas()
+    idea_id = ideas[0]["id"]
+    log_id = next(item["log_id"] for item in db.fetch_meeting_logs() if item.get("log_id"))
+    day = booking["date"]
+
+    return [
+        ("fetch_tickets", lambda: db.fetch_tickets()),
+        ("fetch_tickets(category)", lambda: db.fetch_tickets(category="IT")),
+        ("fetch_tickets(status)", lambda: db.fetch_tickets(status="PENDING")),
+        ("fetch_tickets(category,status)", lambda: db.fetch_tickets(category="IT", status="PENDING")),
+        ("fetch_tickets(sort=oldest)", lambda: db.fetch_tickets(sort="oldest")),
+        ("fetch_tickets(sort=pending_oldest)", lambda: db.fetch_tickets(sort="pending_oldest")),
+        ("fetch_tickets(sort=urgency)", lambda: db.fetch_tickets(sort="urgency")),
+        ("fetch_tickets_page(sort=pending_oldest)", lambda: _second_page(sort="pending_oldest")),
+        (
+            "fetch_tickets_page(category,sort=urgency)",
+            lambda: _second_page(category="PURCHASE", sort="urgency"),
+        ),
+        (
+            "fetch_tickets_page(status,sort=pending_oldest)",
+            lambda: _second_page(status="PENDING", sort="pending_oldest"),
+        ),
+        ("fetch_tickets(q)", lambda: db.fetch_tickets(q="VPN")),
+        ("fetch_tickets(q,sort=relevance)", lambda: db.fetch_tickets(q="노트북 교체", sort="relevance")),
+        ("fetch_tickets(q,category)", lambda: db.fetch_tickets(category="IT", q="경영지원팀", sort="relevance")),
+        ("fetch_tickets_page", lambda: _second_page()),
+        ("fetch_tickets_page(category,status)", lambda: _second_page(category="IT", status="PENDING")),
+        ("fetch_tickets_page(sort=oldest)", lambda: _second_page(sort="oldest")),
+        ("fetch_summary", db.fetch_summary),
+        ("update_ticket_status", lambda: db.update_ticket_status(1, "APPROVED")),
+        ("fetch_rooms", db.fetch_rooms),
+        ("fetch_bookings", lambda: db.fetch_bookings(day)),
+        ("fetch_all_bookings", db.fetch_all_bookings),
+        ("fetch_bookings_page", lambda: db.fetch_bookings_page(cursor=db.fetch_bookings_page()[1])),
+        ("fetch_bookings_range", lambda: db.fetch_bookings_range(day[:8] + "01", day[:8] + "28")),
+        (
+            "fetch_bookings_range(room_id)",
+            lambda: db.fetch_bookings_range(day[:8] + "01", day[:8] + "28", room_id=booking["room_id"]),
+        ),
+        ("fetch_booking_days", lambda: db.fetch_booking_days(day[:7])),
+        ("has_booking_conflict", lambda: db.has_booking_conflict(booking["room_id"], day, "10:00", "11:00")),
+        ("is_slot_free", lambda: db.is_slot_free(booking["room_id"], day, "10:00", "11:00")),
+        ("book_room", lambda: db.book_room(_booking_payload(booking, "23:00", "23:30"))),
+        (
+            "find_available_rooms",
+            lambda: db.find_available_rooms(day, day, 60, capacity=6, room_type="meeting"),
+        ),
+        ("find_available_rooms(all)", lambda: db.find_available_rooms(day, day, 30)),
+        ("fetch_booking_by_id", lambda: db.fetch_booking_by_id(booking["id"])),
+        ("fetch_meeting_logs", db.fetch_meeting_logs),
+        ("fetch_meeting_logs_page", lambda: _second_log_page()),
+        ("fetch_meeting_logs_page(room)", lambda: _second_log_page(room=booking["room_name"])),
+        ("fetch_meeting_logs_page(author)", lambda: _second_log_page(author=booking["presenter"])),
+        ("fetch_meeting_logs_page(date)", lambda: _second_log_page(date_from=day[:8] + "01", date_to=day)),
+        ("fetch_meeting_log_by_id", lambda: db.fetch_meeting_log_by_id(log_id)),
+        ("fetch_meeting_log_content", lambda: db.fetch_meeting_log_content(log_id)),
+        (
+            "upsert_meeting_log_entry",
+            lambda: db.upsert_meeting_log_entry(booking["id"], "메모", None, None, "요약"),
+        ),
+        ("claim_job", lambda: _claim_and_complete()),
+        ("fetch_job", lambda: db.fetch_job(1)),
+        ("store_cached_transcript", lambda: db.store_cached_transcript("0" * 64, "base", "ko", "전사", max_bytes=1)),
+        ("fetch_cached_transcript", lambda: db.fetch_cached_transcript("0" * 64, "base", "ko")),
+        (
+            "store_cached_summary",
+            lambda: db.store_cached_summary("0" * 64, "models/plan", 1, "local", {}, "요약", max_bytes=1),
+        ),
+        ("fetch_cached_summary", lambda: db.fetch_cached_summary("0" * 64)),
+        ("fetch_club_categories", db.fetch_club_categories),
+        ("fetch_ideas", lambda: db.fetch_ideas()),
+        ("fetch_ideas(status)", lambda: db.fetch_ideas(status="해결 완료")),
+        ("idea_exists", lambda: db.idea_exists(idea_id)),
+        ("upvote_idea", lambda: db.upvote_idea(idea_id, "user_999")),
+        ("add_idea_comment", lambda: db.add_idea_comment(idea_id, "김민수", "확인", 5)),
+        ("delete_idea", lambda: db.delete_idea(ideas[-1]["id"])),
+    ]
+
+
+def _booking_payload(booking: dict, start_time: str, end_time: str) -> dict:
+    return {
+        "room_id": booking["room_id"],
+        "date": booking["date"],
+        "start_time": start_time,
+        "end_time": end_time,
+        "agenda": "플랜 점검",
+        "presenter": "김민수",
+        "participants": [],
+    }
+
+
+def _second_page(**filters) -> None:
+    _, cursor = db.fetch_tickets_page(limit=50, **filters)
+    db.fetch_tickets_page(limit=50, cursor=cursor, **filters)
+
+
+def _second_log_page(**filters) -> None:
+    _, cursor = db.fetch_meeting_logs_page(limit=50, **filters)
+    db.fetch_meeting_logs_page(limit=50, cursor=cursor, **filters)
+
+
+def _claim_and_complete() -> None:
+    db.enqueue_job("plan_check", {})
+    job = db.claim_job("plan-check", kinds=["plan_check"])
+    db.report_job_progress(job["id"], "plan-check", 0.5)
+    db.complete_job(job["id"], "plan-check", {})
+
+
+def _capture(label: str, func, conn, captured: list[tuple[str, str]]) -> None:
+    def trace(statement: str) -> None:
+        head = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+        if head in {"SELECT", "WITH", "UPDATE", "DELETE"}:
+            captured.append((label, statement))
+
+    conn.set_trace_callback(trace)
+    try:
+        func()
+    finally:
+        conn.set_trace_callback(None)
+
+
+def explain(conn, statement: str) -> list[str]:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+    return [row[3] for row in rows]
+
+
+def full_scans(plan: list[str]) -> list[str]:
+    subqueries = {m.group(1) for m in (_SUBQUERY.match(detail) for detail in plan) if m}
+    scans = []
+    for detail in plan:
+        match = _FULL_SCAN.match(detail)
+        if match and match.group(1) not in subqueries and match.group(1) not in _CATALOG_TABLES:
+            scans.append(detail)
+    return scans
+
+
+def run(verbose: bool = False) -> int:
+    conn = db.get_connection()
+    captured: list[tuple[str, str]] = []
+    for label, func in _workload():
+        _capture(label, func, conn, captured)
+
+    failures = 0
+    seen = set()
+    for label, statement in captured:
+        # 리터럴만 다른 같은 모양의 쿼리(N+1 루프 등)는 한 번만 본다
+        key = (label, _LITERAL.sub("?", " ".join(statement.split())))
+        if key in seen:
+            continue
+        seen.add(key)
+
+        plan = explain(conn, statement)
+        scans = full_scans(plan)
+        temp_sort = any("USE TEMP B-TREE" in detail for detail in plan)
+        if scans and label not in ALLOWED_FULL_SCANS:
+            failures += 1
+            status = "FAIL"
+        elif scans:
+            status = "ALLOW"
+        else:
+            status = "OK"
+
+        if verbose or status != "OK":
+            print(f"[{status}] {label}{' (temp b-tree)' if temp_sort else ''}")
+            print("    " + " ".join(statement.split())[:160])
+            for detail in plan:
+                print(f"      - {detail}")
+            if status == "ALLOW":
+                print(f"      > 허용 사유: {ALLOWED_FULL_SCANS[label]}")
+
+    print(f"{len(seen)} statements checked, {failures} unexpected full scan(s)")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="db.py 쿼리 플랜 회귀 점검")
+    parser.add_argument("--tickets", type=int, default=30000)
+    parser.add_argument("--bookings", type=int, default=30000)
+    parser.add_argument("--ideas", type=int, default=2000)
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    synthetic_db.build(tickets=args.tickets, bookings=args.bookings, ideas=args.ideas)
+    sys.exit(run(verbose=args.verbose))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# 로컬 가짜 Gemini REST 서버. generateContent 요청에 회의 요약 JSON을 돌려주며,
+# 지연/오류를 주입해 Gemini 클라이언트의 타임아웃, 재시도, 서킷 브레이커를 점검하는 데 쓴다.
+# 앱을 여기에 붙이려면 INHOUSE_GEMINI_ENDPOINT=http://127.0.0.1:8765 로 띄운다.
+#
+# 사용 예) python -m tools.fake_gemini_server --port 8765 --latency 0.2 --error-rate 0.3
+#          curl -X POST localhost:8765/_control -d '{"latency": 30}'   # 실행 중 동작 변경
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_GENERATE_PATH = re.compile(r"^/v1beta/models/([^/:]+):generateContent")
+
+
+class FakeGeminiState:
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, error_status: int = 503):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.invalid_json = False
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self._rng = random.Random(0)
+
+    def update(self, **values) -> None:
+        with self._lock:
+            for key, value in values.items():
+                if key in ("latency", "jitter", "error_rate", "error_status", "invalid_json"):
+                    setattr(self, key, value)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "latency": self.latency,
+                "jitter": self.jitter,
+                "error_rate": self.error_rate,
+                "error_status": self.error_status,
+                "invalid_json": self.invalid_json,
+                "requests": self.requests,
+                "errors": self.errors,
+            }
+
+    def next_outcome(self) -> tuple[float, int | None]:
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.errors += 1
+                return delay, self.error_status
+            return delay, None
+
+
+def _summary_for(prompt: str) -> dict:
+    meeting = prompt.split("[회의 내용]", 1)[-1].strip()
+    lines = [line.strip() for line in meeting.splitlines() if line.strip()]
+    first = lines[0] if lines else "회의"
+    return {
+        "title": first[:40],
+        "topics": [{"title": "주요 논의", "summary_bullets": lines[:3], "decisions": []}],
+        "action_items": [],
+        "overall_summary": " ".join(lines)[:200],
+    }
+
+
+def _make_handler(state: FakeGeminiState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send_json(self, status: int, body: dict) -> None:
+            payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                # 지연 주입 중에는 클라이언트가 타임아웃으로 먼저 끊는 게 정상이다
+                self.close_connection = True
+
+        def _read_json(self) -> dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            return json.loads(raw or b"{}")
+
+        def do_GET(self):
+            if self.path == "/_stats":
+                self._send_json(200, state.snapshot())
+            else:
+                self._send_json(404, {"error": {"code": 404, "message": "not found", "status": "NOT_FOUND"}})
+
+        def do_POST(self):
+            if self.path == "/_control":
+                state.update(**self._read_json())
+                self._send_json(200, state.snapshot())
+                return
+
+            if not _GENERATE_PATH.match(self.path):
+                self._send_json(404, {"error": {"code": 404, "message": "not found", "status": "NOT_FOUND"}})
+                return
+
+            request_body = self._read_json()
+            delay, error_status = state.next_outcome()
+            if delay:
+                time.sleep(delay)
+            if error_status:
+                self._send_json(
+                    error_status,
+                    {"error": {"code": error_status, "message": "injected failure", "status": "UNAVAILABLE"}},
+                )
+                return
+
+            prompt = "".join(
+                part.get("text", "")
+                for content in request_body.get("contents", [])
+                for part in content.get("parts", [])
+            )
+            text = "{not json" if state.invalid_json else json.dumps(_summary_for(prompt), ensure_ascii=False)
+            self._send_json(
+                200,
+                {
+                    "candidates": [
+                        {
+                            "content": {"parts": [{"text": text}], "role": "model"},
+                            "finishReason": "STOP",
+                            "index": 0,
+                        }
+                    ],
+                    "usageMetadata": {"promptTokenCount": len(prompt) // 4, "candidatesTokenCount": len(text) // 4},
+                },
+            )
+
+    return Handler
+
+
+def start(host: str = "127.0.0.1", port: int = 0, **options) -> tuple[ThreadingHTTPServer, FakeGeminiState]:
+    # 테스트 스크립트에서 백그라운드 스레드로 띄울 때 쓴다. port=0이면 빈 포트를 고른다
+    state = FakeGeminiState(**options)
+    server = ThreadingHTTPServer((host, port), _make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-gemini", daemon=True).start()
+    return server, state
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="지연/오류 주입이 가능한 가짜 Gemini 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연에 더할 ±무작위 폭(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류로 응답할 비율(0~1)")
+    parser.add_argument("--error-status", type=int, default=503)
+    args = parser.parse_args()
+
+    state = FakeGeminiState(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, error_status=args.error_status
+    )
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(state))
+    print(f"fake Gemini listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
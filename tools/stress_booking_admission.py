@@ -0,0 +1,157 @@
+# 여러 스레드(와 프로세스)가 같은 회의실/날짜에 겹치는 예약을 동시에 넣어
+# 이중 예약이 생기지 않는지 확인한다. 프로세스 안의 예약 구간 캐시를 켠 경우와 끈 경우를 각각 새 DB에서 돌려
+# 캐시 없이도 BEGIN IMMEDIATE 트랜잭션만으로 겹침이 막히는지 본다. 캐시가 모르는 사이 비워진 자리를
+# 거절하지 않는지도 확인한다. 겹치는 예약이 하나라도 있거나 비워진 자리를 거절하면 exit code 1.
+#
+# 사용 예) python -m tools.stress_booking_admission --threads 16 --attempts 200 --processes 2
+#          python -m tools.stress_booking_admission --index off
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from app import db
+from tools import synthetic_db
+
+_DAY = "2025-06-02"
+
+
+def _attempts(worker: int, attempts: int, room_ids: list[int], seed: int) -> tuple[int, int]:
+    rng = random.Random(seed * 1000 + worker)
+    accepted = rejected = 0
+    for i in range(attempts):
+        start = rng.randrange(9 * 60, 18 * 60, 15)
+        end = start + rng.choice([15, 30, 60, 90])
+        booking_id = db.book_room(
+            {
+                "room_id": rng.choice(room_ids),
+                "date": _DAY,
+                "start_time": f"{start // 60:02d}:{start % 60:02d}",
+                "end_time": f"{end // 60:02d}:{end % 60:02d}",
+                "agenda": f"stress {worker}-{i}",
+                "presenter": "김민수",
+                "participants": ["이서연"],
+            }
+        )
+        if booking_id is None:
+            rejected += 1
+        else:
+            accepted += 1
+    return accepted, rejected
+
+
+def _run_threads(
+    path: str, threads: int, attempts: int, room_ids: list[int], seed: int, use_index: bool
+) -> tuple[int, int]:
+    db.DB_PATH = path
+    db.BOOKING_INTERVAL_INDEX_ENABLED = use_index
+    results: list[tuple[int, int]] = []
+    lock = threading.Lock()
+
+    def work(worker: int) -> None:
+        outcome = _attempts(worker, attempts, room_ids, seed)
+        with lock:
+            results.append(outcome)
+
+    workers = [threading.Thread(target=work, args=(seed * 100 + n,)) for n in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sum(a for a, _ in results), sum(r for _, r in results)
+
+
+def _process_entry(args: tuple) -> tuple[int, int]:
+    return _run_threads(*args)
+
+
+def overlapping_pairs() -> int:
+    with db.get_connection() as conn:
+        row = conn.execute(
+            """
+            SELECT COUNT(*) AS count
+            FROM bookings a
+            JOIN bookings b
+              ON b.room_id = a.room_id
+             AND b.date = a.date
+             AND b.id > a.id
+             AND b.start_min < a.end_min
+             AND b.end_min > a.start_min
+            """
+        ).fetchone()
+    return row["count"]
+
+
+def _freed_slot_accepted(room_id: int) -> bool:
+    # 캐시에 예약이 올라간 뒤 다른 프로세스가 지운 것처럼 DB에서 직접 지우고 같은 자리를 다시 예약한다
+    payload = {
+        "room_id": room_id,
+        "date": "2025-06-03",
+        "start_time": "10:00",
+        "end_time": "11:00",
+        "agenda": "freed slot",
+        "presenter": "김민수",
+        "participants": [],
+    }
+    booking_id = db.book_room(payload)
+    db.is_slot_free(room_id, payload["date"], payload["start_time"], payload["end_time"])
+    with db.get_connection() as conn:
+        conn.execute("DELETE FROM meeting_participants WHERE booking_id = ?", (booking_id,))
+        conn.execute("DELETE FROM bookings WHERE id = ?", (booking_id,))
+        conn.commit()
+    return db.book_room(payload) is not None
+
+
+def _run(args, use_index: bool) -> bool:
+    path = os.path.join(tempfile.mkdtemp(prefix="inhouse-stress-"), "service_desk.db")
+    synthetic_db.use_database(path)
+    db.BOOKING_INTERVAL_INDEX_ENABLED = use_index
+    room_ids = [room["id"] for room in db.fetch_rooms()][: args.rooms]
+
+    started = time.perf_counter()
+    if args.processes > 1:
+        jobs = [(path, args.threads, args.attempts, room_ids, seed, use_index) for seed in range(args.processes)]
+        with multiprocessing.get_context("spawn").Pool(args.processes) as pool:
+            outcomes = pool.map(_process_entry, jobs)
+    else:
+        outcomes = [_run_threads(path, args.threads, args.attempts, room_ids, 0, use_index)]
+    elapsed = time.perf_counter() - started
+
+    accepted = sum(a for a, _ in outcomes)
+    rejected = sum(r for _, r in outcomes)
+    total = accepted + rejected
+    overlaps = overlapping_pairs()
+    freed = _freed_slot_accepted(room_ids[0])
+    print(
+        f"index {'on' if use_index else 'off'}: {total} attempts in {elapsed:.2f}s ({total / elapsed:.0f}/s): "
+        f"{accepted} accepted, {rejected} rejected, {overlaps} overlapping pair(s), "
+        f"freed slot {'accepted' if freed else 'REJECTED'}"
+    )
+    return not overlaps and freed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="예약 동시성 스트레스 테스트")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--attempts", type=int, default=200)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--rooms", type=int, default=3)
+    parser.add_argument(
+        "--index", choices=["on", "off", "both"], default="both", help="프로세스 안 예약 구간 캐시 사용 여부"
+    )
+    args = parser.parse_args()
+
+    modes = {"on": [True], "off": [False], "both": [False, True]}[args.index]
+    results = [_run(args, use_index) for use_index in modes]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
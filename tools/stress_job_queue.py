@@ -0,0 +1,128 @@
+# 여러 워커 프로세스가 같은 작업 큐를 동시에 비울 때 작업이 중복 실행되거나 유실되지 않는지 확인한다.
+# 일부 작업은 일부러 실패시켜 백오프 재시도 경로도 함께 돈다. progress를 부르지 않고 임대 시간보다
+# 오래 걸리는 작업도 섞어서, 실행 중 임대 연장이 없으면 다른 워커가 같은 작업을 다시 가져가는지 본다.
+# 이상이 있으면 exit code 1.
+#
+# 사용 예) python -m tools.stress_job_queue --jobs 500 --processes 4 --threads 4
+#          python -m tools.stress_job_queue --slow-jobs 8 --lease-seconds 1
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+from app import db, jobs
+from tools import synthetic_db
+
+
+@jobs.job_handler("stress")
+def _stress_job(payload, ctx):
+    ctx.progress(0.5, "working")
+    with db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO stress_runs (job_id, attempt, worker) VALUES (?, ?, ?)",
+            (ctx.job_id, ctx.attempt, ctx.worker_id),
+        )
+        conn.commit()
+    if payload["fail_first"] and ctx.attempt == 1:
+        raise RuntimeError("transient failure")
+    return {"n": payload["n"]}
+
+
+@jobs.job_handler("stress_slow")
+def _slow_stress_job(payload, ctx):
+    # progress 없이 임대 시간의 여러 배를 쓴다. 임대가 연장되지 않으면 다른 워커가 동시에 실행하게 된다
+    with db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO stress_runs (job_id, attempt, worker) VALUES (?, ?, ?)",
+            (ctx.job_id, ctx.attempt, ctx.worker_id),
+        )
+        conn.commit()
+    time.sleep(payload["seconds"])
+    return {"n": payload["n"]}
+
+
+def _drain(path: str, threads: int, deadline: float) -> None:
+    db.DB_PATH = path
+    db.JOB_RETRY_BASE_SECONDS = 0.05
+    pool = jobs.JobWorkerPool(size=threads, poll_interval=0.05, kinds=["stress", "stress_slow"]).start()
+    while time.time() < deadline:
+        with db.get_connection() as conn:
+            pending = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE kind IN ('stress', 'stress_slow') AND status IN ('queued', 'running')"
+            ).fetchone()[0]
+        if not pending:
+            break
+        time.sleep(0.1)
+    pool.stop(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="작업 큐 동시성 스트레스 테스트")
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--slow-jobs", type=int, default=4, help="임대 시간보다 오래 걸리는 작업 수")
+    parser.add_argument(
+        "--lease-seconds", type=float, default=1.0, help="작업 임대 시간(짧게 잡아야 느린 작업이 임대를 넘긴다)"
+    )
+    args = parser.parse_args()
+    # 임대 시간은 app.db를 import할 때 읽는다. 워커 프로세스(spawn)는 이 환경 변수를 물려받아 새로 import한다
+    os.environ["INHOUSE_JOB_LEASE_SECONDS"] = str(args.lease_seconds)
+
+    path = os.path.join(tempfile.mkdtemp(prefix="inhouse-jobs-"), "service_desk.db")
+    synthetic_db.use_database(path)
+    with db.get_connection() as conn:
+        conn.execute("CREATE TABLE stress_runs (job_id INTEGER, attempt INTEGER, worker TEXT)")
+        conn.commit()
+    for n in range(args.jobs):
+        db.enqueue_job("stress", {"n": n, "fail_first": n % 10 == 0})
+    slow_ids = [
+        db.enqueue_job("stress_slow", {"n": n, "seconds": args.lease_seconds * 2.5}) for n in range(args.slow_jobs)
+    ]
+
+    started = time.perf_counter()
+    deadline = time.time() + args.timeout
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_drain, args=(path, args.threads, deadline)) for _ in range(args.processes)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+
+    with db.get_connection() as conn:
+        statuses = dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        duplicates = conn.execute(
+            "SELECT COUNT(*) FROM (SELECT job_id, attempt FROM stress_runs GROUP BY job_id, attempt HAVING COUNT(*) > 1)"
+        ).fetchone()[0]
+        retried = conn.execute("SELECT COUNT(*) FROM jobs WHERE attempts > 1").fetchone()[0]
+        workers_seen = {row[0].rsplit(":", 1)[0] for row in conn.execute("SELECT DISTINCT worker FROM stress_runs")}
+        # 느린 작업은 실패하지 않으므로 정확히 한 번만 실행되어야 한다
+        slow_reruns = conn.execute(
+            """
+            SELECT COUNT(*) FROM (
+                SELECT job_id FROM stress_runs WHERE job_id IN (SELECT value FROM json_each(?))
+                GROUP BY job_id HAVING COUNT(*) > 1
+            )
+            """,
+            (json.dumps(slow_ids),),
+        ).fetchone()[0]
+
+    succeeded = statuses.get("succeeded", 0)
+    print(
+        f"{args.jobs + args.slow_jobs} jobs in {elapsed:.2f}s: {statuses}, {retried} retried, "
+        f"{duplicates} duplicate execution(s), {slow_reruns} slow job(s) re-run after lease expiry, "
+        f"{len(workers_seen)} worker process(es) took part"
+    )
+    sys.exit(0 if succeeded == args.jobs + args.slow_jobs and not duplicates and not slow_reruns else 1)
+
+
+if __name__ == "__main__":
+    main()
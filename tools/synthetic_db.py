@@ -0,0 +1,222 @@
+# 성능 점검용 대용량 합성 DB 생성기
+#
+# 사용 예) python -m tools.synthetic_db --tickets 50000 --bookings 50000 /tmp/bench.db
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+from app import db
+from app.fixtures.seed_data import USERS
+
+_TITLES = [
+    "노트북 교체 요청",
+    "VPN 접속 오류",
+    "회의실 프로젝터 고장",
+    "모니터 추가 구매",
+    "출입카드 재발급",
+    "Jira 권한 요청",
+    "사무용 의자 교체",
+    "AWS 계정 생성",
+]
+_AGENDAS = ["주간 스탠드업", "스프린트 회고", "고객 미팅", "채용 인터뷰", "모델 리뷰", "1:1"]
+
+
+def use_database(path: str) -> str:
+    # app.db가 이 경로를 쓰도록 전환하고 스키마를 최신으로 만든다
+    db.DB_PATH = path
+    db.init_db()
+    return path
+
+
+def populate(
+    tickets: int = 30000,
+    bookings: int = 30000,
+    ideas: int = 2000,
+    days: int = 365,
+    seed: int = 7,
+) -> dict:
+    rng = random.Random(seed)
+    base = datetime(2025, 1, 1, 9, 0, 0)
+    categories = list(db.CATEGORY_TO_TEAM)
+
+    with db.get_connection() as conn:
+        ticket_rows = []
+        for i in range(tickets):
+            created = base + timedelta(minutes=rng.randrange(days * 24 * 60))
+            updated = created + timedelta(minutes=rng.randrange(14 * 24 * 60))
+            category = rng.choice(categories)
+            user = rng.choice(USERS)
+            urgency = rng.choice(db.URGENCY_OPTIONS)
+            created_at = created.isoformat(timespec="seconds")
+            updated_at = updated.isoformat(timespec="seconds")
+            ticket_rows.append(
+                {
+                    "category": category,
+                    "owner_team": db.CATEGORY_TO_TEAM[category],
+                    "title": f"{rng.choice(_TITLES)} #{i}",
+                    "description": f"{user.team} {user.name} 요청 상세 설명 {i} " * rng.randint(1, 4),
+                    "requester": user.name,
+                    "requester_user_id": user.id,
+                    "status": rng.choice(db.STATUS_OPTIONS),
+                    "urgency": urgency,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                    **db.ticket_sort_columns(created_at, updated_at, urgency),
+                }
+            )
+        conn.executemany(
+            """
+            INSERT INTO service_desk_tickets (
+                category, owner_team, title, description, requester, requester_user_id,
+                status, urgency, created_at, updated_at, created_ts, updated_ts, age_seconds, urgency_rank
+            ) VALUES (
+                :category, :owner_team, :title, :description, :requester, :requester_user_id,
+                :status, :urgency, :created_at, :updated_at, :created_ts, :updated_ts, :age_seconds, :urgency_rank
+            )
+            """,
+            ticket_rows,
+        )
+
+        room_ids = [row["id"] for row in conn.execute("SELECT id FROM rooms").fetchall()]
+        booking_rows = []
+        for i in range(bookings):
+            day = (base + timedelta(days=rng.randrange(days))).strftime("%Y-%m-%d")
+            start = rng.randrange(8 * 60, 19 * 60, 15)
+            end = min(start + rng.choice([30, 60, 90, 120]), 24 * 60 - 1)
+            booking_rows.append(
+                {
+                    "room_id": rng.choice(room_ids),
+                    "date": day,
+                    "start_time": f"{start // 60:02d}:{start % 60:02d}",
+                    "end_time": f"{end // 60:02d}:{end % 60:02d}",
+                    "start_min": start,
+                    "end_min": end,
+                    "agenda": f"{rng.choice(_AGENDAS)} {i}",
+                    "presenter": rng.choice(USERS).name,
+                    "created_at": base.isoformat(timespec="seconds"),
+                    "updated_at": base.isoformat(timespec="seconds"),
+                }
+            )
+        conn.executemany(
+            """
+            INSERT INTO bookings (
+                room_id, date, start_time, end_time, start_min, end_min, agenda, presenter, created_at, updated_at
+            ) VALUES (
+                :room_id, :date, :start_time, :end_time, :start_min, :end_min, :agenda, :presenter, :created_at, :updated_at
+            )
+            """,
+            booking_rows,
+        )
+        booking_ids = [row["id"] for row in conn.execute("SELECT id FROM bookings").fetchall()]
+        conn.executemany(
+            "INSERT INTO meeting_participants (booking_id, participant_name) VALUES (?, ?)",
+            [
+                (booking_id, user.name)
+                for booking_id in booking_ids
+                for user in rng.sample(USERS, rng.randint(1, 4))
+            ],
+        )
+        now = datetime.now().isoformat(timespec="seconds")
+        conn.executemany(
+            """
+            INSERT INTO meeting_logs (booking_id, notes, transcript, summary, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (booking_id, f"회의 메모 {booking_id}", None, f"요약 {booking_id}", now, now)
+                for booking_id in booking_ids
+                if rng.random() < 0.3
+            ],
+        )
+        room_names = [row["name"] for row in conn.execute("SELECT name FROM rooms").fetchall()]
+        direct_logs = []
+        for i in range(bookings // 10):
+            day = (base + timedelta(days=rng.randrange(days))).strftime("%Y-%m-%d")
+            start = rng.randrange(8 * 60, 19 * 60, 15)
+            direct_logs.append(
+                (
+                    f"회의 메모 direct-{i}",
+                    f"요약 direct-{i}",
+                    f"{rng.choice(_AGENDAS)} direct-{i}",
+                    rng.choice(USERS).name,
+                    day,
+                    f"{start // 60:02d}:{start % 60:02d}",
+                    f"{(start + 60) // 60:02d}:{start % 60:02d}",
+                    rng.choice(room_names),
+                    now,
+                    now,
+                )
+            )
+        conn.executemany(
+            """
+            INSERT INTO meeting_logs (
+                booking_id, notes, summary, title, author, meeting_date, start_time, end_time, room_name,
+                created_at, updated_at
+            ) VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            direct_logs,
+        )
+
+        for i in range(ideas):
+            created = (base + timedelta(minutes=rng.randrange(days * 24 * 60))).isoformat(timespec="seconds")
+            author = rng.choice(USERS)
+            status = rng.choice(db.IDEA_STATUS_OPTIONS)
+            idea_id = conn.execute(
+                """
+                INSERT INTO ideas (title, content, category, author, author_user_id, status, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (f"아이디어 {i}", f"제안 내용 {i}", "업무", author.name, author.id, status, created),
+            ).lastrowid
+            conn.execute(
+                "INSERT INTO idea_timeline (idea_id, status, message, created_at) VALUES (?, ?, ?, ?)",
+                (idea_id, "접수 완료", "아이디어가 접수되었습니다.", created),
+            )
+            for voter in rng.sample(USERS, rng.randint(0, len(USERS))):
+                conn.execute(
+                    "INSERT OR IGNORE INTO idea_upvotes (idea_id, user_id, created_at) VALUES (?, ?, ?)",
+                    (idea_id, voter.id, created),
+                )
+            for _ in range(rng.randint(0, 3)):
+                commenter = rng.choice(USERS)
+                conn.execute(
+                    """
+                    INSERT INTO idea_comments (idea_id, author, author_user_id, comment, rating, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (idea_id, commenter.name, commenter.id, "좋은 제안입니다", rng.randint(1, 5), created),
+                )
+        conn.commit()
+
+    # 예약을 직접 INSERT했으므로 점유 비트맵은 한 번에 다시 만든다
+    db.verify_room_occupancy(rebuild=True)
+    return {"tickets": tickets, "bookings": len(booking_ids), "ideas": ideas}
+
+
+def build(path: str | None = None, **sizes) -> str:
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="inhouse-bench-"), "service_desk.db")
+    use_database(path)
+    populate(**sizes)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="대용량 합성 service_desk.db 생성")
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--tickets", type=int, default=30000)
+    parser.add_argument("--bookings", type=int, default=30000)
+    parser.add_argument("--ideas", type=int, default=2000)
+    args = parser.parse_args()
+
+    path = build(args.path, tickets=args.tickets, bookings=args.bookings, ideas=args.ideas)
+    print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# 로컬 요약(회의록 대체 경로) 점검/벤치마크용 합성 회의 텍스트 생성기.
+# 같은 seed면 항상 같은 텍스트가 나온다. 한국어/영어 문장, 섹션 마커(목표/범위/결정/실행/리스크),
+# 담당자·기한이 붙은 실행 항목, 결정 문장, 줄바꿈만 있는 STT 조각, 반복 문장을 섞는다.
+#
+# 사용 예) python -m tools.synthetic_meetings --chars 20000 --sections --action-density 0.1
+
+from __future__ import annotations
+
+import argparse
+import random
+
+_PEOPLE = ["김민수", "이지은", "박서준", "최유나", "정하늘", "Alex", "Jamie"]
+# 섹션 모드가 아닐 때 일반 문장이 우연히 마커로 읽히지 않도록 주제어에는 마커 단어(리스크 등)를 넣지 않는다
+_TOPICS = [
+    "예산", "일정", "배포", "검토", "품질", "고객", "데모", "서버", "테스트", "문서",
+    "디자인", "채용", "보안", "지표", "계약", "온보딩", "마이그레이션", "대시보드",
+]
+_ENGLISH_TOPICS = ["release", "budget", "roadmap", "latency", "backlog", "onboarding", "api", "metrics"]
+_KOREAN_TAILS = [
+    "{a} 관련해서 {b} 쪽 의견을 먼저 들어봤습니다.",
+    "{a} 진행 상황은 지난주 대비 조금 늦어지고 있습니다.",
+    "{a}와 {b}를 같이 보면서 우선순위를 다시 맞춰야 합니다.",
+    "{a} 이슈는 {b} 팀과 한 번 더 확인이 필요합니다.",
+    "{a} 수치가 {n}% 정도 개선됐다는 보고가 있었습니다.",
+    "{a} 때문에 {b} 일정이 밀릴 수 있다는 우려가 나왔습니다.",
+    "그리고 {a} 부분은 다음 회의에서 다시 논의하기로 했습니다",
+    "{a} {b} {c} 이야기가 길게 이어졌습니다",
+]
+_ENGLISH_TAILS = [
+    "We reviewed the {a} numbers and the {b} plan.",
+    "The {a} work is blocked on the {b} review!",
+    "Should we move the {a} milestone before the {b} freeze?",
+    "{a} and {b} need a clear owner this sprint.",
+]
+_DECISIONS = [
+    "{a} 일정은 다음 주 {d}로 확정했습니다.",
+    "{a}는 {b} 방식으로 진행하기로 결정했습니다.",
+    "{a} 예산안은 원안대로 승인됐습니다.",
+    "We agreed to adopt the new {e} process.",
+]
+_ACTIONS = [
+    "{p}는 {a} 자료를 {due}까지 정리해서 공유하겠습니다.",
+    "{p}가 {a} 환경 세팅을 {due}까지 준비합니다.",
+    "담당: {p} / 할 일: {a} 테스트 케이스 작성 / 기한: {due}",
+    "할 일: {a} 배포 체크리스트 점검, 담당자: {p}",
+    "{a} 문서는 {p} 님이 {due}까지 업데이트하기로 했습니다.",
+    "TODO: {e} dashboard 추가 (due: {due})",
+]
+_DUES = ["금요일", "다음 주 수요일", "3월 14일", "2025-04-02", "4/18", "내일", "이번 주 목요일"]
+_SECTION_MARKERS = {
+    "목표": ["이번 회의 목표를 정리합니다.", "목표는 다음과 같습니다."],
+    "범위": ["핵심 범위입니다.", "이번 스코프를 정리합니다."],
+    "결정": ["결정된 사항입니다.", "결정 사항을 정리합니다."],
+    "실행": ["실행 항목입니다.", "할 일을 정리합니다."],
+    "리스크": ["리스크입니다.", "위험 요소를 정리합니다."],
+}
+
+
+def _fill(template: str, rng: random.Random) -> str:
+    a, b, c = rng.sample(_TOPICS, 3)
+    return template.format(
+        a=a,
+        b=b,
+        c=c,
+        d=rng.choice(["월요일", "화요일", "목요일"]),
+        e=rng.choice(_ENGLISH_TOPICS),
+        n=rng.randint(3, 40),
+        p=rng.choice(_PEOPLE),
+        due=rng.choice(_DUES),
+    )
+
+
+def _sentence(rng: random.Random, action_density: float, decision_density: float, english_ratio: float) -> str:
+    roll = rng.random()
+    if roll < action_density:
+        return _fill(rng.choice(_ACTIONS), rng)
+    if roll < action_density + decision_density:
+        return _fill(rng.choice(_DECISIONS), rng)
+    if rng.random() < english_ratio:
+        return _fill(rng.choice(_ENGLISH_TAILS), rng)
+    return _fill(rng.choice(_KOREAN_TAILS), rng)
+
+
+def synthetic_meeting(
+    chars: int,
+    seed: int = 0,
+    sections: bool = False,
+    action_density: float = 0.05,
+    decision_density: float = 0.03,
+    english_ratio: float = 0.15,
+    repeat_ratio: float = 0.02,
+) -> str:
+    rng = random.Random(seed)
+    lines = [f"회의: {rng.choice(_TOPICS)} {rng.choice(['주간 점검', '킥오프', '회고', '리뷰'])}"]
+    length = len(lines[0])
+    section_names = list(_SECTION_MARKERS)
+    sentences_in_section = rng.randint(4, 12)
+    emitted: list[str] = []
+    paragraph: list[str] = []
+
+    while length < chars:
+        if sections and sentences_in_section == 0:
+            if paragraph:
+                lines.append(" ".join(paragraph))
+                paragraph = []
+            name = section_names[rng.randrange(len(section_names))]
+            lines.append(rng.choice(_SECTION_MARKERS[name]))
+            sentences_in_section = rng.randint(3, 12)
+        if emitted and rng.random() < repeat_ratio:
+            sentence = rng.choice(emitted)
+        else:
+            sentence = _sentence(rng, action_density, decision_density, english_ratio)
+            emitted.append(sentence)
+        paragraph.append(sentence)
+        length += len(sentence) + 1
+        sentences_in_section -= 1
+        # STT 결과처럼 문단 길이가 들쭉날쭉하도록 가끔 줄을 바꾼다
+        if rng.random() < 0.2:
+            lines.append(" ".join(paragraph))
+            paragraph = []
+
+    if paragraph:
+        lines.append(" ".join(paragraph))
+    return "\n".join(lines)[:chars]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="합성 회의 텍스트 생성기")
+    parser.add_argument("--chars", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sections", action="store_true", help="목표/결정 같은 섹션 마커를 넣는다")
+    parser.add_argument("--action-density", type=float, default=0.05)
+    parser.add_argument("--english-ratio", type=float, default=0.15)
+    args = parser.parse_args()
+    print(
+        synthetic_meeting(
+            args.chars,
+            seed=args.seed,
+            sections=args.sections,
+            action_density=args.action_density,
+            english_ratio=args.english_ratio,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()